@@ -0,0 +1,12 @@
+from __future__ import unicode_literals
+
+from django.apps import AppConfig
+
+
+class ApiBooksConfig(AppConfig):
+    name = 'api_books'
+    verbose_name = 'Library API books'
+
+    def ready(self):
+        # Connect the signal receivers.
+        from api_books import cache, search, signals  # noqa
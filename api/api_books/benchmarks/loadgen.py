@@ -0,0 +1,155 @@
+from __future__ import unicode_literals
+
+import socket
+import threading
+import time
+from collections import Counter
+
+from django.utils.six.moves import http_client
+
+
+def percentile(values, fraction):
+    """
+    Returns the value below which `fraction` of the sorted values fall.
+    """
+    if not values:
+        return None
+    index = min(int(round(fraction * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+class LoadResult(object):
+
+    def __init__(self, latencies, statuses, errors, elapsed):
+        self.latencies = sorted(latencies)
+        self.statuses = statuses
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def requests(self):
+        return len(self.latencies)
+
+    @property
+    def throughput(self):
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile_ms(self, fraction):
+        value = percentile(self.latencies, fraction)
+        return None if value is None else value * 1000
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'statuses': dict(self.statuses),
+            'throughput': round(self.throughput, 1),
+            'p50_ms': self.percentile_ms(0.50),
+            'p95_ms': self.percentile_ms(0.95),
+            'p99_ms': self.percentile_ms(0.99),
+        }
+
+
+def run_load(host, port, requests, concurrency, duration, timeout=30):
+    """
+    Sends requests from `concurrency` threads, each with a keep-alive
+    connection, for `duration` seconds. Each thread cycles through
+    `requests`, a list of (method, path, body, headers) tuples, or calls
+    `requests` with a number no other call gets, e.g. to create unique rows.
+
+    Returns a LoadResult with the latency of every completed request. Failed
+    connections and 5xx responses count as errors.
+    """
+    latencies = []
+    statuses = Counter()
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.time() + duration
+
+    def worker(offset):
+        connection = http_client.HTTPConnection(host, port, timeout=timeout)
+        local_latencies = []
+        local_statuses = Counter()
+        local_errors = 0
+        index = offset
+        while time.time() < deadline:
+            if callable(requests):
+                method, path, body, headers = requests(index)
+                index += concurrency
+            else:
+                method, path, body, headers = requests[index % len(requests)]
+                index += 1
+            start = time.time()
+            try:
+                connection.request(method, path, body, headers or {})
+                response = connection.getresponse()
+                response.read()
+            except (socket.error, http_client.HTTPException):
+                local_errors += 1
+                connection.close()
+                continue
+            local_latencies.append(time.time() - start)
+            local_statuses[response.status] += 1
+            if response.status >= 500:
+                local_errors += 1
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            statuses.update(local_statuses)
+            errors[0] += local_errors
+
+    start = time.time()
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return LoadResult(latencies, statuses, errors[0], time.time() - start)
+
+
+class SlowClients(object):
+    """
+    Opens `count` connections that each send a request one byte every
+    `interval` seconds, like clients on slow networks, until stopped.
+    """
+
+    def __init__(self, host, port, count, path='/api/v1/books', interval=0.5):
+        self.host = host
+        self.port = port
+        self.count = count
+        self.request = ('GET %s HTTP/1.1\r\nHost: %s\r\n\r\n' % (path, host)).encode('ascii')
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.threads = []
+
+    def __enter__(self):
+        for _ in range(self.count):
+            thread = threading.Thread(target=self.trickle)
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        for thread in self.threads:
+            thread.join()
+
+    def trickle(self):
+        while not self.stopped.is_set():
+            try:
+                connection = socket.create_connection((self.host, self.port), timeout=5)
+            except socket.error:
+                self.stopped.wait(self.interval)
+                continue
+            try:
+                for index in range(len(self.request)):
+                    if self.stopped.wait(self.interval):
+                        break
+                    connection.sendall(self.request[index:index + 1])
+                else:
+                    connection.recv(65536)
+            except socket.error:
+                pass
+            finally:
+                connection.close()
@@ -0,0 +1,80 @@
+from __future__ import unicode_literals
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+
+def tree_rss_kb(pid):
+    """
+    Returns the resident memory in kB of a process and all its descendants,
+    or None where /proc is not available.
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/%s/stat' % entry) as f:
+                # The command name may contain spaces, so split after it.
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (IOError, OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open('/proc/%d/status' % current) as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1])
+        except (IOError, OSError):
+            continue
+    return total
+
+
+def wait_for_port(host, port, process, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise CommandError('The server exited with status %d.' % process.returncode)
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except socket.error:
+            time.sleep(0.2)
+    raise CommandError('The server did not listen on port %d within %d seconds.' % (port, timeout))
+
+
+@contextmanager
+def gunicorn(application, port, workers, worker_class='sync', host='127.0.0.1'):
+    """
+    Runs gunicorn with the current settings module and yields its process
+    once it listens, stopping it on exit.
+    """
+    devnull = open(os.devnull, 'w')
+    # The server imports the settings module from the project directory,
+    # the parent of config/. gunicorn 19 cannot be run with -m.
+    process = subprocess.Popen([
+        sys.executable, '-c', 'from gunicorn.app.wsgiapp import run; run()', application,
+        '--worker-class', worker_class, '--workers', str(workers),
+        '--bind', '%s:%d' % (host, port),
+    ], cwd=os.path.dirname(settings.BASE_DIR), stdout=devnull, stderr=subprocess.STDOUT)
+    try:
+        wait_for_port(host, port, process)
+        yield process
+    finally:
+        process.terminate()
+        process.wait()
+        devnull.close()
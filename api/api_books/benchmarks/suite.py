@@ -0,0 +1,219 @@
+from __future__ import unicode_literals
+
+import itertools
+import json
+import time
+from collections import OrderedDict
+
+from django.core.urlresolvers import reverse
+from django.db.models import Max, Min
+from django.utils.six.moves.urllib.parse import urlencode
+
+from api_books.bulk import bulk_create
+from api_books.counts import add_book_counts, recount_books
+from api_books.models import Author, Book
+
+
+READ_HEADERS = {'Accept': 'application/json'}
+WRITE_HEADERS = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+# Rows each scenario spreads its requests over.
+SAMPLE_SIZE = 200
+
+# Books created, updated or deleted by each request to the bulk endpoint.
+BULK_SIZE = 50
+
+# Books of each author the author-delete scenario deletes.
+DELETED_AUTHOR_BOOKS = 10
+
+# Most recently updated books each export request streams, with the books of
+# a tenth as many recently updated authors.
+EXPORT_SIZE = 1000
+
+# First name of the authors and start of the titles of the books the write
+# scenarios create, which delete_created() deletes.
+CREATED_PREFIX = 'Benchmark'
+
+
+def spread_rows(model, fields, count=SAMPLE_SIZE):
+    """
+    Returns the values of up to count rows spread evenly over the ids of
+    model, so that runs on the same dataset read the same rows.
+    """
+    bounds = model.objects.aggregate(low=Min('id'), high=Max('id'))
+    if bounds['low'] is None:
+        return []
+    step = max((bounds['high'] - bounds['low']) // count, 1)
+    ids = list(range(bounds['low'], bounds['high'] + 1, step))[:count]
+    return list(model.objects.filter(id__in=ids).order_by('id').values(*fields))
+
+
+def export_watermark(size=EXPORT_SIZE):
+    """
+    Returns the updated__gt after which about `size` books, or their
+    authors, changed, or None when the catalog is not larger than that.
+    """
+    watermarks = [
+        model.objects.order_by('-updated').values_list('updated', flat=True)[count - 1:count]
+        for model, count in ((Book, size), (Author, max(size // 10, 1)))
+    ]
+    watermarks = [value for rows in watermarks for value in rows]
+    if len(watermarks) < 2:
+        return None
+    return max(watermarks).isoformat()
+
+
+def get_scenarios():
+    """
+    Returns the requests of each endpoint of api_books.urls, by scenario
+    name, as callables taking the unique number run_load() passes them.
+
+    Reads come first, so that they see the dataset as seeded. Writes create
+    rows with ISBNs made unique by a counter and the time of the run, to be
+    deleted with delete_created(), and update the sampled rows in place.
+    Deletes first create the rows they delete, before the request is timed.
+    """
+    authors = spread_rows(Author, ['id', 'first_name', 'last_name'])
+    books = spread_rows(Book, ['id', 'title', 'author_id', 'isbn', 'published'])
+    if not authors or not books:
+        raise ValueError('The catalog needs books and authors to benchmark.')
+    run = int(time.time()) % 10 ** 6
+    # Shared by the threads of run_load(), and by the warm-up and measured
+    # runs of every scenario, which pass the same numbers.
+    isbns = itertools.count()
+    since = export_watermark()
+    export = {'updated__gt': since} if since else {}
+
+    def isbn():
+        # Seeded ISBNs start with zeros.
+        return '9%06d%06d' % (run, next(isbns) % 10 ** 6)
+
+    def read(path):
+        return 'GET', path, None, READ_HEADERS
+
+    def write(method, path, data):
+        return method, path, json.dumps(data).encode('utf-8'), WRITE_HEADERS
+
+    def delete(path):
+        return 'DELETE', path, None, READ_HEADERS
+
+    def book_data(number, author):
+        return {
+            'title': '%s %d' % (CREATED_PREFIX, number),
+            'author': author,
+            'isbn': isbn(),
+            'published': '2016-11-13',
+        }
+
+    def pick(rows, number):
+        return rows[number % len(rows)]
+
+    def create_books(number, author_id, count=1):
+        """
+        Creates count books of the author, counted on them as the API
+        would, and returns their ids.
+        """
+        isbns = [isbn() for _ in range(count)]
+        bulk_create(Book.objects.all(), [
+            Book(title='%s %d' % (CREATED_PREFIX, number), author_id=author_id, isbn=value,
+                 published='2016-11-13')
+            for value in isbns
+        ])
+        add_book_counts({author_id: count})
+        return list(Book.objects.filter(isbn__in=isbns).values_list('id', flat=True))
+
+    def create_author(number):
+        author = Author.objects.create(first_name=CREATED_PREFIX, last_name='Author %d' % number)
+        create_books(number, author.id, DELETED_AUTHOR_BOOKS)
+        return author.id
+
+    return OrderedDict([
+        ('author-list', lambda number: read(reverse('author-list'))),
+        ('author-detail', lambda number: read(reverse('author-detail', args=[pick(authors, number)['id']]))),
+        ('author-books', lambda number: read(reverse('author-books', args=[pick(books, number)['author_id']]))),
+        ('book-list', lambda number: read(reverse('book-list'))),
+        ('book-list-filtered', lambda number: read('%s?%s' % (reverse('book-list'), urlencode({
+            'published__gte': pick(books, number)['published'].isoformat(), 'ordering': 'published',
+        })))),
+        ('book-detail', lambda number: read(reverse('book-detail', args=[pick(books, number)['id']]))),
+        ('book-export', lambda number: read('%s?%s' % (reverse('book-export'), urlencode(export)))),
+        ('search', lambda number: read('%s?%s' % (reverse('search'), urlencode({
+            'q': pick(books, number)['title'],
+        })))),
+
+        ('author-create', lambda number: write('POST', reverse('author-list'), {
+            'first_name': CREATED_PREFIX, 'last_name': 'Author %d' % number,
+        })),
+        ('author-update', lambda number: write(
+            'PUT', reverse('author-detail', args=[pick(authors, number)['id']]),
+            dict(pick(authors, number), last_name='Updated %d' % number)
+        )),
+        ('book-create', lambda number: write(
+            'POST', reverse('book-list'), book_data(number, pick(authors, number)['id'])
+        )),
+        ('book-update', lambda number: write(
+            'PUT', reverse('book-detail', args=[pick(books, number)['id']]),
+            dict(pick(books, number), author=pick(books, number)['author_id'],
+                 published=pick(books, number)['published'].isoformat(), title='Updated %d' % number)
+        )),
+        ('book-create-book-and-author', lambda number: write(
+            'POST', reverse('book-createBookAndAuthor'),
+            dict(book_data(number, None), author={'first_name': CREATED_PREFIX, 'last_name': 'Author %d' % number})
+        )),
+        ('book-bulk-create', lambda number: write('POST', reverse('book-bulk'), [
+            book_data(number * BULK_SIZE + offset, pick(authors, number)['id']) for offset in range(BULK_SIZE)
+        ])),
+        ('author-partial-update', lambda number: write(
+            'PATCH', reverse('author-detail', args=[pick(authors, number)['id']]),
+            {'last_name': 'Patched %d' % number}
+        )),
+        ('book-partial-update', lambda number: write(
+            'PATCH', reverse('book-detail', args=[pick(books, number)['id']]), {'title': 'Patched %d' % number}
+        )),
+        ('book-bulk-update', lambda number: write('PATCH', reverse('book-bulk'), [
+            {'id': pick(books, number * BULK_SIZE + offset)['id'], 'title': 'Bulk Updated %d' % number}
+            for offset in range(BULK_SIZE)
+        ])),
+        ('author-delete', lambda number: delete(reverse('author-detail', args=[create_author(number)]))),
+        ('book-delete', lambda number: delete(
+            reverse('book-detail', args=create_books(number, pick(authors, number)['id']))
+        )),
+        ('book-bulk-delete', lambda number: write(
+            'DELETE', reverse('book-bulk'), create_books(number, pick(authors, number)['id'], BULK_SIZE)
+        )),
+    ])
+
+
+def compare_results(baseline, results, threshold):
+    """
+    Returns the (size, scenario, description) of each result more than
+    `threshold`, a fraction, worse than its baseline: lower throughput,
+    higher p95 latency or errors where there were none.
+    """
+    regressions = []
+    for size, scenarios in sorted(results.items()):
+        for name, result in sorted(scenarios.items()):
+            before = baseline.get(size, {}).get(name)
+            if before is None:
+                continue
+            if result['throughput'] < before['throughput'] * (1 - threshold):
+                regressions.append((size, name, 'throughput %.1f -> %.1f req/s' % (
+                    before['throughput'], result['throughput'])))
+            if before['p95_ms'] and result['p95_ms'] > before['p95_ms'] * (1 + threshold):
+                regressions.append((size, name, 'p95 %.1f -> %.1f ms' % (before['p95_ms'], result['p95_ms'])))
+            if result['errors'] and not before['errors']:
+                regressions.append((size, name, '%d errors' % result['errors']))
+    return regressions
+
+
+def delete_created():
+    """
+    Deletes the rows the write scenarios created, and recounts the books of
+    the seeded authors they were added to.
+    """
+    books = Book.objects.filter(title__startswith=CREATED_PREFIX + ' ')
+    author_ids = set(books.exclude(author__first_name=CREATED_PREFIX).values_list('author_id', flat=True))
+    books.delete()
+    Author.objects.filter(first_name=CREATED_PREFIX).delete()
+    if author_ids:
+        recount_books(author_ids)
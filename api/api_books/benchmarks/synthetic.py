@@ -0,0 +1,153 @@
+from __future__ import unicode_literals
+
+import math
+import random
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+
+from django.utils import timezone
+
+
+AUTHOR_COLUMNS = ('id', 'first_name', 'last_name', 'created', 'updated')
+BOOK_COLUMNS = ('id', 'title', 'author', 'isbn', 'published', 'created', 'updated')
+
+FIRST_NAMES = (
+    'Ada', 'Alan', 'Alice', 'Ana', 'Andrea', 'Anne', 'Arthur', 'Carlos', 'Charles', 'Charlotte',
+    'Clara', 'Daniel', 'David', 'Diana', 'Elena', 'Elizabeth', 'Emily', 'Ernest', 'Eva', 'Frank',
+    'George', 'Grace', 'Hannah', 'Henry', 'Isabel', 'Jack', 'James', 'Jane', 'Javier', 'John',
+    'Jorge', 'Jose', 'Julia', 'Laura', 'Leo', 'Lucia', 'Luis', 'Margaret', 'Maria', 'Mark',
+    'Mary', 'Michael', 'Miguel', 'Nora', 'Oscar', 'Paul', 'Pedro', 'Rosa', 'Ruth', 'Sara',
+    'Sofia', 'Thomas', 'Victor', 'Virginia', 'William', 'Zadie',
+)
+
+LAST_NAMES = (
+    'Adams', 'Allende', 'Austen', 'Baker', 'Borges', 'Bronte', 'Brown', 'Castro', 'Clark', 'Cook',
+    'Cortazar', 'Davis', 'Dickens', 'Diaz', 'Eliot', 'Evans', 'Fisher', 'Garcia', 'Gomez', 'Green',
+    'Hall', 'Harris', 'Hughes', 'Jackson', 'Johnson', 'Jones', 'King', 'Lee', 'Lewis', 'Lopez',
+    'Martin', 'Martinez', 'Miller', 'Moore', 'Morrison', 'Munro', 'Nunez', 'Orwell', 'Perez', 'Roberts',
+    'Rodriguez', 'Ruiz', 'Sanchez', 'Scott', 'Shelley', 'Smith', 'Taylor', 'Thompson', 'Torres', 'Twain',
+    'Walker', 'White', 'Williams', 'Wilson', 'Woolf', 'Young',
+)
+
+TITLE_WORDS = (
+    'a', 'after', 'age', 'all', 'and', 'autumn', 'beyond', 'bird', 'blood', 'blue', 'book', 'bridge',
+    'city', 'cold', 'dark', 'daughter', 'day', 'dead', 'death', 'dream', 'earth', 'empire', 'end',
+    'fall', 'fire', 'first', 'forest', 'garden', 'girl', 'glass', 'gold', 'great', 'heart', 'history',
+    'home', 'house', 'in', 'island', 'journey', 'king', 'last', 'life', 'light', 'long', 'lost', 'love',
+    'man', 'memory', 'midnight', 'moon', 'mountain', 'night', 'of', 'old', 'on', 'other', 'people',
+    'queen', 'red', 'river', 'road', 'sea', 'secret', 'shadow', 'silence', 'silver', 'sky', 'snow',
+    'son', 'song', 'stone', 'storm', 'story', 'summer', 'sun', 'the', 'time', 'to', 'tree', 'under',
+    'war', 'water', 'white', 'wind', 'winter', 'with', 'woman', 'world', 'year', 'young',
+)
+
+# Books are published between these dates, more of them in recent decades.
+FIRST_PUBLISHED = date(1900, 1, 1)
+LAST_PUBLISHED = date(2020, 12, 31)
+
+# Rows are created and updated in the five years before this moment unless
+# another is given, so that the same seed gives the same timestamps too.
+EPOCH = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+# ISBN-13 numbers are 978 plus nine scrambled digits of the row number and
+# a check digit. Multiplying by a number coprime with 10 ** 9 is a
+# bijection, so every row below a billion gets a distinct ISBN.
+ISBN_SCRAMBLE = 387420489
+
+
+def isbn13(number):
+    """
+    Returns a valid ISBN-13 unique to number, for numbers below 10 ** 9.
+    """
+    digits = '978%09d' % (number * ISBN_SCRAMBLE % 10 ** 9)
+    total = sum(int(digit) * (3 if index % 2 else 1) for index, digit in enumerate(digits))
+    return digits + str((10 - total % 10) % 10)
+
+
+class CatalogGenerator(object):
+    """
+    Generates the same authors and books for the same seed and sizes.
+
+    Books are spread over authors with Zipf-like weights, so a few authors
+    are prolific and most have few books or none. Titles take a log-normal
+    number of words and publication dates lean towards recent decades.
+    Only Random.random() with integer seeds is used, whose sequence is
+    stable across Python versions, unlike randint() and choice().
+    Timestamps lead up to now, EPOCH by default.
+    """
+
+    def __init__(self, authors, books, seed=0, skew=1.1, now=None):
+        self.authors = authors
+        self.books = books
+        self.seed = seed
+        self.skew = skew
+        self.now = now or EPOCH
+
+    def author_rows(self, first_id=1):
+        """
+        Yields a tuple of AUTHOR_COLUMNS values for every author, with ids
+        from first_id.
+        """
+        rng = random.Random(self.seed * 2)
+        for number in range(self.authors):
+            created = self.timestamp(rng)
+            yield (
+                first_id + number,
+                self.pick(rng, FIRST_NAMES),
+                self.pick(rng, LAST_NAMES),
+                created,
+                created,
+            )
+
+    def book_rows(self, first_author_id=1, first_id=1):
+        """
+        Yields a tuple of BOOK_COLUMNS values for every book, with ids from
+        first_id and authors among the ones author_rows() yields from
+        first_author_id. ISBNs follow from the ids, so rows with different
+        ids never share one.
+        """
+        if self.books and not self.authors:
+            raise ValueError('At least one author is needed to generate books.')
+
+        rng = random.Random(self.seed * 2 + 1)
+        cumulative = self.author_weights()
+        days = (LAST_PUBLISHED - FIRST_PUBLISHED).days
+        for number in range(self.books):
+            author = bisect_right(cumulative, rng.random() * cumulative[-1])
+            created = self.timestamp(rng)
+            yield (
+                first_id + number,
+                self.title(rng),
+                first_author_id + min(author, self.authors - 1),
+                isbn13(first_id - 1 + number),
+                FIRST_PUBLISHED + timedelta(days=int(days * math.sqrt(rng.random()))),
+                created,
+                # A tenth of the books were edited after being added.
+                created + timedelta(seconds=int((self.now - created).total_seconds() * rng.random()))
+                if rng.random() < 0.1 else created,
+            )
+
+    def author_weights(self):
+        """
+        Returns the cumulative weight of each author, the one at rank r
+        weighing 1 / r ** skew.
+        """
+        cumulative, total = [], 0.0
+        for rank in range(1, self.authors + 1):
+            total += 1.0 / rank ** self.skew
+            cumulative.append(total)
+        return cumulative
+
+    def title(self, rng):
+        # Mostly two to six words, now and then a long subtitle.
+        words = max(1, min(int(math.exp(rng.random() * 1.2 + rng.random() * 1.2)), 20))
+        title = ' '.join(self.pick(rng, TITLE_WORDS) for _ in range(words))
+        return title[:1].upper() + title[1:250]
+
+    def timestamp(self, rng):
+        # Rows were added over the last five years.
+        return self.now - timedelta(seconds=int(rng.random() * 5 * 365 * 86400))
+
+    @staticmethod
+    def pick(rng, choices):
+        return choices[int(rng.random() * len(choices))]
+
@@ -0,0 +1,394 @@
+from __future__ import unicode_literals
+
+import copy
+
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Case, Value, When, sql
+from django.db.models.sql.constants import CURSOR
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.decorators import list_route
+from rest_framework.response import Response
+from rest_framework.validators import UniqueValidator
+
+from api_books.signals import rows_deleted, rows_saved
+
+
+def chunked(items, size):
+    """
+    Yields successive slices of items with at most size elements.
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def in_bulk(queryset, ids):
+    """
+    Like QuerySet.in_bulk(), but splits the id__in lookup when the backend
+    limits the number of query parameters (SQLite allows 999).
+    """
+    ids = list(set(ids))
+    if not ids:
+        return {}
+
+    batch_size = connections[queryset.db].ops.bulk_batch_size(['pk'], ids)
+    objects = {}
+    for batch in chunked(ids, batch_size):
+        objects.update(queryset.in_bulk(batch))
+    return objects
+
+
+def bulk_create(queryset, objs, batch_size=None):
+    """
+    QuerySet.bulk_create() with batch_size capped to what the backend allows.
+
+    Django 1.8 only applies the backend limit when no batch_size is given,
+    and SQLite rejects inserts of more than 500 rows or 999 parameters.
+    """
+    fields = queryset.model._meta.concrete_fields
+    max_batch_size = max(connections[queryset.db].ops.bulk_batch_size(fields, objs), 1)
+    batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+    return queryset.bulk_create(objs, batch_size=batch_size)
+
+
+def bulk_update(objs, fields, batch_size=None):
+    """
+    Writes the given fields of objs with one UPDATE ... CASE WHEN per batch.
+
+    Django 1.8 has no QuerySet.bulk_update(), so this builds the same
+    statement it would: every column is set from a CASE on the primary key,
+    and only rows in the batch are touched.
+    """
+    if not objs:
+        return 0
+
+    model = type(objs[0])
+    fields = [model._meta.get_field(name) for name in fields]
+    connection = connections[model.objects.db]
+
+    # Each object takes a pk and a value parameter per field, plus the IN list.
+    max_batch_size = connection.ops.bulk_batch_size(['pk'] * (len(fields) * 2 + 1), objs)
+    batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+    updated = 0
+    with transaction.atomic(using=connection.alias):
+        for batch in chunked(objs, batch_size):
+            values = {}
+            for field in fields:
+                whens = [
+                    When(pk=obj.pk, then=Value(getattr(obj, field.attname), output_field=field))
+                    for obj in batch
+                ]
+                values[field.attname] = Case(*whens, output_field=field)
+            updated += model.objects.filter(pk__in=[obj.pk for obj in batch]).update(**values)
+    return updated
+
+
+def raw_delete(queryset):
+    """
+    Deletes the rows of queryset with a single DELETE and returns how many
+    there were.
+
+    Unlike QuerySet.delete() it neither loads the rows first nor cascades,
+    and sends no signals: callers delete related rows themselves and send
+    rows_deleted.
+    """
+    query = queryset.query.clone(klass=sql.DeleteQuery)
+    cursor = query.get_compiler(queryset.db).execute_sql(CURSOR)
+    try:
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+def unique_error(model, name):
+    """
+    Returns the message UniqueValidator gives for a taken value of the
+    model's field name.
+    """
+    field = model._meta.get_field(name)
+    return field.error_messages['unique'] % {
+        'model_name': model._meta.verbose_name,
+        'field_label': field.verbose_name
+    }
+
+
+class BulkModelMixin(object):
+    """
+    Adds a `bulk` route that creates (POST), partially updates (PATCH) or
+    deletes (DELETE) many objects at once.
+
+    The request body is a JSON array. Every item is validated first, related
+    objects are resolved with one `id__in` query, and the writes happen in
+    batches inside a single transaction. If any item is invalid nothing is
+    written and a list of per-item errors, aligned with the input, is returned.
+    """
+    bulk_batch_size = 500
+    bulk_max_items = 10000
+
+    @list_route(methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        """
+        This method creates, updates or deletes a list of objects.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({'body': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.bulk_max_items:
+            return Response(
+                {'body': 'Too many items, the limit is %d' % self.bulk_max_items},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if request.method == 'POST':
+            return self.bulk_create(items)
+        elif request.method == 'PATCH':
+            return self.bulk_partial_update(items)
+        return self.bulk_destroy(items)
+
+    def get_bulk_serializer(self, *args, **kwargs):
+        """
+        Returns a serializer without per-item UniqueValidators, which would
+        run one query per item. validate_bulk_unique() checks them at once,
+        and single writes leave them to the unique constraints.
+        """
+        serializer = self.get_serializer_class()(*args, **kwargs)
+        fields = serializer.child.fields if kwargs.get('many') else serializer.fields
+        for field in fields.values():
+            field.validators = [
+                validator for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return serializer
+
+    def validate_bulk_unique(self, values, errors, pks=None):
+        """
+        Checks the unique model fields of every item, both against the other
+        items and against the database, with one query per field.
+
+        values is the list of validated data and pks, when updating, the
+        primary key of the object each item belongs to.
+        """
+        model = self.queryset.model
+        pks = pks or [None] * len(values)
+        for field in model._meta.concrete_fields:
+            if not field.unique or field.primary_key:
+                continue
+
+            message = unique_error(model, field.name)
+
+            seen = {}
+            for index, data in enumerate(values):
+                if data is None or field.name not in data:
+                    continue
+                value = data[field.name]
+                if value in seen:
+                    errors[index].setdefault(field.name, []).append(message)
+                seen[value] = pks[index]
+
+            taken = {}
+            batch_size = connections[model.objects.db].ops.bulk_batch_size(['pk'], seen)
+            for batch in chunked(list(seen), batch_size or 1):
+                lookup = {field.name + '__in': batch}
+                taken.update(
+                    (value, pk) for pk, value in
+                    model.objects.filter(**lookup).values_list('pk', field.name)
+                )
+
+            for index, data in enumerate(values):
+                if data is None or field.name not in data:
+                    continue
+                owner = taken.get(data[field.name])
+                if owner is not None and owner != pks[index]:
+                    errors[index].setdefault(field.name, []).append(message)
+
+    def get_bulk_unique_errors(self, values, pks=None):
+        """
+        Returns the per-item errors of validate_bulk_unique() for values,
+        to tell which items took a value that another request wrote since
+        they were validated, when the write fails on a unique constraint.
+        """
+        errors = [{} for data in values]
+        self.validate_bulk_unique(values, errors, pks=pks)
+        return errors
+
+    def resolve_bulk_related(self, items, partial=False):
+        """
+        Returns, for every item, a dict of related instances to set on the
+        object and a dict of errors. Override to resolve foreign keys.
+        """
+        return [{} for item in items], [{} for item in items]
+
+    def bulk_written(self, old, new):
+        """
+        Called in the transaction of every bulk write with the objects as
+        they were, deleted or before being updated, and as they are, created
+        or updated. Override to keep what is derived from them up to date,
+        such as counts kept on related rows.
+        """
+
+    def bulk_create(self, items):
+        model = self.queryset.model
+        serializer = self.get_bulk_serializer(data=items, many=True)
+        valid = serializer.is_valid()
+
+        errors = [{} for item in items] if valid else [dict(error) for error in serializer.errors]
+        related, related_errors = self.resolve_bulk_related(items)
+        for error, related_error in zip(errors, related_errors):
+            error.update(related_error)
+        if valid:
+            self.validate_bulk_unique(serializer.validated_data, errors)
+
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        objs = [
+            model(**dict(data, **extra))
+            for data, extra in zip(serializer.validated_data, related)
+        ]
+        try:
+            with transaction.atomic():
+                bulk_create(model.objects.all(), objs, batch_size=self.bulk_batch_size)
+                self.bulk_written([], objs)
+                rows_saved.send(sender=model, ids=self.get_created_ids(objs), created=True)
+        except IntegrityError:
+            errors = self.get_bulk_unique_errors(serializer.validated_data)
+            if not any(errors):
+                raise
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'created': len(objs)}, status=status.HTTP_201_CREATED)
+
+    def get_created_ids(self, objs):
+        """
+        Returns the primary keys of objs after bulk_create().
+
+        Only some backends set them on the objects, so otherwise they are
+        looked up through the first unique field. Returns None when the model
+        has no unique field to look them up by.
+        """
+        if all(obj.pk is not None for obj in objs):
+            return [obj.pk for obj in objs]
+
+        model = self.queryset.model
+        unique = [field for field in model._meta.concrete_fields if field.unique and not field.primary_key]
+        if not unique:
+            return None
+
+        lookup = unique[0].attname + '__in'
+        values = [getattr(obj, unique[0].attname) for obj in objs]
+        ids = []
+        batch_size = connections[model.objects.db].ops.bulk_batch_size(['pk'], values)
+        for batch in chunked(values, batch_size):
+            ids.extend(model.objects.filter(**{lookup: batch}).values_list('pk', flat=True))
+        return ids
+
+    def bulk_partial_update(self, items):
+        model = self.queryset.model
+        model_name = model._meta.model_name
+
+        ids = []
+        errors = [{} for item in items]
+        for index, item in enumerate(items):
+            try:
+                ids.append(int(item['id']))
+            except (KeyError, TypeError):
+                errors[index]['id'] = 'Field required'
+                ids.append(None)
+            except ValueError:
+                errors[index]['id'] = 'Incorrect format'
+                ids.append(None)
+
+        objs = in_bulk(model.objects.all(), [pk for pk in ids if pk is not None])
+        old = [copy.copy(obj) for obj in objs.values()]
+        related, related_errors = self.resolve_bulk_related(items, partial=True)
+
+        changed = set()
+        values = [None] * len(items)
+        for index, (pk, item) in enumerate(zip(ids, items)):
+            errors[index].update(related_errors[index])
+            if pk is None:
+                continue
+            if pk not in objs:
+                errors[index][model_name] = 'Not Found'
+                continue
+
+            obj = objs[pk]
+            serializer = self.get_bulk_serializer(obj, data=item, partial=True)
+            if not serializer.is_valid():
+                errors[index].update(serializer.errors)
+                continue
+
+            values[index] = dict(serializer.validated_data, **related[index])
+            for attr, value in values[index].items():
+                setattr(obj, attr, value)
+            changed.update(values[index])
+
+        self.validate_bulk_unique(values, errors, pks=ids)
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # bulk_update() bypasses save(), so bump auto_now fields here.
+        now = timezone.now()
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False):
+                for obj in objs.values():
+                    setattr(obj, field.attname, now)
+                changed.add(field.name)
+
+        try:
+            with transaction.atomic():
+                bulk_update(list(objs.values()), changed, batch_size=self.bulk_batch_size)
+                self.bulk_written(old, list(objs.values()))
+                rows_saved.send(sender=model, ids=list(objs), created=False)
+        except IntegrityError:
+            errors = self.get_bulk_unique_errors(values, pks=ids)
+            if not any(errors):
+                raise
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'updated': len(objs)}, status=status.HTTP_200_OK)
+
+    def bulk_destroy(self, items):
+        model = self.queryset.model
+        model_name = model._meta.model_name
+
+        errors = [{} for item in items]
+        ids = []
+        for index, item in enumerate(items):
+            try:
+                ids.append(int(item))
+            except (TypeError, ValueError):
+                errors[index]['id'] = 'Incorrect format'
+                ids.append(None)
+
+        existing = in_bulk(model.objects.all(), [pk for pk in ids if pk is not None])
+        for index, pk in enumerate(ids):
+            if pk is not None and pk not in existing:
+                errors[index][model_name] = 'Not Found'
+
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        self.perform_bulk_destroy(existing)
+
+        return Response({'deleted': len(existing)}, status=status.HTTP_200_OK)
+
+    def perform_bulk_destroy(self, objs):
+        """
+        Deletes objs, a dict of the objects to delete by primary key, with
+        one DELETE per batch and sends rows_deleted for every batch, all in
+        one transaction.
+
+        Rows are deleted without the collector, which would load and delete
+        related rows one by one: override to delete them first.
+        """
+        model = self.queryset.model
+        ids = list(objs)
+        batch_size = connections[model.objects.db].ops.bulk_batch_size(['pk'], ids)
+        with transaction.atomic():
+            for batch in chunked(ids, min(batch_size, self.bulk_batch_size)):
+                raw_delete(model.objects.filter(pk__in=batch))
+                rows_deleted.send(sender=model, ids=batch)
+            self.bulk_written(list(objs.values()), [])
@@ -0,0 +1,277 @@
+from __future__ import unicode_literals
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import partial, wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils.six.moves import cPickle as pickle
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from api_books.bulk import chunked
+from api_books.models import Author, Book
+from api_books.signals import counts_changed, rows_deleted, rows_saved
+from config.db import on_commit
+
+
+# Global in-process store of LRUCache data, keyed by LOCATION so that every
+# thread shares it, as with Django's LocMemCache.
+_caches = {}
+_locks = {}
+
+# Representations of a detail, e.g. sparse fieldsets, cached at once.
+MAX_VARIANTS = 16
+
+
+class LRUCache(BaseCache):
+    """
+    An in-process cache that drops the least recently used entries once it
+    holds MAX_ENTRIES. Django's LocMemCache culls arbitrary entries instead,
+    which evicts popular responses as often as rare ones.
+
+    Values are pickled, so callers never share mutable objects.
+    """
+
+    def __init__(self, name, params):
+        BaseCache.__init__(self, params)
+        self._cache = _caches.setdefault(name, OrderedDict())
+        self._lock = _locks.setdefault(name, threading.Lock())
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._get(key) is not None:
+                return False
+            self._set(key, pickled, timeout)
+            return True
+
+    def get(self, key, default=None, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        with self._lock:
+            pickled = self._get(key)
+        if pickled is None:
+            return default
+        return pickle.loads(pickled)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._set(key, pickled, timeout)
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        with self._lock:
+            pickled = self._get(key)
+            if pickled is None:
+                raise ValueError("Key '%s' not found" % key)
+            expiry = self._cache[key][0]
+            value = pickle.loads(pickled) + delta
+            self._cache[key] = (expiry, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        return value
+
+    def has_key(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        with self._lock:
+            return self._get(key) is not None
+
+    def delete(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _get(self, key):
+        """
+        Returns the pickled value of key and marks it as most recently used,
+        or None if it is missing or expired. Must hold the lock.
+        """
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return None
+        expiry, pickled = entry
+        if expiry is not None and expiry <= time.time():
+            return None
+        self._cache[key] = entry
+        return pickled
+
+    def _set(self, key, pickled, timeout):
+        self._cache.pop(key, None)
+        self._cache[key] = (self.get_backend_timeout(timeout), pickled)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+
+def get_cache():
+    """
+    Returns the cache holding API responses, configured as
+    CACHES[API_CACHE].
+    """
+    return caches[getattr(settings, 'API_CACHE', 'default')]
+
+
+def detail_key(model, pk):
+    return 'api_books:%s:%s' % (model._meta.model_name, pk)
+
+
+def validators_key(model, pk):
+    return 'api_books:%s:%s:validators' % (model._meta.model_name, pk)
+
+
+def generation_key(model):
+    return 'api_books:%s:generation' % model._meta.model_name
+
+
+def get_generation(cache, model):
+    """
+    Returns the generation of model's lists, which every write bumps so that
+    cached lists, keyed by generation, are never served again.
+
+    A missing counter restarts from the clock rather than from 0, so it
+    never repeats a generation whose lists may still be cached.
+    """
+    key = generation_key(model)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, int(time.time() * 1000000), None)
+        generation = cache.get(key, 0)
+    return generation
+
+
+def bump_generation(cache, model):
+    try:
+        cache.incr(generation_key(model))
+    except ValueError:
+        get_generation(cache, model)
+
+
+def list_key(cache, model, identity, kind='list'):
+    """
+    Returns the key of a cached list of model, identified by a string such as
+    its URL, that the next write to model invalidates.
+    """
+    return 'api_books:%s:%s:%s:%s' % (
+        model._meta.model_name, kind, get_generation(cache, model),
+        hashlib.md5(identity.encode('utf-8')).hexdigest()
+    )
+
+
+def cached_response(method):
+    """
+    Caches the data of the successful responses of a viewset's `list` or
+    `retrieve` action. Details are keyed by primary key, so writes evict
+    them precisely, and hold one response per query string; lists are keyed
+    by URL and the model's list generation.
+    """
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        model = self.queryset.model
+        cache = get_cache()
+        if self.action == 'list':
+            key, variant = list_key(cache, model, request.build_absolute_uri()), None
+        else:
+            try:
+                key = detail_key(model, int(kwargs['pk']))
+            except ValueError:
+                return method(self, request, *args, **kwargs)
+            variant = request.META.get('QUERY_STRING', '')
+
+        cached = cache.get(key)
+        if cached is not None and variant is not None:
+            cached = cached.get(variant)
+        if cached is not None:
+            return Response(cached, status=status.HTTP_200_OK)
+
+        response = method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            data = response.data
+            if variant is not None:
+                variants = cache.get(key) or {}
+                if len(variants) >= MAX_VARIANTS:
+                    variants = {}
+                variants[variant] = data
+                data = variants
+            cache.set(key, data)
+        return response
+
+    return wrapper
+
+
+def evict(model, ids, created=False):
+    """
+    Evicts the cached details and validators of the model's rows with the
+    given ids, and every cached list of the model.
+
+    Within a transaction they are evicted again once it commits: a request
+    reading them in between still sees the rows as they were, and would
+    cache them until they expire.
+    """
+    evict_now(model, ids, created)
+    if transaction.get_connection().in_atomic_block:
+        on_commit(partial(evict_now, model, ids, created))
+
+
+def evict_now(model, ids, created=False):
+    cache = get_cache()
+    bump_generation(cache, model)
+    if created:
+        # New rows were never cached as details.
+        return
+    if ids is None:
+        cache.clear()
+    else:
+        keys = []
+        for pk in ids:
+            keys.extend([detail_key(model, pk), validators_key(model, pk)])
+        cache.delete_many(keys)
+
+
+@receiver(rows_saved, sender=Book)
+@receiver(rows_deleted, sender=Book)
+def evict_books(sender, ids, created=False, **kwargs):
+    evict(Book, ids, created)
+
+
+@receiver(rows_saved, sender=Author)
+@receiver(rows_deleted, sender=Author)
+def evict_authors(sender, ids, created=False, signal=None, **kwargs):
+    """
+    Book payloads embed their author, so changing an author also evicts
+    their books. Deleted authors' books were already evicted as they were
+    deleted with them.
+    """
+    evict(Author, ids, created)
+    if created or signal is rows_deleted:
+        return
+    if ids is None:
+        evict(Book, None)
+        return
+
+    book_ids = []
+    for batch in chunked(list(ids), 500):
+        book_ids.extend(Book.objects.filter(author_id__in=batch).values_list('id', flat=True))
+    evict(Book, book_ids)
+
+
+@receiver(counts_changed, sender=Author)
+def evict_counted_authors(sender, ids, **kwargs):
+    # Books nest their author without book_count, so they stay cached.
+    evict(Author, ids)
@@ -0,0 +1,201 @@
+from __future__ import unicode_literals
+
+import hashlib
+from calendar import timegm
+from datetime import datetime
+from functools import wraps
+
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from api_books.cache import get_cache, list_key, validators_key
+
+
+def conditional(method):
+    """
+    Answers conditional requests to a viewset action of a ConditionalMixin
+    view before the action runs:
+
+    - GET and HEAD return 304 when `If-None-Match` matches the ETag or,
+      without it, when the resource is not newer than `If-Modified-Since`.
+    - Other methods return 412 when `If-Match` does not match the current
+      ETag, read from the database rather than the cache. The action then
+      writes with apply_precondition(), so that a write racing it in
+      between matches no row and returns 412 as well: concurrent updates
+      cannot overwrite each other.
+
+    Successful responses carry the ETag and Last-Modified headers.
+    """
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD'):
+            validators = self.get_validators(request, **kwargs)
+            if validators is not None and not_modified(request, *validators):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                set_validators(response, *validators)
+                return response
+            response = method(self, request, *args, **kwargs)
+        else:
+            self.precondition = None
+            if_match = request.META.get('HTTP_IF_MATCH')
+            if if_match:
+                values = self.get_resource_values(request, **kwargs)
+                if values is None or not etag_matches(if_match, self.make_validators(request, values)[0]):
+                    return precondition_failed(self.queryset.model)
+                if kwargs.get('pk') is not None and '*' not in parse_etags(if_match):
+                    self.precondition = dict(zip(self.validator_fields + self.validator_counts, values))
+            response = method(self, request, *args, **kwargs)
+            # Writes change the validators: give the client the new ones.
+            validators = None
+            if response.status_code == status.HTTP_200_OK:
+                validators = self.get_validators(request, **kwargs)
+
+        if validators is not None and response.status_code == status.HTTP_200_OK:
+            set_validators(response, *validators)
+        return response
+
+    # Lets the OpenAPI spec document the conditional headers.
+    wrapper.conditional = True
+    return wrapper
+
+
+def precondition_failed(model):
+    return Response({model._meta.model_name: 'Precondition Failed'}, status=status.HTTP_412_PRECONDITION_FAILED)
+
+
+def etag_matches(header, etag):
+    etags = parse_etags(header)
+    return '*' in etags or etag in etags
+
+
+def not_modified(request, etag, last_modified):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+    if if_modified_since and last_modified is not None:
+        if_modified_since = parse_http_date_safe(if_modified_since)
+        return if_modified_since is not None and timegm(last_modified.utctimetuple()) <= if_modified_since
+    return False
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = quote_etag(etag)
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(timegm(last_modified.utctimetuple()))
+
+
+class ConditionalMixin(object):
+    """
+    Computes the validators of a viewset's resources from the `updated`
+    timestamps instead of the serialized payload:
+
+    - details from the row's `validator_fields`, e.g. `updated` and
+      `author__updated` for books, which embed their author;
+    - list pages from the keys and `validator_fields` of the rows of the
+      page, read as the page itself is, with one range scan of the
+      ordering index and no COUNT, however deep the page.
+
+    `validator_counts` are counters kept on the rows, e.g. the book count of
+    authors, which change without `updated`: the validators include their
+    values too.
+
+    The values are cached with the responses and evicted with them. Writes
+    read them from the database, which the cache may lag behind.
+    """
+    validator_fields = ('updated',)
+    validator_counts = ()
+    # The validator values of the row an If-Match header matched, by field.
+    precondition = None
+
+    def get_validators(self, request, pk=None, **kwargs):
+        """
+        Returns the (etag, last_modified) pair of the resource requested, or
+        None if it does not exist. Other URL arguments, such as the parent of
+        a nested list, are applied by get_queryset().
+        """
+        values = self.get_resource_values(request, pk, **kwargs)
+        if values is None:
+            return None
+        return self.make_validators(request, values)
+
+    def get_resource_values(self, request, pk=None, **kwargs):
+        """
+        Returns the validator values of the resource requested, or None if it
+        does not exist. Only safe methods read and fill the cache.
+        """
+        cache = get_cache()
+        model = self.queryset.model
+        if pk is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            key = list_key(cache, model, request.build_absolute_uri(), 'validators')
+        else:
+            try:
+                pk = int(pk)
+            except ValueError:
+                return None
+            queryset = model.objects.filter(pk=pk)
+            key = validators_key(model, pk)
+
+        safe = request.method in ('GET', 'HEAD')
+        values = cache.get(key) if safe else None
+        if values is None:
+            if pk is None:
+                values = self.get_page_validator_values(request, queryset)
+            else:
+                values = self.get_validator_values(queryset)
+            if values is not None and safe:
+                cache.set(key, values)
+        return values
+
+    def make_validators(self, request, values):
+        # The same values validate every representation of the resource, so
+        # the ETag also depends on the URL and the negotiated format.
+        accepted_renderer = getattr(request, 'accepted_renderer', None)
+        source = '|'.join(
+            [request.get_full_path(), getattr(accepted_renderer, 'format', '')] +
+            ['%s' % value for value in values]
+        )
+        etag = hashlib.md5(source.encode('utf-8')).hexdigest()
+        timestamps = [value for value in values if isinstance(value, datetime)]
+        last_modified = max(timestamps) if timestamps else None
+        return etag, last_modified
+
+    def apply_precondition(self, queryset):
+        """
+        Returns queryset limited to the row if it still has the validator
+        values the request's If-Match header matched. Writes through it
+        match no row when another write came first.
+        """
+        if self.precondition is None:
+            return queryset
+        return queryset.filter(**self.precondition)
+
+    def get_validator_values(self, queryset):
+        return queryset.values_list(*(self.validator_fields + self.validator_counts)).first()
+
+    def get_page_validator_values(self, request, queryset):
+        """
+        Returns the validator values of the page of queryset the request
+        asks for: a digest of the keys, `validator_fields` and
+        `validator_counts` of its rows and of the pages around it, followed
+        by the latest value of each of `validator_fields`.
+        """
+        fields = (queryset.model._meta.pk.attname,) + self.validator_fields + self.validator_counts
+        rows = queryset.values_list(*fields)
+        # A paginator of its own, so the one of the action starts afresh.
+        paginator = self.pagination_class() if self.pagination_class is not None else None
+        page = paginator.paginate_queryset(rows, request, view=self) if paginator is not None else None
+        if page is None:
+            page, around = list(rows), None
+        else:
+            around = (paginator.has_previous, paginator.has_next)
+
+        values = [hashlib.md5(repr((around, page)).encode('utf-8')).hexdigest()]
+        for index in range(1, len(self.validator_fields) + 1):
+            timestamps = [row[index] for row in page if row[index] is not None]
+            values.append(max(timestamps) if timestamps else None)
+        return values
@@ -0,0 +1,175 @@
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import six
+
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+from config.metrics.timing import timed
+
+
+# RowConverters compiled by ValuesListMixin, keyed by serializer class and
+# the view's serializer options.
+_converters = {}
+
+
+def iso_datetime(value):
+    # As serializers.DateTimeField.to_representation() with ISO 8601.
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def iso_date(value):
+    return value.isoformat()
+
+
+def identity(value):
+    return value
+
+
+def get_converter(field):
+    """
+    Returns a function giving the representation of field for a value read
+    with values(), or None if values() does not read what the field expects.
+    """
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        # values() reads the key, not the related object.
+        if field.pk_field is not None:
+            return field.pk_field.to_representation
+        return identity
+    if isinstance(field, serializers.RelatedField):
+        return None
+    field_class = type(field)
+    if field_class is serializers.IntegerField:
+        return int
+    if field_class is serializers.CharField:
+        return six.text_type
+    output_format = getattr(field, 'format', None)
+    if field_class is serializers.DateTimeField and output_format is None:
+        output_format = api_settings.DATETIME_FORMAT
+        if output_format is not None and output_format.lower() == ISO_8601:
+            return iso_datetime
+    if field_class is serializers.DateField and output_format is None:
+        output_format = api_settings.DATE_FORMAT
+        if output_format is not None and output_format.lower() == ISO_8601:
+            return iso_date
+    return field.to_representation
+
+
+class RowConverter(object):
+    """
+    Converts rows of `queryset.values(*converter.columns)` to the data the
+    serializer it was compiled from gives for the same objects, without
+    building model instances and looking fields up for each of them.
+    """
+
+    def __init__(self, entries):
+        # (field name, column, converter, nested) for each readable field.
+        self.entries = entries
+        self.columns = []
+        for name, column, convert, nested in entries:
+            self.columns.extend(convert.columns if nested else [])
+            self.columns.append(column)
+
+    def __call__(self, row):
+        data = OrderedDict()
+        for name, column, convert, nested in self.entries:
+            value = row[column]
+            if value is None:
+                data[name] = None
+            elif nested:
+                data[name] = convert(row)
+            else:
+                data[name] = convert(value)
+        return data
+
+    def convert_all(self, rows):
+        return [self(row) for row in rows]
+
+
+def compile_converter(serializer, prefix=''):
+    """
+    Returns a RowConverter for serializer, a ModelSerializer whose fields
+    read model fields and nest other ModelSerializers, or None for any other
+    serializer, which must then serialize instances.
+    """
+    if not isinstance(serializer, serializers.ModelSerializer):
+        return None
+    opts = serializer.Meta.model._meta
+
+    entries = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field.source == '*' or '.' in field.source:
+            return None
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        column = prefix + field.source
+
+        if isinstance(field, serializers.BaseSerializer):
+            nested = compile_converter(field, column + '__')
+            if nested is None:
+                return None
+            # The key is None when there is no related object.
+            entries.append((name, column, nested, True))
+            continue
+        if model_field.is_relation and not isinstance(field, serializers.PrimaryKeyRelatedField):
+            return None
+        convert = get_converter(field)
+        if convert is None:
+            return None
+        entries.append((name, column, convert, False))
+    return RowConverter(entries)
+
+
+class ValuesListMixin(object):
+    """
+    Lists objects from values() rows converted by a RowConverter, compiled
+    once for each serializer class and get_converter_key(). Serializers
+    without a RowConverter list instances as usual.
+    """
+
+    def get_converter_key(self):
+        """
+        Returns what, besides its class, the serializer of the view depends
+        on, e.g. query parameters passed to it.
+        """
+        return ()
+
+    def get_row_converter(self):
+        key = (self.get_serializer_class(),) + tuple(self.get_converter_key())
+        try:
+            return _converters[key]
+        except KeyError:
+            return _converters.setdefault(key, compile_converter(self.get_serializer()))
+
+    def list(self, request, *args, **kwargs):
+        converter = self.get_row_converter()
+        if converter is None:
+            return super(ValuesListMixin, self).list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # The paginator reads its cursor from the ordering columns and the
+        # key of the rows.
+        columns = set(converter.columns)
+        columns.update(name.lstrip('-') for name in queryset.query.order_by)
+        columns.add(queryset.model._meta.pk.attname)
+        rows = queryset.values(*columns)
+
+        page = self.paginate_queryset(rows)
+        with timed('serialize'):
+            data = converter.convert_all(page if page is not None else rows)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
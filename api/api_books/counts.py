@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+from django.db import connections
+from django.db.models import Case, F, IntegerField, Value, When
+
+from api_books.bulk import chunked
+from api_books.models import Author, Book
+from api_books.signals import counts_changed
+
+
+def add_book_counts(changes, using='default'):
+    """
+    Adds to the book_count of every author id in changes the number it maps
+    to, negative for books they lost, and sends counts_changed for them.
+
+    Counts move with one UPDATE ... CASE WHEN per batch of authors, relative
+    to their current value, so concurrent writes add up. Call it in the
+    transaction that writes the books.
+    """
+    changes = dict((author_id, delta) for author_id, delta in changes.items() if delta)
+    if not changes:
+        return
+
+    author_ids = sorted(changes)
+    authors = Author.objects.using(using)
+    # Each author takes a pk and a delta parameter, plus its place in the IN list.
+    batch_size = connections[using].ops.bulk_batch_size(['pk'] * 3, author_ids)
+    for batch in chunked(author_ids, batch_size):
+        if len(batch) == 1:
+            delta = Value(changes[batch[0]])
+        else:
+            delta = Case(*[
+                When(id=author_id, then=Value(changes[author_id])) for author_id in batch
+            ], default=Value(0), output_field=IntegerField())
+        authors.filter(id__in=batch).update(book_count=F('book_count') + delta)
+    counts_changed.send(sender=Author, ids=author_ids)
+
+
+def recount_books(author_ids=None, using='default'):
+    """
+    Sets the book_count of the given authors, or of every author if None,
+    to the number of their books, counted on the Book.author index, and
+    sends counts_changed for them.
+
+    For writes of more rows than are worth keeping track of, such as
+    imports, and to repair counts after books were written without the API.
+    """
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    author_table, book_table = qn(Author._meta.db_table), qn(Book._meta.db_table)
+    sql = 'UPDATE {0} SET {1} = (SELECT COUNT(*) FROM {2} WHERE {2}.{3} = {0}.{4})'.format(
+        author_table, qn(Author._meta.get_field('book_count').column),
+        book_table, qn(Book._meta.get_field('author').column), qn(Author._meta.pk.column)
+    )
+
+    with connection.cursor() as cursor:
+        if author_ids is None:
+            cursor.execute(sql)
+        else:
+            author_ids = list(author_ids)
+            batch_size = connection.ops.bulk_batch_size(['pk'], author_ids)
+            for batch in chunked(author_ids, batch_size):
+                cursor.execute(
+                    '%s WHERE %s.%s IN (%s)' % (sql, author_table, qn(Author._meta.pk.column),
+                                               ', '.join(['%s'] * len(batch))),
+                    batch
+                )
+    counts_changed.send(sender=Author, ids=author_ids)
@@ -0,0 +1,106 @@
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from api_books.bulk import raw_delete
+from api_books.counts import add_book_counts
+from api_books.models import Author, Book, DeletionJob
+from api_books.signals import rows_deleted
+
+
+logger = logging.getLogger(__name__)
+
+
+def delete_author(author_id, batch_size=500, using='default', progress=None):
+    """
+    Deletes an author and their books, and returns how many books were
+    deleted, or None if there is no such author.
+
+    Books are deleted batch_size at a time: the ids of a batch are read, its
+    rows deleted with one DELETE, the author's book_count lowered and
+    rows_deleted sent for them, so memory stays the same however many books
+    the author has. Each batch commits on its own unless the caller wraps
+    the call in a transaction. progress, if given, is called with the
+    number of books deleted after every batch.
+    """
+    batch_size = min(batch_size, connections[using].ops.bulk_batch_size(['pk'], range(batch_size)))
+    books = Book.objects.using(using)
+    deleted = 0
+    while True:
+        with transaction.atomic(using=using, savepoint=False):
+            ids = list(books.filter(author_id=author_id).values_list('id', flat=True)[:batch_size])
+            if ids:
+                raw_delete(books.filter(id__in=ids))
+                add_book_counts({author_id: -len(ids)}, using)
+                rows_deleted.send(sender=Book, ids=ids)
+        deleted += len(ids)
+        if progress is not None and ids:
+            progress(deleted)
+        if len(ids) < batch_size:
+            break
+
+    with transaction.atomic(using=using, savepoint=False):
+        if not raw_delete(Author.objects.using(using).filter(id=author_id)):
+            return None
+        rows_deleted.send(sender=Author, ids=[author_id])
+    return deleted
+
+
+def start_deletion(author_id, batch_size=500):
+    """
+    Returns the job deleting the author in the background, starting one
+    unless it is already pending or running.
+
+    The job runs on a thread of its own, or in the request when the
+    BACKGROUND_JOBS_EAGER setting is True, as in tests.
+    """
+    job = DeletionJob.objects.filter(
+        author_id=author_id, status__in=(DeletionJob.PENDING, DeletionJob.RUNNING)
+    ).first()
+    if job is not None:
+        return job
+
+    job = DeletionJob.objects.create(author_id=author_id)
+    if getattr(settings, 'BACKGROUND_JOBS_EAGER', False):
+        run_deletion(job.id, batch_size)
+    else:
+        # Not a daemon, so a worker being recycled finishes the job first.
+        threading.Thread(target=run_in_thread, args=(job.id, batch_size),
+                         name='deletion-job-%d' % job.id).start()
+    return job
+
+
+def run_in_thread(job_id, batch_size):
+    try:
+        run_deletion(job_id, batch_size)
+    finally:
+        # The thread's own connections would otherwise stay open.
+        for connection in connections.all():
+            connection.close()
+
+
+def run_deletion(job_id, batch_size=500):
+    """
+    Runs a deletion job, recording the books deleted so far and whether it
+    finished or failed. Jobs interrupted by a restart can be run again and
+    carry on where they stopped.
+    """
+    jobs = DeletionJob.objects.filter(id=job_id)
+    author_id, already_deleted = jobs.values_list('author_id', 'books_deleted').get()
+    jobs.update(status=DeletionJob.RUNNING, updated=timezone.now())
+
+    def progress(deleted):
+        jobs.update(books_deleted=already_deleted + deleted, updated=timezone.now())
+
+    try:
+        delete_author(author_id, batch_size, progress=progress)
+    except Exception as e:
+        logger.exception('Deletion job %d of author %d failed', job_id, author_id)
+        jobs.update(status=DeletionJob.FAILED, error='%s' % e, updated=timezone.now())
+    else:
+        jobs.update(status=DeletionJob.DONE, updated=timezone.now())
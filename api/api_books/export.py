@@ -0,0 +1,72 @@
+from __future__ import unicode_literals
+
+import csv
+import json
+
+from django.utils import six
+
+from rest_framework.utils import encoders
+
+from api_books.serializers import BookSerializer
+
+
+CSV_HEADER = (
+    'id', 'title', 'isbn', 'published', 'created', 'updated',
+    'author_id', 'author_first_name', 'author_last_name'
+)
+
+
+class Echo(object):
+    """
+    An object that implements just the write method of the file-like
+    interface, so csv.writer hands back each row instead of buffering it.
+    """
+    def write(self, value):
+        return value
+
+
+def iterate_in_chunks(queryset, chunk_size=1000):
+    """
+    Yields every object of queryset, fetching chunk_size rows at a time.
+
+    Rows are read with a keyset on the primary key (WHERE id > last LIMIT n)
+    so only one chunk is ever held in memory, whatever the table size.
+    """
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id).order_by('id')[:chunk_size])
+        if not chunk:
+            return
+        for obj in chunk:
+            yield obj
+        last_id = chunk[-1].id
+
+
+def ndjson_rows(books):
+    """
+    Yields one JSON document per book, in the same format as the API.
+    """
+    for book in books:
+        data = BookSerializer(book).data
+        yield json.dumps(data, cls=encoders.JSONEncoder, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def csv_rows(books):
+    """
+    Yields a CSV header followed by one flattened row per book.
+    """
+    writer = csv.writer(Echo())
+    yield _write_csv_row(writer, CSV_HEADER)
+    for book in books:
+        yield _write_csv_row(writer, (
+            book.id, book.title, book.isbn, book.published.isoformat(),
+            book.created.isoformat(), book.updated.isoformat(),
+            book.author.id, book.author.first_name, book.author.last_name
+        ))
+
+
+def _write_csv_row(writer, row):
+    if six.PY2:
+        # The Python 2 csv module only handles byte strings.
+        return writer.writerow([six.text_type(value).encode('utf-8') for value in row])
+    return writer.writerow(row)
@@ -0,0 +1,70 @@
+from __future__ import unicode_literals
+
+from django.db import connections
+from django.utils import six
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+class IndexedFieldsFilterBackend(BaseFilterBackend):
+    """
+    Filters the queryset from the query parameters declared in the view's
+    `filter_params`, a dict mapping each parameter to an ORM lookup and the
+    serializer field used to parse its value, e.g.
+
+        filter_params = {
+            'isbn': ('isbn', serializers.CharField()),
+            'published__gte': ('published__gte', serializers.DateField()),
+        }
+
+    Only lookups on indexed columns should be declared, so every filter is
+    an index seek or range scan. Invalid values return a 400 response.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filters = {}
+        errors = {}
+        for param, (lookup, field) in getattr(view, 'filter_params', {}).items():
+            value = request.query_params.get(param)
+            if value is None:
+                continue
+            try:
+                value = field.run_validation(value)
+            except ValidationError as exc:
+                errors[param] = exc.detail
+                continue
+
+            if lookup.endswith('__startswith'):
+                filters.update(self.get_prefix_lookups(queryset, lookup, value))
+            else:
+                filters[lookup] = value
+
+        if errors:
+            raise ValidationError(errors)
+
+        return queryset.filter(**filters)
+
+    def get_prefix_lookups(self, queryset, lookup, prefix):
+        """
+        SQLite's LIKE is case-insensitive, so it never uses the column index
+        for `startswith`. There the prefix becomes the equivalent range
+        `prefix <= column < next prefix`, which does. PostgreSQL uses the
+        `varchar_pattern_ops` index Django creates for indexed CharFields.
+
+        Prefixes whose last code point has no next one (U+10FFFF, surrogates
+        and, on narrow Python 2 builds, anything above U+FFFF) keep the plain
+        `startswith`.
+        """
+        if connections[queryset.db].vendor != 'sqlite' or not prefix:
+            return {lookup: prefix}
+
+        column = lookup[:-len('__startswith')]
+        code_point = ord(prefix[-1]) + 1
+        if 0xD800 <= code_point <= 0xE000:
+            return {lookup: prefix}
+        try:
+            upper = prefix[:-1] + six.unichr(code_point)
+        except (ValueError, OverflowError):
+            return {lookup: prefix}
+        return {column + '__gte': prefix, column + '__lt': upper}
@@ -0,0 +1,361 @@
+from __future__ import unicode_literals
+
+import csv
+import io
+import json
+from collections import Counter
+from datetime import date
+from itertools import islice
+
+from django.core.management.color import no_style
+from django.db import connections, transaction
+from django.utils import six, timezone
+from django.utils.dateparse import parse_date
+
+from api_books.benchmarks.seed import without_auto_now
+from api_books.bulk import bulk_create, chunked
+from api_books.counts import add_book_counts
+from api_books.models import Author, Book
+
+
+# Ways insert_rows() can write rows, fastest last.
+METHODS = ('bulk_create', 'executemany', 'copy')
+
+
+def iter_batches(rows, size):
+    """
+    Yields lists of at most size items from any iterable, so that only one
+    batch of a stream of rows is ever held in memory.
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def default_method(using='default'):
+    """
+    Returns the fastest method the database supports: COPY on PostgreSQL and
+    executemany elsewhere.
+    """
+    return 'copy' if connections[using].vendor == 'postgresql' else 'executemany'
+
+
+def insert_rows(model, columns, rows, method='bulk_create', using='default'):
+    """
+    Inserts one batch of rows, tuples of values in the order of columns
+    (field names), and returns how many were written.
+
+    The values are written as given: auto_now fields are not overwritten and
+    primary keys, when included, are kept. Other fields with a default get
+    it. bulk_create goes through the model; executemany and copy skip it and
+    write the columns directly, with one prepared INSERT for the whole batch
+    or, on PostgreSQL, one COPY.
+    """
+    if not rows:
+        return 0
+    if method not in METHODS:
+        raise ValueError('Unknown insert method %r, expected one of %s.' % (method, ', '.join(METHODS)))
+
+    connection = connections[using]
+    fields = [model._meta.get_field(name) for name in columns]
+
+    if method == 'bulk_create':
+        attnames = [field.attname for field in fields]
+        with without_auto_now(model):
+            bulk_create(model.objects.using(using), [
+                model(**dict(zip(attnames, row))) for row in rows
+            ], batch_size=len(rows))
+        return len(rows)
+
+    # Django sets defaults on the models, not in the database.
+    defaults = [
+        field for field in model._meta.concrete_fields
+        if field not in fields and not field.primary_key and field.has_default()
+    ]
+    if defaults:
+        fields += defaults
+        extra = tuple(field.get_default() for field in defaults)
+        rows = [tuple(row) + extra for row in rows]
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    column_list = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+
+    if method == 'copy':
+        if connection.vendor != 'postgresql':
+            raise ValueError('COPY needs PostgreSQL, the %r database is %s.' % (using, connection.vendor))
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY %s (%s) FROM STDIN WITH (FORMAT csv, NULL '\\N')" % (table, column_list),
+                _csv_buffer(rows)
+            )
+        return len(rows)
+
+    prepare = [field.get_db_prep_save for field in fields]
+    params = [
+        [prep(value, connection) for prep, value in zip(prepare, row)]
+        for row in rows
+    ]
+    # SQLite limits the parameters of a statement, not of a batch of them.
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            'INSERT INTO %s (%s) VALUES (%s)' % (table, column_list, ', '.join(['%s'] * len(fields))),
+            params
+        )
+    return len(rows)
+
+
+def _csv_buffer(rows):
+    """
+    Returns rows as a CSV file object for COPY, with None written as \\N so
+    that empty strings stay empty strings.
+    """
+    if six.PY2:
+        buffer = io.BytesIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([b'\\N' if value is None else six.text_type(value).encode('utf-8') for value in row])
+    else:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(['\\N' if value is None else value for value in row])
+    buffer.seek(0)
+    return buffer
+
+
+def reset_sequences(models, using='default'):
+    """
+    Moves the primary key sequences of models past their largest ids, after
+    rows were inserted with explicit ids.
+    """
+    connection = connections[using]
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def reserve_ids(model, count, using='default'):
+    """
+    Returns count new primary keys for rows inserted with explicit ids.
+
+    PostgreSQL hands them out from the table's sequence, so they never clash
+    with rows inserted meanwhile. Elsewhere they follow the largest id, and
+    nothing else should insert rows of model until they are written.
+    """
+    if not count:
+        return []
+    connection = connections[using]
+    table = model._meta.db_table
+    column = model._meta.pk.column
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+                [table, column, count]
+            )
+            return [row[0] for row in cursor.fetchall()]
+        cursor.execute('SELECT MAX(%s) FROM %s' % (
+            connection.ops.quote_name(column), connection.ops.quote_name(table)
+        ))
+        first = (cursor.fetchone()[0] or 0) + 1
+    return list(range(first, first + count))
+
+
+def read_csv(path):
+    """
+    Yields every row of a CSV file with a header as a dict.
+    """
+    if six.PY2:
+        with io.open(path, 'rb') as f:
+            for row in csv.DictReader(f):
+                yield dict((key.decode('utf-8'), value.decode('utf-8')) for key, value in row.items()
+                           if key is not None and value is not None)
+        return
+    with io.open(path, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield row
+
+
+def read_json(path, chunk_size=1 << 16):
+    """
+    Yields every object of a JSON array, or of a file with a JSON document
+    per line, reading chunk_size characters at a time.
+    """
+    decoder = json.JSONDecoder()
+    with io.open(path, encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        in_array = buffer.startswith('[')
+        # Separators between documents: whitespace, and commas in arrays.
+        separators = ' \t\r\n,' if in_array else ' \t\r\n'
+        position = 1 if in_array else 0
+        eof = False
+
+        while True:
+            while position < len(buffer) and buffer[position] in separators:
+                position += 1
+            if not eof and len(buffer) - position < chunk_size:
+                # Drops what was read and keeps at least a chunk ahead.
+                more = f.read(chunk_size)
+                buffer, position, eof = buffer[position:] + more, 0, not more
+                continue
+            if position == len(buffer) or (in_array and buffer[position] == ']'):
+                return
+            try:
+                document, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if eof:
+                    raise
+                # The document continues in the next chunk.
+                more = f.read(chunk_size)
+                buffer, position, eof = buffer[position:] + more, 0, not more
+                continue
+            yield document
+
+
+# Readers of the formats import_catalog loads, by file extension.
+READERS = {
+    'csv': read_csv,
+    'json': read_json,
+    'ndjson': read_json,
+    'jsonl': read_json,
+}
+
+
+class CatalogImporter(object):
+    """
+    Loads records of books with their authors, in the formats the export
+    endpoint writes: nested `author` objects, or flat `author_first_name` and
+    `author_last_name` columns. Other fields, ids among them, are ignored.
+
+    Authors are deduplicated on their first and last name against a map of
+    every author, filled from the database once; new ones get ids from
+    reserve_ids() so that books can refer to them in the same batch. Each
+    batch is written in its own transaction. Records that are invalid, or
+    whose ISBN is taken, are skipped and returned as errors.
+    """
+
+    def __init__(self, method='bulk_create', using='default'):
+        self.method = method
+        self.using = using
+        self.authors = None
+        self.max_lengths = dict(
+            (field.name, field.max_length)
+            for model in (Author, Book) for field in model._meta.concrete_fields
+            if getattr(field, 'max_length', None)
+        )
+
+    def load_authors(self):
+        authors = {}
+        rows = Author.objects.using(self.using).order_by('-id').values_list('first_name', 'last_name', 'id')
+        # Iterated from the last id, so duplicated names keep the first author.
+        for first_name, last_name, pk in rows.iterator():
+            authors[(first_name, last_name)] = pk
+        return authors
+
+    def clean(self, record):
+        """
+        Returns the title, isbn, published date, first and last name of the
+        author of record, or raises ValueError with what is wrong with it.
+        """
+        if not isinstance(record, dict):
+            raise ValueError('not an object')
+        author = record.get('author')
+        if isinstance(author, dict):
+            first_name, last_name = author.get('first_name'), author.get('last_name')
+        else:
+            first_name, last_name = record.get('author_first_name'), record.get('author_last_name')
+
+        values = {}
+        for name, value in (('title', record.get('title')), ('isbn', record.get('isbn')),
+                            ('first_name', first_name), ('last_name', last_name)):
+            if not isinstance(value, six.string_types) or not value.strip():
+                raise ValueError('%s is required' % name)
+            values[name] = value = value.strip()
+            if len(value) > self.max_lengths[name]:
+                raise ValueError('%s is longer than %d characters' % (name, self.max_lengths[name]))
+
+        published = record.get('published')
+        if published in (None, ''):
+            published = date.today()
+        else:
+            try:
+                published = parse_date(published)
+            except (TypeError, ValueError):
+                published = None
+            if published is None:
+                raise ValueError('published is not a YYYY-MM-DD date')
+
+        return values['title'], values['isbn'], published, values['first_name'], values['last_name']
+
+    def taken_isbns(self, isbns):
+        taken = set()
+        books = Book.objects.using(self.using)
+        batch_size = connections[self.using].ops.bulk_batch_size(['isbn'], isbns)
+        for batch in chunked(list(isbns), batch_size):
+            taken.update(books.filter(isbn__in=batch).values_list('isbn', flat=True))
+        return taken
+
+    def import_batch(self, records):
+        """
+        Writes the valid records of a batch of (number, record) pairs and
+        returns how many books and authors it created and a list of
+        (number, error) pairs for the records it skipped.
+        """
+        if self.authors is None:
+            self.authors = self.load_authors()
+
+        errors = []
+        cleaned = []
+        seen = set()
+        for number, record in records:
+            try:
+                row = self.clean(record)
+            except ValueError as e:
+                errors.append((number, six.text_type(e)))
+                continue
+            if row[1] in seen:
+                errors.append((number, 'isbn %s is repeated' % row[1]))
+                continue
+            seen.add(row[1])
+            cleaned.append((number, row))
+
+        taken = self.taken_isbns(seen)
+        now = timezone.now()
+        new_authors = []
+        books = []
+        with transaction.atomic(using=self.using):
+            for number, (title, isbn, published, first_name, last_name) in cleaned:
+                if isbn in taken:
+                    errors.append((number, 'isbn %s already exists' % isbn))
+                    continue
+                key = (first_name, last_name)
+                if key not in self.authors:
+                    self.authors[key] = None
+                    new_authors.append(key)
+                books.append([title, key, isbn, published, now, now])
+
+            try:
+                ids = reserve_ids(Author, len(new_authors), self.using)
+                for key, pk in zip(new_authors, ids):
+                    self.authors[key] = pk
+                insert_rows(Author, ('id', 'first_name', 'last_name', 'created', 'updated'), [
+                    (pk,) + key + (now, now) for key, pk in zip(new_authors, ids)
+                ], self.method, self.using)
+                for book in books:
+                    book[1] = self.authors[book[1]]
+                insert_rows(Book, ('title', 'author', 'isbn', 'published', 'created', 'updated'),
+                            books, self.method, self.using)
+                add_book_counts(Counter(book[1] for book in books), self.using)
+            except Exception:
+                # The authors were rolled back, so forget them.
+                for key in new_authors:
+                    self.authors.pop(key, None)
+                raise
+
+        errors.sort()
+        return len(books), len(new_authors), errors
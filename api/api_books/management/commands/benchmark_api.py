@@ -0,0 +1,142 @@
+from __future__ import unicode_literals
+
+import json
+import multiprocessing
+import os
+import platform
+from collections import OrderedDict
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils.six.moves import input
+
+from api_books.benchmarks.loadgen import run_load
+from api_books.benchmarks.seed import seed_catalog
+from api_books.benchmarks.servers import gunicorn
+from api_books.benchmarks.suite import compare_results, delete_created, get_scenarios
+from api_books.models import Author, Book
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                        'benchmarks', 'baseline.json')
+
+
+class Command(BaseCommand):
+    help = ('Seeds catalogs of each size and drives every endpoint of '
+            'api_books.urls with concurrent clients against sync gunicorn '
+            'workers, reporting throughput and p50/p95/p99 latency. Compares '
+            'the results with the baseline and fails when a scenario is '
+            'worse than it by more than the threshold, or saves them as the '
+            'new baseline.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10000,100000,1000000',
+            help='Comma separated numbers of books, with a tenth as many authors. '
+                 'Defaults to 10000,100000,1000000.')
+        parser.add_argument('--scenarios', default=None,
+            help='Comma separated scenarios to run. Defaults to all of them.')
+        parser.add_argument('--workers', type=int, default=2,
+            help='Worker processes of the server. Defaults to 2.')
+        parser.add_argument('--concurrency', type=int, default=8,
+            help='Concurrent clients. Defaults to 8.')
+        parser.add_argument('--duration', type=float, default=5,
+            help='Seconds each scenario runs for. Defaults to 5.')
+        parser.add_argument('--port', type=int, default=8766,
+            help='Port the server listens on. Defaults to 8766.')
+        parser.add_argument('--baseline', default=BASELINE,
+            help='Baseline results file. Defaults to api_books/benchmarks/baseline.json.')
+        parser.add_argument('--threshold', type=float, default=0.25,
+            help='Fraction by which a result may be worse than the baseline. Defaults to 0.25.')
+        parser.add_argument('--save-baseline', action='store_true', default=False,
+            help='Writes the results to the baseline file instead of comparing them.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        try:
+            __import__('gunicorn')
+        except ImportError:
+            raise CommandError('gunicorn is not installed; install requirements/production.txt.')
+
+        if options['interactive']:
+            confirm = input('This will seed the default database, update rows of it and start a server '
+                            'against it. Type \'yes\' to continue: ')
+            if confirm != 'yes':
+                raise CommandError('Benchmark cancelled.')
+
+        call_command('migrate', verbosity=0)
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        names = options['scenarios'].split(',') if options['scenarios'] else None
+        config = OrderedDict([
+            ('workers', options['workers']),
+            ('concurrency', options['concurrency']),
+            ('duration', options['duration']),
+            ('database', connection.vendor),
+            ('cpus', multiprocessing.cpu_count()),
+            ('python', platform.python_version()),
+        ])
+
+        results = OrderedDict()
+        self.stdout.write('%9s %-28s %10s %8s %8s %8s %7s' % (
+            'books', 'scenario', 'req/s', 'p50 ms', 'p95 ms', 'p99 ms', 'errors'
+        ))
+        for size in sizes:
+            # Rows left by an interrupted run would change what is measured.
+            delete_created()
+            self.seed(size)
+            scenarios = get_scenarios()
+            if names is not None:
+                unknown = set(names) - set(scenarios)
+                if unknown:
+                    raise CommandError('Unknown scenarios: %s.' % ', '.join(sorted(unknown)))
+                scenarios = OrderedDict((name, scenarios[name]) for name in names)
+
+            results[str(size)] = size_results = OrderedDict()
+            # A new server for each size, so that no size reads the
+            # responses cached by another.
+            with gunicorn('config.wsgi', options['port'], options['workers']):
+                for name, requests in scenarios.items():
+                    # Loads the views and warms the connections of every worker.
+                    run_load('127.0.0.1', options['port'], requests, options['workers'] * 2, 0.5)
+                    result = run_load('127.0.0.1', options['port'], requests,
+                                      options['concurrency'], options['duration'])
+                    size_results[name] = result.as_dict()
+                    self.stdout.write('%9d %-28s %10.1f %8.1f %8.1f %8.1f %7d' % (
+                        size, name, result.throughput, result.percentile_ms(0.50) or 0,
+                        result.percentile_ms(0.95) or 0, result.percentile_ms(0.99) or 0,
+                        result.errors
+                    ))
+            delete_created()
+
+        if options['save_baseline']:
+            with open(options['baseline'], 'w') as f:
+                json.dump(OrderedDict([('config', config), ('results', results)]), f, indent=2)
+                f.write('\n')
+            self.stdout.write('Saved the baseline to %s.' % options['baseline'])
+            return
+
+        if not os.path.exists(options['baseline']):
+            raise CommandError('There is no baseline at %s; run with --save-baseline first.'
+                               % options['baseline'])
+        with open(options['baseline']) as f:
+            baseline = json.load(f)
+        if baseline['config'] != config:
+            self.stdout.write('The baseline was run with %s, and these results with %s: compare them '
+                              'with care.' % (json.dumps(baseline['config']), json.dumps(config)))
+
+        regressions = compare_results(baseline['results'], results, options['threshold'])
+        for size, name, description in regressions:
+            self.stderr.write('%s books, %s: %s' % (size, name, description))
+        if regressions:
+            raise CommandError('%d results are more than %d%% worse than the baseline.' % (
+                len(regressions), options['threshold'] * 100))
+        self.stdout.write('No result is more than %d%% worse than the baseline.' % (options['threshold'] * 100))
+
+    def seed(self, size):
+        missing_authors = max(size // 10 - Author.objects.count(), 0)
+        missing_books = max(size - Book.objects.count(), 0)
+        if missing_authors or missing_books:
+            self.stdout.write('Seeding %d authors and %d books...' % (missing_authors, missing_books))
+            seed_catalog(missing_books, missing_authors)
+            call_command('rebuild_search_index', verbosity=0)
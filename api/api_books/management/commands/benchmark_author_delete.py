@@ -0,0 +1,94 @@
+from __future__ import unicode_literals
+
+import gc
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.test.utils import override_settings
+from django.utils.six.moves import input
+
+from api_books.benchmarks.synthetic import BOOK_COLUMNS, CatalogGenerator
+from api_books.deletion import delete_author
+from api_books.loading import default_method, insert_rows, iter_batches, reserve_ids
+from api_books.models import Author, Book
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def seed_author(books, using):
+    """
+    Creates an author with the given number of books and returns its id.
+    """
+    author = Author.objects.using(using).create(first_name='Prolific', last_name='Author', book_count=books)
+    first_id = reserve_ids(Book, books, using)[0] if books else 1
+    rows = CatalogGenerator(1, books).book_rows(first_author_id=author.id, first_id=first_id)
+    method = default_method(using)
+    with transaction.atomic(using=using):
+        for batch in iter_batches(rows, 10000):
+            insert_rows(Book, BOOK_COLUMNS, batch, method, using)
+    return author.id
+
+
+def delete_with_collector(author_id, using, batch_size):
+    with transaction.atomic(using=using):
+        Author.objects.using(using).get(id=author_id).delete()
+
+
+def delete_in_batches(author_id, using, batch_size):
+    with transaction.atomic(using=using):
+        delete_author(author_id, batch_size, using)
+
+
+class Command(BaseCommand):
+    help = ('Deletes authors with more and more books, with Django\'s '
+            'collector and with the batched deletes of the authors endpoint, '
+            'and reports the time and peak Python memory each took.')
+
+    strategies = (
+        ('collector', delete_with_collector),
+        ('batched', delete_in_batches),
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,100000',
+            help='Comma separated numbers of books of the author. Defaults to 1000,10000,100000.')
+        parser.add_argument('--batch-size', type=int, default=500,
+            help='Books deleted per statement by the batched deletes. Defaults to 500.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to benchmark. Defaults to the "default" database.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        if tracemalloc is None:
+            raise CommandError('Measuring memory needs tracemalloc, from Python 3.4.')
+        database = options['database']
+
+        if options['interactive']:
+            confirm = input('This will add and delete authors and books of the %r database. '
+                            'Type \'yes\' to continue: ' % database)
+            if confirm != 'yes':
+                raise CommandError('Benchmark cancelled.')
+
+        call_command('migrate', database=database, verbosity=0)
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+
+        self.stdout.write('%9s %-10s %10s %12s' % ('books', 'strategy', 'seconds', 'peak (MB)'))
+        # DEBUG would keep every query, which takes memory too.
+        with override_settings(DEBUG=False):
+            for size in sizes:
+                for name, delete in self.strategies:
+                    author_id = seed_author(size, database)
+                    gc.collect()
+                    tracemalloc.start()
+                    start = time.time()
+                    delete(author_id, database, options['batch_size'])
+                    elapsed = time.time() - start
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                    self.stdout.write('%9d %-10s %10.2f %12.1f' % (size, name, elapsed, peak / 1024.0 / 1024))
@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import time
+from datetime import date, timedelta
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils import timezone
+from django.utils.six.moves import input
+
+from api_books.benchmarks.seed import seed_catalog
+from api_books.models import Author, Book
+
+
+# The last migration without the lookup and sort indexes.
+MIGRATION_BEFORE_INDEXES = '0001_initial'
+
+
+def explain(queryset, connection):
+    """
+    Returns the query plan of queryset as a list of lines.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            return [row[-1] for row in cursor.fetchall()]
+        cursor.execute('EXPLAIN ' + sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def median_ms(queryset, repeat):
+    """
+    Runs queryset repeat times and returns the median wall time in ms.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        list(queryset.all())
+        timings.append((time.time() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+class Command(BaseCommand):
+    help = ('Seeds the catalog and compares query plans and latencies of the '
+            'lookup, sort and sync queries with and without the indexes added '
+            'in api_books 0002. This migrates api_books backwards and forwards, '
+            'so run it against a scratch database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--books', type=int, default=1000000,
+            help='Number of books the catalog should hold. Defaults to 1000000.')
+        parser.add_argument('--authors', type=int, default=50000,
+            help='Number of authors the catalog should hold. Defaults to 50000.')
+        parser.add_argument('--repeat', type=int, default=5,
+            help='Times each query is run; the median is reported. Defaults to 5.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to benchmark. Defaults to the "default" database.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        database = options['database']
+        connection = connections[database]
+
+        if options['interactive']:
+            confirm = input('This will seed and migrate the %r database back and forth. '
+                            'Type \'yes\' to continue: ' % database)
+            if confirm != 'yes':
+                raise CommandError('Benchmark cancelled.')
+
+        call_command('migrate', database=database, verbosity=0)
+        missing_authors = max(options['authors'] - Author.objects.using(database).count(), 0)
+        missing_books = max(options['books'] - Book.objects.using(database).count(), 0)
+        if missing_authors or missing_books:
+            self.stdout.write('Seeding %d authors and %d books...' % (missing_authors, missing_books))
+            seed_catalog(missing_books, missing_authors, using=database)
+
+        queries = self.get_queries(database)
+        results = {}
+        for label, target in (('before', MIGRATION_BEFORE_INDEXES), ('after', None)):
+            args = ['api_books', target] if target else ['api_books']
+            call_command('migrate', *args, database=database, verbosity=0)
+            for name, queryset in queries:
+                results[(label, name)] = (
+                    median_ms(queryset, options['repeat']),
+                    explain(queryset, connection)
+                )
+
+        self.stdout.write('\n%-24s %12s %12s %9s' % ('query', 'before (ms)', 'after (ms)', 'speedup'))
+        for name, queryset in queries:
+            before, after = results[('before', name)][0], results[('after', name)][0]
+            self.stdout.write('%-24s %12.2f %12.2f %8.1fx' % (
+                name, before, after, before / after if after else float('inf')
+            ))
+
+        for name, queryset in queries:
+            self.stdout.write('\n%s' % name)
+            for label in ('before', 'after'):
+                for line in results[(label, name)][1]:
+                    self.stdout.write('  %-6s %s' % (label, line))
+
+    def get_queries(self, database):
+        books = Book.objects.using(database)
+        authors = Author.objects.using(database)
+        middle = books.order_by('id').values_list('isbn', 'title', 'author_id')[books.count() // 2]
+        author = authors.get(id=middle[2])
+        watermark = timezone.now() - timedelta(days=1)
+
+        return [
+            ('book by isbn', books.filter(isbn=middle[0])),
+            ('book title prefix', books.filter(title__startswith=middle[1][:-2])[:50]),
+            ('books by title', books.order_by('title')[:50]),
+            ('author by name', authors.filter(last_name=author.last_name, first_name=author.first_name)),
+            ('books published in 1990', books.filter(
+                published__range=(date(1990, 1, 1), date(1990, 12, 31))
+            ).order_by('published')[:100]),
+            ('books updated since', books.filter(updated__gt=watermark).order_by('updated')[:1000]),
+            ('authors updated since', authors.filter(updated__gt=watermark).order_by('updated')[:1000]),
+        ]
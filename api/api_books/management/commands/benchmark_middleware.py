@@ -0,0 +1,109 @@
+from __future__ import unicode_literals
+
+import time
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.utils.six.moves import input
+
+from api_books.benchmarks.seed import seed_catalog
+from api_books.models import Author, Book
+
+
+def start_response(status, headers, exc_info=None):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Compares the time and queries per request of API requests that '
+            'go through the whole middleware stack with those that go through '
+            'the API middleware profile, from anonymous clients and from '
+            'browsers with a session.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000,
+            help='Requests sent for each case. Defaults to 2000.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        if options['interactive']:
+            confirm = input('This will add a user, a session and books to the default database. '
+                            'Type \'yes\' to continue: ')
+            if confirm != 'yes':
+                raise CommandError('Benchmark cancelled.')
+
+        call_command('migrate', verbosity=0)
+        if not Book.objects.exists():
+            seed_catalog(100, 10)
+
+        self.stdout.write('\n%-32s %12s %12s %10s %9s' % (
+            'case', 'full (us)', 'api (us)', 'saved (us)', 'queries'
+        ))
+        for name, environ in self.get_cases():
+            timings = []
+            for routes in ((), settings.MIDDLEWARE_PROFILE_ROUTES):
+                with override_settings(MIDDLEWARE_PROFILE_ROUTES=routes):
+                    timings.append(self.measure(environ, options['requests']))
+            (full, full_queries), (api, api_queries) = timings
+            self.stdout.write('%-32s %12.1f %12.1f %10.1f %4d ->%2d' % (
+                name, full * 1e6, api * 1e6, (full - api) * 1e6, full_queries, api_queries
+            ))
+
+    def measure(self, environ, requests):
+        """
+        Returns the mean seconds and the queries per request of a new
+        handler, which loads the middleware of the current settings.
+        """
+        handler = WSGIHandler()
+        # Loads the middleware and fills the response cache.
+        list(handler(dict(environ), start_response))
+
+        # The query log is reset as each request starts.
+        connection.force_debug_cursor = True
+        try:
+            list(handler(dict(environ), start_response))
+            queries = len(connection.queries_log)
+        finally:
+            connection.force_debug_cursor = False
+
+        start = time.time()
+        for _ in range(requests):
+            list(handler(dict(environ), start_response))
+        return (time.time() - start) / requests, queries
+
+    def get_cases(self):
+        factory = RequestFactory()
+        author = Author.objects.order_by('id').first()
+        session = self.get_session()
+        paths = [
+            ('author', reverse('author-detail', args=[author.id])),
+            ('authors', reverse('author-list')),
+        ]
+        for name, path in paths:
+            environ = factory.get(path, HTTP_ACCEPT='application/json').environ
+            yield 'GET %s, anonymous' % name, environ
+            environ = factory.get(path, HTTP_ACCEPT='application/json').environ
+            environ['HTTP_COOKIE'] = '%s=%s' % (settings.SESSION_COOKIE_NAME, session.session_key)
+            yield 'GET %s, browser session' % name, environ
+
+    def get_session(self):
+        """
+        Returns the session of a logged in user, as a browser using the API
+        after logging in to the admin has.
+        """
+        user, created = get_user_model().objects.get_or_create(username='benchmark-middleware')
+        session = SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        return session
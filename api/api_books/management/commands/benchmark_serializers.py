@@ -0,0 +1,99 @@
+from __future__ import unicode_literals
+
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.six.moves import input
+
+from rest_framework.renderers import JSONRenderer
+
+from api_books.benchmarks.seed import seed_catalog
+from api_books.converters import compile_converter
+from api_books.models import Author, Book
+from api_books.renderers import FastJSONRenderer, orjson
+from api_books.serializers import AuthorSerializer, BookSerializer
+
+
+def best_time(function, repeat):
+    """
+    Runs function repeat times and returns its fastest wall time in seconds
+    and its last result.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        result = function()
+        timings.append(time.time() - start)
+    return min(timings), result
+
+
+class Command(BaseCommand):
+    help = ('Seeds the catalog and compares the rows per second of book and '
+            'author lists serialized from model instances by the serializers '
+            'and from values() rows by their compiled converters, and of '
+            'rendering them with JSONRenderer and FastJSONRenderer.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000,
+            help='Number of books and authors in each list. Defaults to 10000.')
+        parser.add_argument('--repeat', type=int, default=5,
+            help='Times each step is run; the fastest is reported. Defaults to 5.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to benchmark. Defaults to the "default" database.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        database = options['database']
+        rows, repeat = options['rows'], options['repeat']
+
+        if options['interactive']:
+            confirm = input('This will seed the %r database. Type \'yes\' to continue: ' % database)
+            if confirm != 'yes':
+                raise CommandError('Benchmark cancelled.')
+
+        call_command('migrate', database=database, verbosity=0)
+        missing_authors = max(rows - Author.objects.using(database).count(), 0)
+        missing_books = max(rows - Book.objects.using(database).count(), 0)
+        if missing_authors or missing_books:
+            self.stdout.write('Seeding %d authors and %d books...' % (missing_authors, missing_books))
+            seed_catalog(missing_books, missing_authors, using=database)
+
+        if orjson is None:
+            self.stdout.write('orjson is not installed, so FastJSONRenderer renders as JSONRenderer.')
+
+        self.stdout.write('\n%-8s %-22s %15s %15s %9s' % ('list', 'step', 'before (rows/s)',
+                                                          'after (rows/s)', 'speedup'))
+        lists = (
+            ('books', Book.objects.using(database).select_related('author'), BookSerializer),
+            ('authors', Author.objects.using(database).all(), AuthorSerializer),
+        )
+        for name, queryset, serializer_class in lists:
+            queryset = queryset.order_by('id')[:rows]
+            converter = compile_converter(serializer_class())
+
+            instances = list(queryset)
+            values = list(queryset.values(*converter.columns))
+            steps = [
+                ('query', lambda: list(queryset.all()), lambda: list(queryset.values(*converter.columns))),
+                ('serialize', lambda: serializer_class(instances, many=True).data,
+                    lambda: converter.convert_all(values)),
+            ]
+            results = []
+            for step, before, after in steps:
+                results.append((step,) + best_time(before, repeat) + best_time(after, repeat))
+
+            data = results[-1][2], results[-1][4]
+            results.append(('render',) + best_time(lambda: JSONRenderer().render(data[0]), repeat) +
+                           best_time(lambda: FastJSONRenderer().render(data[1]), repeat))
+            if results[-1][2] != results[-1][4]:
+                raise CommandError('The %s rendered from values() rows differ from the serializers\'.' % name)
+
+            results.append(('total', sum(result[1] for result in results), None,
+                            sum(result[3] for result in results), None))
+            for step, before, _, after, _ in results:
+                self.stdout.write('%-8s %-22s %15.0f %15.0f %8.1fx' % (
+                    name, step, len(instances) / before, len(instances) / after, before / after
+                ))
@@ -0,0 +1,99 @@
+from __future__ import unicode_literals
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import reverse
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.six.moves import input
+
+from api_books.benchmarks.loadgen import SlowClients, run_load
+from api_books.benchmarks.seed import seed_catalog
+from api_books.benchmarks.servers import gunicorn, tree_rss_kb
+from api_books.models import Author, Book
+
+
+class Command(BaseCommand):
+    help = ('Seeds the catalog and compares the throughput and latency of the '
+            'book and author list and detail endpoints served by sync gunicorn '
+            'workers with config.wsgi_heroku and by uvicorn workers with '
+            'config.asgi, both with the same number of worker processes, and '
+            'their memory use.')
+
+    # Both run under gunicorn, which manages the same number of worker
+    # processes for each; uvicorn's own --workers mode adds ~40 ms to every
+    # response as it leaves Nagle's algorithm on.
+    servers = [
+        ('wsgi', 'config.wsgi_heroku', 'sync'),
+        ('asgi', 'config.asgi:application', 'uvicorn.workers.UvicornWorker'),
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument('--books', type=int, default=10000,
+            help='Number of books the catalog should hold. Defaults to 10000.')
+        parser.add_argument('--authors', type=int, default=1000,
+            help='Number of authors the catalog should hold. Defaults to 1000.')
+        parser.add_argument('--workers', type=int, default=2,
+            help='Worker processes of each server. Defaults to 2.')
+        parser.add_argument('--concurrency', default='1,8,32,128',
+            help='Comma separated numbers of concurrent clients. Defaults to 1,8,32,128.')
+        parser.add_argument('--duration', type=float, default=10,
+            help='Seconds each concurrency level runs for. Defaults to 10.')
+        parser.add_argument('--slow-clients', type=int, default=0,
+            help='Clients that trickle their requests in during each run. Defaults to 0.')
+        parser.add_argument('--port', type=int, default=8765,
+            help='Port the servers listen on. Defaults to 8765.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        for module in ('gunicorn', 'uvicorn'):
+            try:
+                __import__(module)
+            except ImportError:
+                raise CommandError('%s is not installed; install requirements/asgi.txt.' % module)
+
+        if options['interactive']:
+            confirm = input('This will seed the default database and start the servers against it. '
+                            'Type \'yes\' to continue: ')
+            if confirm != 'yes':
+                raise CommandError('Benchmark cancelled.')
+
+        call_command('migrate', verbosity=0)
+        missing_authors = max(options['authors'] - Author.objects.count(), 0)
+        missing_books = max(options['books'] - Book.objects.count(), 0)
+        if missing_authors or missing_books:
+            self.stdout.write('Seeding %d authors and %d books...' % (missing_authors, missing_books))
+            seed_catalog(missing_books, missing_authors, using=DEFAULT_DB_ALIAS)
+
+        requests = self.get_requests()
+        concurrencies = [int(value) for value in options['concurrency'].split(',')]
+        port = options['port']
+
+        self.stdout.write('\n%-6s %5s %9s %10s %8s %8s %8s %7s' % (
+            'server', 'conc', 'RSS (MB)', 'req/s', 'p50 ms', 'p95 ms', 'p99 ms', 'errors'
+        ))
+        for name, application, worker_class in self.servers:
+            with gunicorn(application, port, options['workers'], worker_class) as process:
+                # Warm every worker up before measuring.
+                run_load('127.0.0.1', port, requests, options['workers'] * 2, 1)
+                for concurrency in concurrencies:
+                    with SlowClients('127.0.0.1', port, options['slow_clients'], requests[0][1]):
+                        result = run_load('127.0.0.1', port, requests, concurrency, options['duration'])
+                        rss = tree_rss_kb(process.pid)
+                    self.stdout.write('%-6s %5d %9s %10.1f %8.1f %8.1f %8.1f %7d' % (
+                        name, concurrency, '%.1f' % (rss / 1024.0) if rss is not None else 'n/a',
+                        result.throughput, result.percentile_ms(0.50) or 0,
+                        result.percentile_ms(0.95) or 0, result.percentile_ms(0.99) or 0,
+                        result.errors
+                    ))
+
+    def get_requests(self):
+        book = Book.objects.order_by('id').values_list('id', flat=True)[Book.objects.count() // 2]
+        author = Author.objects.order_by('id').values_list('id', flat=True)[Author.objects.count() // 2]
+        headers = {'Accept': 'application/json'}
+        return [
+            ('GET', reverse('book-list'), None, headers),
+            ('GET', reverse('book-detail', args=[book]), None, headers),
+            ('GET', reverse('author-list'), None, headers),
+            ('GET', reverse('author-detail', args=[author]), None, headers),
+        ]
@@ -0,0 +1,107 @@
+from __future__ import unicode_literals
+
+import io
+import os
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+STATIC_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'static')
+
+# Bundles loaded by templates/api_books/index.html, in load order. Sources
+# that ship minified are used as they are, the others are minified.
+BUNDLES = OrderedDict([
+    ('swagger-ui/dist/docs.min.css', [
+        'swagger-ui/css/typography.css',
+        'swagger-ui/css/reset.css',
+        'swagger-ui/css/screen.css',
+    ]),
+    ('swagger-ui/dist/docs-print.min.css', [
+        'swagger-ui/css/reset.css',
+        'swagger-ui/css/print.css',
+    ]),
+    ('swagger-ui/dist/docs.min.js', [
+        'swagger-ui/lib/object-assign-pollyfill.js',
+        'swagger-ui/lib/jquery-1.8.0.min.js',
+        'swagger-ui/lib/jquery.slideto.min.js',
+        'swagger-ui/lib/jquery.wiggle.min.js',
+        'swagger-ui/lib/jquery.ba-bbq.min.js',
+        'swagger-ui/lib/handlebars-4.0.5.js',
+        'swagger-ui/lib/lodash.min.js',
+        'swagger-ui/lib/backbone-min.js',
+        'swagger-ui/swagger-ui.min.js',
+        'swagger-ui/lib/highlight.9.1.0.pack.js',
+        'swagger-ui/lib/highlight.9.1.0.pack_extended.js',
+        'swagger-ui/lib/jsoneditor.min.js',
+        'swagger-ui/lib/marked.js',
+        'swagger-ui/lib/swagger-oauth.js',
+    ]),
+])
+
+HEADER = '/* Built by `manage.py build_docs_assets` from %s. Do not edit. */\n'
+
+
+def is_minified(name):
+    return name.endswith(('.min.js', '-min.js', '.pack.js'))
+
+
+def build_bundle(name):
+    """
+    Returns the contents of the bundle name.
+    """
+    try:
+        import rcssmin
+        import rjsmin
+    except ImportError:
+        raise CommandError('Building the docs assets needs rjsmin and rcssmin: '
+                           'pip install -r requirements/local.txt')
+
+    parts = []
+    for source in BUNDLES[name]:
+        with io.open(os.path.join(STATIC_ROOT, source), encoding='utf-8') as source_file:
+            content = source_file.read()
+        if name.endswith('.css'):
+            content = rcssmin.cssmin(content, keep_bang_comments=True)
+        elif not is_minified(source):
+            content = rjsmin.jsmin(content, keep_bang_comments=True)
+        parts.append(content.strip())
+
+    # Scripts are joined with semicolons as some do not end with one.
+    separator = '\n' if name.endswith('.css') else ';\n'
+    sources = ', '.join(os.path.basename(source) for source in BUNDLES[name])
+    return HEADER % sources + separator.join(parts) + '\n'
+
+
+class Command(BaseCommand):
+    help = ('Bundles and minifies the scripts and styles of the API docs page '
+            'into swagger-ui/dist. Run it after changing any of their sources; '
+            'collectstatic then fingerprints and compresses the bundles.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', default=False,
+            help='Fails if any bundle is out of date instead of writing it.')
+
+    def handle(self, **options):
+        outdated = []
+        for name in BUNDLES:
+            path = os.path.join(STATIC_ROOT, name)
+            content = build_bundle(name)
+            try:
+                with io.open(path, encoding='utf-8') as bundle_file:
+                    current = bundle_file.read()
+            except IOError:
+                current = None
+            if current == content:
+                continue
+
+            outdated.append(name)
+            if not options['check']:
+                if not os.path.isdir(os.path.dirname(path)):
+                    os.makedirs(os.path.dirname(path))
+                with io.open(path, 'w', encoding='utf-8') as bundle_file:
+                    bundle_file.write(content)
+                self.stdout.write('Built %s (%d KB)' % (name, len(content.encode('utf-8')) // 1024))
+
+        if options['check'] and outdated:
+            raise CommandError('Out of date: %s. Run manage.py build_docs_assets.' % ', '.join(outdated))
@@ -0,0 +1,143 @@
+from __future__ import unicode_literals
+
+import shutil
+import time
+from argparse import ArgumentTypeError
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.six.moves import input
+
+from api_books.benchmarks.synthetic import AUTHOR_COLUMNS, BOOK_COLUMNS, EPOCH, CatalogGenerator
+from api_books.counts import recount_books
+from api_books.loading import METHODS, default_method, insert_rows, iter_batches, reset_sequences
+from api_books.models import Author, Book
+
+
+def parse_now(value):
+    """
+    Parses the --now option as an ISO 8601 date and time, in UTC unless it
+    has an offset.
+    """
+    try:
+        now = parse_datetime(value)
+    except ValueError:
+        now = None
+    if now is None:
+        raise ArgumentTypeError('%r is not a date and time.' % value)
+    return now if timezone.is_aware(now) else timezone.make_aware(now, timezone.utc)
+
+
+class Command(BaseCommand):
+    help = ('Replaces the catalog with synthetic authors and books generated '
+            'from a seed: skewed books per author, titles of realistic '
+            'lengths, valid ISBN-13s and publication dates over decades. The '
+            'same seed and sizes always give the same rows. Reports the rows '
+            'written per second, and can snapshot the resulting SQLite '
+            'database or restore one instead of generating it.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--authors', type=int, default=100000,
+            help='Number of authors. Defaults to 100000.')
+        parser.add_argument('--books', type=int, default=1000000,
+            help='Number of books. Defaults to 1000000.')
+        parser.add_argument('--seed', type=int, default=0,
+            help='Seed of the generator. Defaults to 0.')
+        parser.add_argument('--skew', type=float, default=1.1,
+            help='Exponent of the Zipf weights of authors; higher gives more books '
+                 'to the most prolific ones. Defaults to 1.1.')
+        parser.add_argument('--now', type=parse_now, default=None,
+            help='Date and time, e.g. 2021-01-01T00:00:00Z, that rows are created and updated '
+                 'in the five years before. Defaults to %s.' % EPOCH.isoformat())
+        parser.add_argument('--method', choices=METHODS, default=None,
+            help='How rows are written. Defaults to copy on PostgreSQL and executemany elsewhere.')
+        parser.add_argument('--batch-size', type=int, default=10000,
+            help='Rows written per statement. Defaults to 10000.')
+        parser.add_argument('--snapshot', default=None,
+            help='Copies the SQLite database file to this path once generated.')
+        parser.add_argument('--restore', default=None,
+            help='Replaces the SQLite database file with this snapshot instead of generating rows.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to fill. Defaults to the "default" database.')
+        parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
+            help='Tells Django to NOT prompt the user for input of any kind.')
+
+    def handle(self, **options):
+        database = options['database']
+        self.verbosity = options['verbosity']
+        connection = connections[database]
+        if options['snapshot'] or options['restore']:
+            if connection.vendor != 'sqlite' or connection.is_in_memory_db(connection.settings_dict['NAME']):
+                raise CommandError('Snapshots need the %r database to be a SQLite file.' % database)
+
+        if options['interactive']:
+            confirm = input('This will delete every author and book of the %r database. '
+                            'Type \'yes\' to continue: ' % database)
+            if confirm != 'yes':
+                raise CommandError('Generation cancelled.')
+
+        if options['restore']:
+            start = time.time()
+            connection.close()
+            shutil.copyfile(options['restore'], connection.settings_dict['NAME'])
+            self.stdout.write('Restored %d authors and %d books from %s in %.1fs.' % (
+                Author.objects.using(database).count(), Book.objects.using(database).count(),
+                options['restore'], time.time() - start
+            ))
+            return
+
+        method = options['method'] or default_method(database)
+        if method == 'copy' and connection.vendor != 'postgresql':
+            raise CommandError('--method copy needs PostgreSQL.')
+
+        call_command('migrate', database=database, verbosity=0)
+        generator = CatalogGenerator(options['authors'], options['books'], options['seed'], options['skew'],
+                                     options['now'])
+        try:
+            with transaction.atomic(using=database):
+                self.clear(connection)
+                for model, columns, rows, count in (
+                    (Author, AUTHOR_COLUMNS, generator.author_rows(), options['authors']),
+                    (Book, BOOK_COLUMNS, generator.book_rows(), options['books']),
+                ):
+                    self.write(model, columns, rows, count, method, options['batch_size'], database)
+                reset_sequences([Author, Book], database)
+                recount_books(using=database)
+        except ValueError as e:
+            raise CommandError(e)
+
+        start = time.time()
+        call_command('rebuild_search_index', database=database, verbosity=0)
+        self.stdout.write('Rebuilt the search index in %.1fs.' % (time.time() - start))
+
+        if options['snapshot']:
+            connection.close()
+            shutil.copyfile(connection.settings_dict['NAME'], options['snapshot'])
+            self.stdout.write('Saved a snapshot to %s; restore it with --restore %s.' % (
+                options['snapshot'], options['snapshot']
+            ))
+
+    def clear(self, connection):
+        tables = [connection.ops.quote_name(model._meta.db_table) for model in (Book, Author)]
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('TRUNCATE %s CASCADE' % ', '.join(tables))
+            else:
+                for table in tables:
+                    cursor.execute('DELETE FROM %s' % table)
+
+    def write(self, model, columns, rows, count, method, batch_size, database):
+        name = model._meta.verbose_name_plural
+        start = time.time()
+        written = 0
+        for batch in iter_batches(rows, batch_size):
+            written += insert_rows(model, columns, batch, method, using=database)
+            if self.verbosity >= 2:
+                self.stdout.write('  %d of %d %s' % (written, count, name))
+        elapsed = time.time() - start
+        self.stdout.write('Wrote %d %s with %s in %.1fs (%.0f rows/s).' % (
+            written, name, method, elapsed, written / elapsed if elapsed else 0
+        ))
@@ -0,0 +1,121 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils import six
+
+from api_books.loading import METHODS, READERS, CatalogImporter, default_method, iter_batches
+from api_books.models import Author, Book
+from api_books.signals import rows_saved
+
+
+class Command(BaseCommand):
+    help = ('Imports books and their authors from a CSV or JSON catalog, '
+            'streaming the file and writing it in batches: with COPY on '
+            'PostgreSQL and executemany elsewhere. Authors are matched on '
+            'their first and last name. Invalid records and taken ISBNs are '
+            'skipped and reported. The number of records imported is saved '
+            'after each batch, so an interrupted import can be resumed.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('path',
+            help='CSV file with a header, JSON array or file with a JSON document per line.')
+        parser.add_argument('--format', choices=sorted(READERS), default=None,
+            help='Format of the file. Defaults to the one of its extension.')
+        parser.add_argument('--method', choices=METHODS, default=None,
+            help='How rows are written. Defaults to copy on PostgreSQL and executemany elsewhere.')
+        parser.add_argument('--batch-size', type=int, default=10000,
+            help='Records written per transaction. Defaults to 10000.')
+        parser.add_argument('--resume', action='store_true', default=False,
+            help='Skips the records an earlier run of the same file imported.')
+        parser.add_argument('--state', default=None,
+            help='File the progress is saved to. Defaults to the path followed by .import.')
+        parser.add_argument('--max-errors', type=int, default=None,
+            help='Stops after skipping more records than this. Defaults to no limit.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to import into. Defaults to the "default" database.')
+
+    def handle(self, **options):
+        path = options['path']
+        database = options['database']
+        if not os.path.isfile(path):
+            raise CommandError('There is no file at %s.' % path)
+
+        file_format = options['format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        if file_format not in READERS:
+            raise CommandError('Unknown format %r; pass --format.' % file_format)
+
+        method = options['method'] or default_method(database)
+        if method == 'copy' and connections[database].vendor != 'postgresql':
+            raise CommandError('--method copy needs PostgreSQL.')
+
+        state_path = options['state'] or path + '.import'
+        state = {'size': os.path.getsize(path), 'records': 0, 'books': 0, 'authors': 0, 'skipped': 0}
+        if options['resume'] and os.path.exists(state_path):
+            with io.open(state_path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved['size'] != state['size']:
+                raise CommandError('%s changed since it was saved in %s; import it without --resume.'
+                                   % (path, state_path))
+            state = saved
+            self.stdout.write('Resuming after %d records.' % state['records'])
+
+        records = enumerate(READERS[file_format](path), 1)
+        # Records are numbered as in the file, so skipped ones are still
+        # read, but not validated or written again.
+        records = islice(records, state['records'], None)
+        importer = CatalogImporter(method, database)
+
+        start = time.time()
+        imported = 0
+        batches = iter_batches(records, options['batch_size'])
+        while True:
+            try:
+                batch = next(batches)
+            except StopIteration:
+                break
+            except ValueError as e:
+                raise CommandError('Could not read %s after record %d: %s' % (path, state['records'], e))
+
+            books, authors, errors = importer.import_batch(batch)
+            imported += books
+            state['records'] = batch[-1][0]
+            state['books'] += books
+            state['authors'] += authors
+            state['skipped'] += len(errors)
+            self.save_state(state_path, state)
+
+            for number, error in errors:
+                self.stderr.write('Record %d: %s' % (number, error))
+            elapsed = time.time() - start
+            self.stdout.write('%d records read, %d books and %d authors created, %d skipped (%.0f books/s)' % (
+                state['records'], state['books'], state['authors'], state['skipped'],
+                imported / elapsed if elapsed else 0
+            ))
+            if options['max_errors'] is not None and state['skipped'] > options['max_errors']:
+                raise CommandError('Stopped after skipping %d records; fix them and run again with --resume.'
+                                   % state['skipped'])
+
+        # The rows were written without the models, so tell the caches and
+        # rebuild the search index at once.
+        rows_saved.send(sender=Author, ids=None, created=True)
+        rows_saved.send(sender=Book, ids=None, created=True)
+        call_command('rebuild_search_index', database=database, verbosity=0)
+
+        elapsed = time.time() - start
+        self.stdout.write('Imported %d books in %.1fs (%.0f books/s).' % (
+            imported, elapsed, imported / elapsed if elapsed else 0
+        ))
+
+    def save_state(self, path, state):
+        # Written aside and renamed, so a crash never leaves half a file.
+        with io.open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(six.text_type(json.dumps(state)))
+        os.rename(path + '.tmp', path)
@@ -0,0 +1,22 @@
+from __future__ import unicode_literals
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from api_books.search import get_backend
+
+
+class Command(BaseCommand):
+    help = ('Rebuilds the full-text search index of book titles and author '
+            'names, e.g. after loading rows without the API.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to reindex. Defaults to the "default" database.')
+
+    def handle(self, **options):
+        backend = get_backend(options['database'])
+        with transaction.atomic(using=options['database']):
+            backend.rebuild()
+        if options['verbosity'] >= 1:
+            self.stdout.write('Rebuilt the search index with %s.' % type(backend).__name__)
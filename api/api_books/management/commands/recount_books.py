@@ -0,0 +1,20 @@
+from __future__ import unicode_literals
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from api_books.counts import recount_books
+
+
+class Command(BaseCommand):
+    help = ('Counts the books of every author again, e.g. after writing '
+            'books without the API.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to recount. Defaults to the "default" database.')
+
+    def handle(self, **options):
+        with transaction.atomic(using=options['database']):
+            recount_books(using=options['database'])
+        self.stdout.write('Recounted the books of every author.')
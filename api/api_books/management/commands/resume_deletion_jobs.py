@@ -0,0 +1,24 @@
+from __future__ import unicode_literals
+
+from django.core.management.base import BaseCommand
+
+from api_books.deletion import run_deletion
+from api_books.models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = ('Runs the author deletion jobs left pending or running, e.g. by a '
+            'process that was killed, until they are done.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+            help='Books deleted per statement. Defaults to 500.')
+
+    def handle(self, **options):
+        jobs = DeletionJob.objects.filter(status__in=(DeletionJob.PENDING, DeletionJob.RUNNING))
+        for job_id in jobs.order_by('id').values_list('id', flat=True):
+            run_deletion(job_id, options['batch_size'])
+            job = DeletionJob.objects.get(id=job_id)
+            self.stdout.write('Job %d: %s, %d books of author %d deleted.' % (
+                job.id, job.status, job.books_deleted, job.author_id
+            ))
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import datetime
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_books', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='author',
+            name='updated',
+            field=models.DateTimeField(db_index=True, auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='isbn',
+            field=models.CharField(max_length=13, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='published',
+            field=models.DateField(db_index=True, default=datetime.date.today),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='title',
+            field=models.CharField(max_length=250, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='updated',
+            field=models.DateTimeField(db_index=True, auto_now=True),
+        ),
+        migrations.AlterIndexTogether(
+            name='author',
+            index_together=set([('last_name', 'first_name')]),
+        ),
+    ]
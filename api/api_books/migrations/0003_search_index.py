@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+from django.db.utils import OperationalError
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Creates and fills the full-text index used by api_books.search: an FTS5
+    table on SQLite, a tsvector table with a GIN index on PostgreSQL. Other
+    databases, or SQLite builds without FTS5, fall back to icontains scans.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        try:
+            schema_editor.execute(
+                "CREATE VIRTUAL TABLE api_books_search USING fts5("
+                "title, author, tokenize='unicode61 remove_diacritics 1')"
+            )
+        except OperationalError:
+            return
+        schema_editor.execute(
+            "INSERT INTO api_books_search (rowid, title, author) "
+            "SELECT b.id, b.title, a.first_name || ' ' || a.last_name "
+            "FROM api_books_book b INNER JOIN api_books_author a ON a.id = b.author_id"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE TABLE api_books_search ("
+            "book_id integer PRIMARY KEY REFERENCES api_books_book (id) "
+            "ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            "document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX api_books_search_document ON api_books_search USING GIN (document)"
+        )
+        schema_editor.execute(
+            "INSERT INTO api_books_search (book_id, document) "
+            "SELECT b.id, setweight(to_tsvector('simple', b.title), 'A') || "
+            "setweight(to_tsvector('simple', a.first_name || ' ' || a.last_name), 'B') "
+            "FROM api_books_book b INNER JOIN api_books_author a ON a.id = b.author_id"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute('DROP TABLE IF EXISTS api_books_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_books', '0002_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
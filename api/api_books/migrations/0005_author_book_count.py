@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def count_books(apps, schema_editor):
+    schema_editor.execute(
+        "UPDATE api_books_author SET book_count = ("
+        "SELECT COUNT(*) FROM api_books_book WHERE api_books_book.author_id = api_books_author.id)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_books', '0004_deletionjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='book_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_books, migrations.RunPython.noop),
+        migrations.AlterIndexTogether(
+            name='book',
+            index_together=set([('author', 'created', 'id')]),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_books', '0005_author_book_count'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='author',
+            index_together=set([('created', 'id'), ('last_name', 'first_name')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='book',
+            index_together=set([('created', 'id'), ('author', 'created', 'id')]),
+        ),
+    ]
@@ -14,9 +14,19 @@ class Author(models.Model):
     """
     first_name = models.CharField(max_length=70)
     last_name = models.CharField(max_length=100)
+    # Kept up to date by the API's writes (see api_books.counts), so lists
+    # of authors need no COUNT per row.
+    book_count = models.IntegerField(default=0, editable=False)
 
     created = models.DateTimeField(auto_now_add=True)
-    updated = models.DateTimeField(auto_now=True)
+    updated = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        index_together = [
+            ('last_name', 'first_name'),
+            # Page the authors in the default order with one range scan.
+            ('created', 'id'),
+        ]
 
     def __str__(self):
         return self.first_name + " " + self.last_name
@@ -29,17 +39,54 @@ class Book(models.Model):
     """
     These are the Book model fields.
     """
-    title = models.CharField(max_length=250)
+    title = models.CharField(max_length=250, db_index=True)
     author = models.ForeignKey(Author)
-    isbn = models.CharField(max_length=13)
+    isbn = models.CharField(max_length=13, unique=True)
 
-    published = models.DateField(default=date.today)
+    published = models.DateField(default=date.today, db_index=True)
 
     created = models.DateTimeField(auto_now_add=True)
-    updated = models.DateTimeField(auto_now=True)
+    updated = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        # Page the books, and an author's books, in the default order with
+        # one range scan.
+        index_together = [
+            ('author', 'created', 'id'),
+            ('created', 'id'),
+        ]
 
     def __str__(self):
         return self.title
 
     def __unicode__(self):
         return u"%s" % (self.title)
+
+
+@python_2_unicode_compatible
+class DeletionJob(models.Model):
+    """
+    An author being deleted with their books in the background.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    )
+
+    # Not a foreign key: the author is gone once the job is done.
+    author_id = models.IntegerField(db_index=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    books_deleted = models.IntegerField(default=0)
+    error = models.TextField(blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return "Deletion of author %s (%s)" % (self.author_id, self.status)
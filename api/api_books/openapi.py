@@ -0,0 +1,534 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+from collections import OrderedDict
+from inspect import cleandoc
+
+from django.core.urlresolvers import reverse
+
+from rest_framework import serializers
+from rest_framework.filters import OrderingFilter
+
+
+INFO = OrderedDict([
+    ('description', 'This is a sample Library API. You can register as many authors '
+                    'and books as you want.'),
+    ('version', '1.0.0'),
+    ('title', 'Library API'),
+    ('contact', OrderedDict([('url', 'https://github.com/jesuscg'), ('name', 'Jesús Castillo')])),
+    ('license', OrderedDict([('name', 'MIT'), ('url', 'https://opensource.org/licenses/MIT')])),
+])
+
+# Operations of the router's actions, formatted with the names of the model.
+OPERATIONS = {
+    ('list', 'get'): ('list%(Models)s', 'List all %(models)s', None),
+    ('create', 'post'): ('create%(Model)s', 'Creates %(a_model)s', None),
+    ('retrieve', 'get'): ('show%(Model)sById', 'Info for a specific %(model)s', None),
+    ('update', 'put'): ('update%(Model)sById', 'Updates a specific %(model)s', None),
+    ('partial_update', 'patch'): (
+        'partiallyUpdate%(Model)sById', 'Partially updates a specific %(model)s',
+        'Updates only the supplied fields of the %(model)s.'
+    ),
+    ('destroy', 'delete'): ('delete%(Model)sById', 'Deletes a specific %(model)s', None),
+    ('bulk', 'post'): (
+        'bulkCreate%(Models)s', 'Creates many %(models)s',
+        'Creates every %(model)s in the array in a single transaction. Nothing is '
+        'created if any item is invalid.'
+    ),
+    ('bulk', 'patch'): (
+        'bulkUpdate%(Models)s', 'Partially updates many %(models)s',
+        'Updates the supplied fields of every %(model)s in the array. Each item '
+        'must include its id.'
+    ),
+    ('bulk', 'delete'): (
+        'bulkDelete%(Models)s', 'Deletes many %(models)s',
+        'Deletes every %(model)s whose id is in the array.'
+    ),
+}
+
+FILTER_LOOKUPS = {
+    'exact': 'Only %(models)s whose %(field)s is this value',
+    'gt': 'Only %(models)s whose %(field)s is after this value',
+    'gte': 'Only %(models)s whose %(field)s is on or after this value',
+    'lte': 'Only %(models)s whose %(field)s is on or before this value',
+    'startswith': 'Only %(models)s whose %(field)s starts with this prefix (case-sensitive)',
+}
+
+OPERATION_KEYS = ('operationId', 'summary', 'description', 'tags', 'produces', 'parameters', 'responses')
+
+BULK_ERRORS = 'Bad Request. Returns a list of errors aligned with the request items.'
+ETAG_HEADERS = OrderedDict([
+    ('ETag', {'type': 'string', 'description': 'Validator of this response'}),
+    ('Last-Modified', {'type': 'string', 'description': 'When the returned rows last changed'}),
+])
+
+PATH_PARAMETER_RE = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+PATH_NAME_RE = re.compile(r'\{(\w+)\}')
+
+
+def openapi(**operation):
+    """
+    Documents an action or API view. Pass keys of the OpenAPI operation, e.g.
+    `summary`, `parameters` or `responses`, which are merged over the ones
+    generated, `nested_body` with the fields of the created model whose
+    new related object is nested in the request body instead of its id, and
+    `definitions` with the serializers of the schemas they refer to by name.
+
+    The description defaults to the docstring. Put this decorator above
+    `api_view`.
+    """
+    def decorator(func):
+        func.openapi = operation
+        return func
+    return decorator
+
+
+def query_parameter(name, description, type='string', **schema):
+    parameter = OrderedDict([
+        ('name', name), ('in', 'query'), ('required', schema.pop('required', False)),
+        ('description', description), ('type', type),
+    ])
+    parameter.update(sorted(schema.items()))
+    return parameter
+
+
+def header_parameter(name, description):
+    return OrderedDict([
+        ('name', name), ('in', 'header'), ('required', False),
+        ('description', description), ('type', 'string'),
+    ])
+
+
+def docstring_text(docstring):
+    """
+    Returns docstring as text with one line per paragraph.
+    """
+    paragraphs = cleandoc(docstring).split('\n\n')
+    return '\n\n'.join(' '.join(paragraph.split('\n')) for paragraph in paragraphs)
+
+
+def ref(name):
+    return {'$ref': '#/definitions/%s' % name}
+
+
+def field_schema(field):
+    """
+    Returns the schema of a serializer field's values.
+    """
+    if isinstance(field, serializers.BaseSerializer):
+        return ref(field.Meta.model.__name__)
+    if isinstance(field, serializers.ManyRelatedField):
+        return OrderedDict([('type', 'array'), ('items', field_schema(field.child_relation))])
+
+    if isinstance(field, (serializers.IntegerField, serializers.PrimaryKeyRelatedField)):
+        schema = OrderedDict([('type', 'integer'), ('format', 'int64')])
+    elif isinstance(field, (serializers.FloatField, serializers.DecimalField)):
+        schema = OrderedDict([('type', 'number')])
+    elif isinstance(field, serializers.BooleanField):
+        schema = OrderedDict([('type', 'boolean')])
+    elif isinstance(field, serializers.DateTimeField):
+        schema = OrderedDict([('type', 'string'), ('format', 'date-time')])
+    elif isinstance(field, serializers.DateField):
+        schema = OrderedDict([('type', 'string'), ('format', 'date')])
+    else:
+        schema = OrderedDict([('type', 'string')])
+
+    if isinstance(field, serializers.ChoiceField):
+        schema['enum'] = list(field.choices)
+    if getattr(field, 'max_length', None):
+        schema['maxLength'] = field.max_length
+    return schema
+
+
+def serializer_schema(serializer, writable=False):
+    """
+    Returns the schema of the objects serializer reads, or of the ones it
+    writes if writable is True.
+    """
+    properties = OrderedDict()
+    required = []
+    for name, field in serializer.fields.items():
+        if writable and field.read_only:
+            continue
+        properties[name] = field_schema(field)
+        if writable and field.required:
+            required.append(name)
+        elif field.read_only and not writable and '$ref' not in properties[name]:
+            properties[name]['readOnly'] = True
+
+    schema = OrderedDict([('type', 'object')])
+    if required:
+        schema['required'] = required
+    schema['properties'] = properties
+    return schema
+
+
+class SpecGenerator(object):
+    """
+    Builds the Swagger 2.0 spec of the API from the routes of
+    `api_books.urls`: the viewsets' actions, filters, pagination and
+    conditional requests, and the fields of their serializers.
+    """
+
+    def __init__(self):
+        self.paths = OrderedDict()
+        self.definitions = OrderedDict()
+        self.tags = []
+
+    def get_spec(self):
+        from api_books import urls
+
+        for path, callback in self.get_endpoints(urls.urlpatterns):
+            if hasattr(callback, 'actions'):
+                self.add_viewset_operations(path, callback.cls, callback.actions)
+            else:
+                self.add_view_operations(path, callback)
+
+        return OrderedDict([
+            ('swagger', '2.0'),
+            ('info', INFO),
+            ('basePath', reverse('api-root').rstrip('/')),
+            ('schemes', ['http', 'https']),
+            ('tags', self.tags),
+            ('consumes', ['application/json']),
+            ('produces', ['application/json']),
+            ('paths', self.paths),
+            ('definitions', self.definitions),
+        ])
+
+    def get_endpoints(self, patterns, prefix=''):
+        """
+        Yields the path and view of the routes of viewsets and of the views
+        documented with @openapi, without their format suffix variants.
+        """
+        for pattern in patterns:
+            regex = prefix + pattern.regex.pattern.lstrip('^')
+            if hasattr(pattern, 'url_patterns'):
+                for endpoint in self.get_endpoints(pattern.url_patterns, regex):
+                    yield endpoint
+                continue
+
+            callback = pattern.callback
+            if 'format' in pattern.regex.groupindex:
+                continue
+            if not hasattr(callback, 'actions') and not hasattr(callback, 'openapi'):
+                continue
+
+            path = PATH_PARAMETER_RE.sub(
+                lambda match: '{%s}' % ('id' if match.group(1) == 'pk' else match.group(1)),
+                regex.rstrip('$')
+            )
+            yield '/' + path, callback
+
+    def get_names(self, model):
+        model_name = '%s' % model._meta.verbose_name
+        models_name = '%s' % model._meta.verbose_name_plural
+        return {
+            'model': model_name,
+            'models': models_name,
+            'a_model': ('an %s' if model_name[0] in 'aeiou' else 'a %s') % model_name,
+            'Model': model.__name__,
+            'Models': models_name.title().replace(' ', ''),
+        }
+
+    def get_parent(self, path, model):
+        """
+        Returns the path parameter and the names of the model that the rows
+        of a nested path belong to, e.g. the author of
+        `/authors/{author_id}/books`, or (None, None).
+        """
+        for name in PATH_NAME_RE.findall(path):
+            if name.endswith('_id'):
+                return name, self.get_names(model._meta.get_field(name[:-3]).related_model)
+        return None, None
+
+    def add_tag(self, name, description):
+        if all(tag['name'] != name for tag in self.tags):
+            self.tags.append(OrderedDict([('name', name), ('description', description)]))
+
+    def add_viewset_operations(self, path, viewset, actions):
+        model = viewset.queryset.model
+        names = self.get_names(model)
+        tag = names['Models']
+        self.add_tag(tag, docstring_text(viewset.__doc__ or '').split('\n\n')[0])
+        self.add_model_definitions(viewset)
+
+        operations = self.paths.setdefault(path, OrderedDict())
+        for method, action in sorted(actions.items()):
+            handler = getattr(viewset, action)
+            defaults = OPERATIONS.get((action, method))
+
+            operation = OrderedDict()
+            if defaults is None:
+                operation['operationId'] = re.sub(r'_(\w)', lambda match: match.group(1).upper(), action)
+                operation['summary'] = action.replace('_', ' ').capitalize()
+            else:
+                operation['operationId'] = defaults[0] % names
+                operation['summary'] = defaults[1] % names
+                if defaults[2]:
+                    operation['description'] = defaults[2] % names
+            operation['tags'] = [tag]
+            operation['parameters'] = self.get_parameters(path, viewset, action, method, names)
+            operation['responses'] = self.get_responses(viewset, action, method, names)
+            parameter, parent = self.get_parent(path, model)
+            if parent is not None:
+                operation['operationId'] += 'Of%(Model)s' % parent
+                operation['summary'] += ' of %(a_model)s' % parent
+                operation['responses']['404'] = {'description': 'Not Found'}
+            self.apply_overrides(operation, handler, defaults is None, names)
+            operations[method] = operation
+
+    def add_view_operations(self, path, view):
+        operations = self.paths.setdefault(path, OrderedDict())
+        for method in view.cls.http_method_names:
+            if method in ('head', 'options') or not hasattr(view.cls, method):
+                continue
+            operation = OrderedDict([('parameters', []), ('responses', OrderedDict())])
+            self.apply_overrides(operation, view, True)
+            operations[method] = operation
+
+    def apply_overrides(self, operation, handler, use_docstring, names=None):
+        overrides = dict(getattr(handler, 'openapi', {}))
+        if use_docstring and handler.__doc__ and 'description' not in overrides:
+            operation['description'] = docstring_text(handler.__doc__)
+
+        for name, serializer_class in sorted(overrides.pop('definitions', {}).items()):
+            if name not in self.definitions:
+                self.definitions[name] = serializer_schema(serializer_class())
+        nested = overrides.pop('nested_body', None)
+        if nested:
+            overrides.setdefault('parameters', []).append(self.get_body(
+                '%(Model)s object to create' % names, ref(self.add_nested_definition(nested, names))
+            ))
+        for key, value in overrides.items():
+            if key == 'parameters':
+                operation['parameters'] = [parameter for parameter in operation['parameters']
+                                           if parameter['in'] != 'body'] + list(value)
+            elif key == 'responses':
+                operation['responses'].update(value)
+            else:
+                operation[key] = value
+
+        for key in sorted(operation, key=OPERATION_KEYS.index):
+            operation[key] = operation.pop(key)
+
+    def get_body(self, description, schema):
+        return OrderedDict([
+            ('name', 'body'), ('in', 'body'), ('required', True),
+            ('description', description), ('schema', schema),
+        ])
+
+    def get_parameters(self, path, viewset, action, method, names):
+        parameters = []
+        if '{id}' in path:
+            parameters.append(OrderedDict([
+                ('name', 'id'), ('in', 'path'), ('required', True),
+                ('description', 'The id of the %(model)s' % names),
+                ('type', 'integer'), ('format', 'int64'),
+            ]))
+        parameter, parent = self.get_parent(path, viewset.queryset.model)
+        if parent is not None:
+            parameters.append(OrderedDict([
+                ('name', parameter), ('in', 'path'), ('required', True),
+                ('description', 'The id of the %(model)s' % parent),
+                ('type', 'integer'), ('format', 'int64'),
+            ]))
+
+        if action == 'list':
+            parameters.extend(self.get_list_parameters(viewset, names))
+        if action in ('list', 'retrieve') and hasattr(viewset, 'get_field_selection'):
+            parameters.extend(self.get_field_parameters(viewset))
+
+        if action in ('create', 'update'):
+            parameters.append(self.get_body(
+                '%s object to %s' % (names['Model'], action), ref('New%(Model)s' % names)
+            ))
+        elif action == 'partial_update':
+            parameters.append(self.get_body(
+                'Fields of the %(model)s to update' % names, {'type': 'object'}
+            ))
+        elif action == 'bulk':
+            if method == 'post':
+                description, items = 'Array of %(model)s objects to create', ref('New%(Model)s' % names)
+            elif method == 'patch':
+                description, items = 'Array of partial %(model)s objects including their id', {'type': 'object'}
+            else:
+                description, items = 'Array of %(model)s ids to delete', OrderedDict([('type', 'integer'), ('format', 'int64')])
+            parameters.append(self.get_body(
+                description % names, OrderedDict([('type', 'array'), ('items', items)])
+            ))
+
+        if getattr(getattr(viewset, action), 'conditional', False):
+            if method == 'get':
+                parameters.append(header_parameter(
+                    'If-None-Match', 'ETag of a previous response; returns 304 if it is still current'
+                ))
+                parameters.append(header_parameter(
+                    'If-Modified-Since', 'Returns 304 if not modified since this HTTP date'
+                ))
+            else:
+                parameters.append(header_parameter(
+                    'If-Match', 'ETag of the version being updated; returns 412 if it changed since'
+                ))
+        return parameters
+
+    def get_list_parameters(self, viewset, names):
+        parameters = []
+        paginator = viewset.pagination_class
+        if paginator is not None:
+            parameters.append(query_parameter(
+                paginator.cursor_query_param,
+                'Opaque cursor taken from the next or previous link of a previous page'
+            ))
+            if paginator.page_size_query_param:
+                parameters.append(query_parameter(
+                    paginator.page_size_query_param,
+                    'Number of results per page (default %d, maximum %d)' % (
+                        paginator.page_size, paginator.max_page_size),
+                    'integer', minimum=1
+                ))
+
+        for name, (lookup, field) in sorted(getattr(viewset, 'filter_params', {}).items()):
+            field_name, lookup_type = (lookup.split('__', 1) + ['exact'])[:2]
+            description = FILTER_LOOKUPS.get(lookup_type, 'Only %(models)s matching this %(field)s value') % dict(
+                names, field=field_name.replace('_', ' ')
+            )
+            parameters.append(query_parameter(name, description, **field_schema(field)))
+
+        if OrderingFilter in viewset.filter_backends:
+            parameters.append(query_parameter(
+                OrderingFilter.ordering_param,
+                'Comma separated fields to order by, prefixed with - for descending. '
+                'One of %s' % ', '.join(viewset.ordering_fields)
+            ))
+        return parameters
+
+    def get_field_parameters(self, viewset):
+        serializer = viewset.serializer_class()
+        nested = [name for name, field in serializer.fields.items()
+                  if isinstance(field, serializers.BaseSerializer)]
+        parameters = [query_parameter(
+            'fields', 'Comma separated fields to return. Returns all fields by default',
+            'array', items={'type': 'string', 'enum': list(serializer.fields)},
+            collectionFormat='csv'
+        )]
+        if nested:
+            parameters.append(query_parameter(
+                'expand', 'Comma separated fields to nest instead of returning their id. '
+                'Nests them by default when all fields are returned',
+                'array', items={'type': 'string', 'enum': nested}, collectionFormat='csv'
+            ))
+        return parameters
+
+    def get_responses(self, viewset, action, method, names):
+        conditional = getattr(getattr(viewset, action), 'conditional', False)
+        responses = OrderedDict()
+        if action == 'list':
+            responses['200'] = OrderedDict([
+                ('description', 'Returns a page of %(models)s.' % names),
+                ('schema', ref(names['Models'])),
+            ])
+        elif action == 'create':
+            responses['201'] = OrderedDict([
+                ('description', 'Returns the %(model)s created.' % names),
+                ('schema', ref(names['Model'])),
+            ])
+            responses['400'] = {'description': 'Bad Request'}
+        elif action in ('retrieve', 'update', 'partial_update'):
+            responses['200'] = OrderedDict([
+                ('description', 'Returns the %(model)s.' % names),
+                ('schema', ref(names['Model'])),
+            ])
+            if action != 'retrieve':
+                responses['400'] = {'description': 'Bad Request'}
+        elif action == 'destroy':
+            responses['204'] = {'description': 'No Content'}
+        elif action == 'bulk':
+            status_code, verb = {'post': ('201', 'created'), 'patch': ('200', 'updated'),
+                                 'delete': ('200', 'deleted')}[method]
+            responses[status_code] = {'description': 'Returns the number of %s %s.' % (names['models'], verb)}
+            responses['400'] = {'description': BULK_ERRORS}
+        else:
+            responses['200' if method == 'get' else '201'] = {'description': 'OK'}
+            responses['400'] = {'description': 'Bad Request'}
+
+        if conditional:
+            if method == 'get':
+                responses['200']['headers'] = ETAG_HEADERS
+                responses['304'] = {'description': 'Not Modified'}
+            else:
+                responses['200']['headers'] = OrderedDict([('ETag', ETAG_HEADERS['ETag'])])
+        if action in ('retrieve', 'update', 'partial_update', 'destroy'):
+            responses['404'] = {'description': 'Not Found'}
+        if conditional and method != 'get':
+            responses['412'] = {'description': 'Precondition Failed'}
+        return responses
+
+    def add_model_definitions(self, viewset):
+        """
+        Adds the definitions of the viewset's model as it is read, written and
+        listed, and of the models nested in it.
+        """
+        serializer_class = viewset.serializer_class
+        model = serializer_class.Meta.model
+        names = self.get_names(model)
+        if names['Model'] in self.definitions:
+            return
+
+        serializer = serializer_class()
+        self.definitions[names['Model']] = serializer_schema(serializer)
+        self.definitions['New%(Model)s' % names] = serializer_schema(
+            self.get_writable_serializer(serializer_class), writable=True
+        )
+
+        results = OrderedDict([('type', 'array'), ('items', ref(names['Model']))])
+        paginator = viewset.pagination_class
+        if paginator is None:
+            self.definitions[names['Models']] = results
+        else:
+            self.definitions[names['Models']] = OrderedDict([
+                ('type', 'object'),
+                ('properties', OrderedDict([
+                    ('next', {'type': 'string', 'description': 'Link to the next page, or null on the last page'}),
+                    ('previous', {'type': 'string', 'description': 'Link to the previous page, or null on the first page'}),
+                    ('results', results),
+                ])),
+            ])
+
+        for field in serializer.fields.values():
+            if isinstance(field, serializers.BaseSerializer):
+                related_model = field.Meta.model
+                if related_model.__name__ not in self.definitions:
+                    self.definitions[related_model.__name__] = serializer_schema(field)
+                    self.definitions['New%s' % related_model.__name__] = serializer_schema(field, writable=True)
+
+    def get_writable_serializer(self, serializer_class):
+        """
+        Returns serializer_class without depth: related objects nested in the
+        responses are written by id.
+        """
+        meta = type(str('Meta'), (serializer_class.Meta, object), {'depth': 0})
+        return type(str('New%s' % serializer_class.__name__), (serializer_class,), {'Meta': meta})()
+
+    def add_nested_definition(self, fields, names):
+        """
+        Adds the definition of a new model whose related `fields` are new
+        objects nested in it, and returns its name.
+        """
+        name = 'New%s' % names['Model']
+        schema = OrderedDict(self.definitions[name])
+        schema['properties'] = OrderedDict(schema['properties'])
+        for field in fields:
+            related = self.definitions[names['Model']]['properties'][field]['$ref'].rsplit('/', 1)[1]
+            schema['properties'][field] = ref('New%s' % related)
+            name += 'And%s' % related
+        self.definitions[name] = schema
+        return name
+
+
+def get_spec():
+    """
+    Returns the OpenAPI (Swagger 2.0) spec of the API.
+    """
+    return SpecGenerator().get_spec()
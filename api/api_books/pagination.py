@@ -0,0 +1,191 @@
+from __future__ import unicode_literals
+
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import Q
+from django.utils import six
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination that seeks on the full (created, id) key.
+
+    The default CursorPagination only filters on the first ordering field and
+    falls back to an offset for ties. Here the position stores every ordering
+    field of the boundary row, so each page is a single range scan of the
+    (created, id) index (WHERE (created, id) > (x, y) ... LIMIT n) and no
+    COUNT(*) query is ever issued, however deep the client pages.
+    """
+    ordering = ('created', 'id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (reverse, current_position) = (False, None)
+        else:
+            (reverse, current_position) = (self.cursor.reverse, self.cursor.position)
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        # Seek past the boundary row instead of using an OFFSET.
+        if current_position is not None:
+            try:
+                queryset = self.filter_keyset(queryset, current_position, reverse)
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # We always fetch an extra item in order to determine if there is a
+        # page following on from this one.
+        results = list(queryset[:self.page_size + 1])
+        has_following_position = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        # If we have a reverse queryset, then the query ordering was in reverse
+        # so we need to reverse the items again before returning them to the user.
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = current_position is not None
+            self.has_previous = has_following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None
+
+        # Without any rows there is no boundary to build a cursor from.
+        if not self.page:
+            self.has_next = self.has_previous = False
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+                if page_size > 0:
+                    return min(page_size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+
+        return self.page_size
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Always finish the ordering with the primary key so the keyset is unique.
+        """
+        ordering = super(KeysetCursorPagination, self).get_ordering(request, queryset, view)
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            ordering += ('-id',) if ordering[-1].startswith('-') else ('id',)
+        return ordering
+
+    def filter_keyset(self, queryset, position, reverse):
+        """
+        Returns queryset filtered to the rows after position, with the
+        row-value comparison `(f1, f2, ...) > (v1, v2, ...)`.
+
+        Databases match it to an index on (f1, f2, ...) as one range, which
+        they do not do for the equivalent OR of comparisons. Orderings that
+        mix directions, or order on related fields, cannot be written as
+        one comparison and filter with get_keyset_filter() instead.
+        """
+        model = queryset.model
+        directions = set(field.startswith('-') for field in self.ordering)
+        fields = []
+        for field in self.ordering:
+            attr = field.lstrip('-')
+            try:
+                fields.append(model._meta.pk if attr == 'pk' else model._meta.get_field(attr))
+            except FieldDoesNotExist:
+                break
+        if len(directions) > 1 or len(fields) < len(self.ordering) or not all(f.concrete for f in fields):
+            return queryset.filter(self.get_keyset_filter(position, reverse))
+
+        connection = connections[queryset.db]
+        qn = connection.ops.quote_name
+        columns = ['%s.%s' % (qn(model._meta.db_table), qn(field.column)) for field in fields]
+        params = [
+            field.get_db_prep_value(field.to_python(value), connection)
+            for field, value in zip(fields, position)
+        ]
+        # Test for: (cursor reversed) XOR (fields reversed)
+        operator = '<' if reverse != directions.pop() else '>'
+        return queryset.extra(where=['(%s) %s (%s)' % (
+            ', '.join(columns), operator, ', '.join(['%s'] * len(params))
+        )], params=params)
+
+    def get_keyset_filter(self, position, reverse):
+        """
+        Build the row-value comparison `(f1, f2, ...) > (v1, v2, ...)` as a Q
+        of one comparison per field.
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, position):
+            attr = field.lstrip('-')
+            # Test for: (cursor reversed) XOR (field reversed)
+            lookup = '__lt' if reverse != field.startswith('-') else '__gt'
+            term = dict(equal)
+            term[attr + lookup] = value
+            condition |= Q(**term)
+            equal[attr] = value
+        return condition
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def decode_cursor(self, request):
+        cursor = super(KeysetCursorPagination, self).decode_cursor(request)
+        if cursor is None or cursor.position is None:
+            return cursor
+
+        try:
+            position = json.loads(cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(offset=0, reverse=cursor.reverse, position=position)
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for field in ordering:
+            attr = field.lstrip('-')
+            if isinstance(instance, dict):
+                value = instance[attr]
+            else:
+                value = getattr(instance, attr)
+            position.append(value if isinstance(value, six.integer_types) else six.text_type(value))
+        return json.dumps(position)
+
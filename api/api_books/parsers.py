@@ -0,0 +1,42 @@
+from __future__ import unicode_literals
+
+import codecs
+import re
+from io import BytesIO
+
+from django.conf import settings
+
+from rest_framework.parsers import JSONParser
+
+from api_books.renderers import FastJSONRenderer, orjson
+
+
+# orjson reads integers over 64 bits as floats and may round floats
+# differently, so documents that could contain either, even in a string,
+# are parsed by JSONParser.
+DIFFERENT_NUMBERS_RE = re.compile(br'[0-9][.eE]|[0-9]{19}')
+
+
+class FastJSONParser(JSONParser):
+    """
+    Parses UTF-8 JSON with orjson, when it is installed.
+
+    Documents orjson rejects, including invalid ones and those the json
+    module accepts, such as NaN, and documents with floats or large integers
+    are parsed by JSONParser, so the data and the errors are the same.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super(FastJSONParser, self).parse(stream, media_type, parser_context)
+
+        content = stream.read()
+        if DIFFERENT_NUMBERS_RE.search(content):
+            return super(FastJSONParser, self).parse(BytesIO(content), media_type, parser_context)
+        try:
+            return orjson.loads(content)
+        except ValueError:
+            return super(FastJSONParser, self).parse(BytesIO(content), media_type, parser_context)
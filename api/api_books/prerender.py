@@ -0,0 +1,125 @@
+from __future__ import unicode_literals
+
+import gzip
+import hashlib
+import io
+from functools import wraps
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Content codings in order of preference, with the suffix that tells their
+# ETags from the one of the identity encoding.
+ENCODINGS = (('br', '-br'), ('gzip', '-gz'))
+
+_payloads = {}
+
+
+def accepted_encodings(header):
+    """
+    Returns the quality of every content coding of an Accept-Encoding
+    header, by lowercased name. Codings refused with q=0 are included with
+    quality 0.
+    """
+    qualities = {}
+    for item in header.split(','):
+        params = item.split(';')
+        coding = params[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params[1:]:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+class Payload(object):
+    """
+    A response body rendered once and kept with its gzip and, if the brotli
+    package is installed, brotli encodings and its ETag, so that serving it
+    costs no rendering or compression. Each encoding is a representation of
+    its own, so its ETag has the suffix of the encoding.
+    """
+
+    def __init__(self, content, content_type):
+        self.content = content
+        self.content_type = content_type
+        self.etag = hashlib.md5(content).hexdigest()
+
+        buffer = io.BytesIO()
+        # A fixed mtime keeps the encoding, like the ETag, stable.
+        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9, mtime=0) as gzip_file:
+            gzip_file.write(content)
+        self.gzip = buffer.getvalue()
+        self.brotli = brotli.compress(content) if brotli else None
+
+    def get_encoding(self, request):
+        """
+        Returns the encoding to serve request, br, gzip or None for the
+        identity, picking the one the client accepts with the highest
+        quality and preferring brotli on ties.
+        """
+        qualities = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        best, best_quality = None, 0
+        for encoding, suffix in ENCODINGS:
+            if encoding == 'br' and self.brotli is None:
+                continue
+            quality = qualities.get(encoding, qualities.get('*', 0))
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def response(self, request, max_age=0):
+        """
+        Returns the response to request, encoded as the client accepts, or a
+        304 response if the client holds the current ETag of that encoding.
+        """
+        encoding = self.get_encoding(request)
+        etag = self.etag + dict(ENCODINGS).get(encoding, '')
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and etag in parse_etags(if_none_match):
+            response = HttpResponseNotModified()
+        else:
+            content = {'br': self.brotli, 'gzip': self.gzip}.get(encoding, self.content)
+            response = HttpResponse(content, content_type=self.content_type)
+            if encoding is not None:
+                response['Content-Encoding'] = encoding
+
+        response['ETag'] = quote_etag(etag)
+        response['Vary'] = 'Accept-Encoding'
+        response['Cache-Control'] = 'public, max-age=%d' % max_age
+        return response
+
+
+def prerendered(content_type):
+    """
+    Decorates a function returning text so that it is rendered once per
+    process and returned as a Payload. With DEBUG on, as templates and code
+    change under the development server, it is rendered on every call.
+    """
+    def decorator(render):
+        @wraps(render)
+        def wrapper():
+            if settings.DEBUG or render not in _payloads:
+                _payloads[render] = Payload(render().encode('utf-8'), content_type)
+            return _payloads[render]
+        return wrapper
+    return decorator
+
+
+def clear_prerendered():
+    _payloads.clear()
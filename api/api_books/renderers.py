@@ -0,0 +1,37 @@
+from __future__ import unicode_literals
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def unsupported(value):
+    raise TypeError
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Renders compact JSON with orjson, when it is installed, which is several
+    times faster than the json module on large lists.
+
+    The output is the same as JSONRenderer's. Data of types that orjson
+    would write differently, such as datetimes, decimals and UUIDs, and
+    requests for indented JSON are rendered by JSONRenderer. orjson writes
+    floats in exponent notation without the `+`, e.g. 1e16; no field of the
+    API is a float.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (orjson is None or data is None or
+                self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super(FastJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=unsupported, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return super(FastJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+        # Escaped by JSONRenderer too, so that the output is valid JavaScript.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
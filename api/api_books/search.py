@@ -0,0 +1,211 @@
+from __future__ import unicode_literals
+
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.dispatch import receiver
+
+from api_books.bulk import chunked
+from api_books.models import Author, Book
+from api_books.signals import rows_deleted, rows_saved
+
+
+SEARCH_TABLE = 'api_books_search'
+
+# Ids per statement, below SQLite's limit of 999 query parameters.
+BATCH_SIZE = 500
+
+_backends = {}
+
+
+def tokenize(text):
+    """
+    Returns the words of a user query, dropping any search syntax.
+    """
+    return re.findall(r'\w+', text, re.UNICODE)
+
+
+class SearchBackend(object):
+    """
+    Keeps an inverted index of book titles and author names in its own table,
+    keyed by book id, and answers ranked prefix queries from it.
+    """
+    book_columns = (
+        "SELECT b.id, b.title, a.first_name || ' ' || a.last_name "
+        "FROM api_books_book b INNER JOIN api_books_author a ON a.id = b.author_id"
+    )
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def index_books(self, book_ids):
+        for batch in chunked(list(book_ids), BATCH_SIZE):
+            self.upsert('b.id IN (%s)' % ', '.join(['%s'] * len(batch)), batch)
+
+    def index_authors(self, author_ids):
+        for batch in chunked(list(author_ids), BATCH_SIZE):
+            self.upsert('b.author_id IN (%s)' % ', '.join(['%s'] * len(batch)), batch)
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute('DELETE FROM %s' % SEARCH_TABLE)
+        self.upsert('1 = 1', [])
+
+    def upsert(self, where, params):
+        raise NotImplementedError
+
+    def remove_books(self, book_ids):
+        raise NotImplementedError
+
+    def search(self, text, limit):
+        """
+        Returns the ids of the best matching books, best first.
+        """
+        raise NotImplementedError
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    Uses an FTS5 virtual table whose rowid is the book id, ranked with BM25
+    and with title matches weighted twice as much as author matches.
+    """
+
+    def upsert(self, where, params):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'INSERT OR REPLACE INTO %s (rowid, title, author) %s WHERE %s'
+                % (SEARCH_TABLE, self.book_columns, where),
+                params
+            )
+
+    def remove_books(self, book_ids):
+        with self.connection.cursor() as cursor:
+            for batch in chunked(list(book_ids), BATCH_SIZE):
+                cursor.execute(
+                    'DELETE FROM %s WHERE rowid IN (%s)' % (SEARCH_TABLE, ', '.join(['%s'] * len(batch))),
+                    batch
+                )
+
+    def search(self, text, limit):
+        query = ' '.join('"%s"*' % token for token in tokenize(text))
+        if not query:
+            return []
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT rowid FROM {0} WHERE {0} MATCH %s ORDER BY bm25({0}, 2.0, 1.0) LIMIT %s'.format(SEARCH_TABLE),
+                [query, limit]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    """
+    Uses a table of weighted tsvector documents with a GIN index, ranked
+    with ts_rank.
+    """
+
+    def upsert(self, where, params):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO {0} (book_id, document) "
+                "SELECT id, setweight(to_tsvector('simple', title), 'A') || "
+                "setweight(to_tsvector('simple', author), 'B') "
+                "FROM ({1} WHERE {2}) AS books (id, title, author) "
+                "ON CONFLICT (book_id) DO UPDATE SET document = EXCLUDED.document"
+                .format(SEARCH_TABLE, self.book_columns, where),
+                params
+            )
+
+    def remove_books(self, book_ids):
+        with self.connection.cursor() as cursor:
+            cursor.execute('DELETE FROM %s WHERE book_id = ANY(%%s)' % SEARCH_TABLE, [list(book_ids)])
+
+    def search(self, text, limit):
+        query = ' & '.join('%s:*' % token for token in tokenize(text))
+        if not query:
+            return []
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT book_id FROM {0}, to_tsquery('simple', %s) query "
+                "WHERE document @@ query ORDER BY ts_rank(document, query) DESC, book_id LIMIT %s"
+                .format(SEARCH_TABLE),
+                [query, limit]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class FallbackSearchBackend(SearchBackend):
+    """
+    Used when the database has no search table: scans with icontains.
+    """
+
+    def index_books(self, book_ids):
+        pass
+
+    def index_authors(self, author_ids):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def remove_books(self, book_ids):
+        pass
+
+    def search(self, text, limit):
+        condition = Q()
+        for token in tokenize(text):
+            condition &= (
+                Q(title__icontains=token) |
+                Q(author__first_name__icontains=token) |
+                Q(author__last_name__icontains=token)
+            )
+        if not condition:
+            return []
+        books = Book.objects.using(self.connection.alias).filter(condition)
+        return list(books.order_by('title', 'id').values_list('id', flat=True)[:limit])
+
+
+def get_backend(using='default'):
+    """
+    Returns the search backend for the database alias, checking once per
+    process whether the search table was created by the migration.
+    """
+    if using not in _backends:
+        connection = connections[using]
+        backend_class = FallbackSearchBackend
+        if SEARCH_TABLE in connection.introspection.table_names():
+            if connection.vendor == 'sqlite':
+                backend_class = SQLiteSearchBackend
+            elif connection.vendor == 'postgresql':
+                backend_class = PostgreSQLSearchBackend
+        _backends[using] = backend_class(connection)
+    return _backends[using]
+
+
+def search_books(text, limit=20, using='default'):
+    """
+    Returns the books matching text, best match first, with their authors.
+    """
+    ids = get_backend(using).search(text, limit)
+    books = Book.objects.using(using).select_related('author').in_bulk(ids)
+    return [books[book_id] for book_id in ids if book_id in books]
+
+
+@receiver(rows_saved, sender=Book)
+def index_saved_books(sender, ids, **kwargs):
+    if ids is not None:
+        get_backend().index_books(ids)
+
+
+@receiver(rows_saved, sender=Author)
+def index_saved_authors(sender, ids, created=False, **kwargs):
+    # New authors have no books to reindex yet.
+    if ids is not None and not created:
+        get_backend().index_authors(ids)
+
+
+@receiver(rows_deleted, sender=Book)
+def remove_deleted_books(sender, ids, **kwargs):
+    if ids is not None:
+        get_backend().remove_books(ids)
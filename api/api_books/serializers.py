@@ -2,19 +2,81 @@ from __future__ import unicode_literals
 
 from rest_framework import serializers
 
-from api_books.models import Author, Book
+from api_books.models import Author, Book, DeletionJob
+from config.metrics.timing import timed
 
 
-class AuthorSerializer(serializers.ModelSerializer):
+class TimedListSerializer(serializers.ListSerializer):
+
+    @property
+    def data(self):
+        with timed('serialize'):
+            return super(TimedListSerializer, self).data
+
+
+class TimedModelSerializer(serializers.ModelSerializer):
+    """
+    Counts the time taken to serialize toward the Server-Timing of the
+    request, with or without `many=True`.
+    """
+
+    @property
+    def data(self):
+        with timed('serialize'):
+            return super(TimedModelSerializer, self).data
+
+
+class AuthorSerializer(TimedModelSerializer):
+
+    class Meta:
+        model = Author
+        list_serializer_class = TimedListSerializer
+        fields = ('id', 'first_name', 'last_name', 'book_count', 'created', 'updated')
+
+
+class BookAuthorSerializer(serializers.ModelSerializer):
+    """
+    The author nested in books, without book_count: writes to an author's
+    other books change it, and do not evict the books embedding it.
+    """
 
     class Meta:
         model = Author
         fields = ('id', 'first_name', 'last_name', 'created', 'updated')
 
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(TimedModelSerializer):
+    """
+    Pass `fields` to serialize only those fields, and `expand=False` to
+    serialize the author as its id instead of nesting it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        expand = kwargs.pop('expand', True)
+        super(BookSerializer, self).__init__(*args, **kwargs)
+
+        if not expand and 'author' in self.fields:
+            self.fields['author'] = serializers.PrimaryKeyRelatedField(read_only=True)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def build_nested_field(self, field_name, relation_info, nested_depth):
+        if field_name == 'author':
+            return BookAuthorSerializer, {'read_only': True}
+        return super(BookSerializer, self).build_nested_field(field_name, relation_info, nested_depth)
 
     class Meta:
         model = Book
+        list_serializer_class = TimedListSerializer
         fields = ('id', 'title', 'author', 'isbn', 'published', 'created', 'updated')
         depth = 1
+
+
+class DeletionJobSerializer(TimedModelSerializer):
+
+    class Meta:
+        model = DeletionJob
+        fields = ('id', 'author_id', 'status', 'books_deleted', 'error', 'created', 'updated')
+        read_only_fields = fields
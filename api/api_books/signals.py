@@ -0,0 +1,31 @@
+from __future__ import unicode_literals
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from api_books.models import Author, Book
+
+
+# Sent whenever Author or Book rows are written or removed, with the model
+# class as sender and the primary keys as ids. Model.save() and delete() are
+# forwarded below; code that writes rows without them (bulk or queryset
+# updates) must send these itself. ids is None when the rows are unknown,
+# and created tells inserted rows from updated ones.
+rows_saved = Signal(providing_args=['ids', 'created'])
+rows_deleted = Signal(providing_args=['ids'])
+# Sent when counts kept on rows, such as Author.book_count, change without
+# the rows being saved: their representations change, but nothing that is
+# indexed or embedded elsewhere.
+counts_changed = Signal(providing_args=['ids'])
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=Book)
+def forward_post_save(sender, instance, created, **kwargs):
+    rows_saved.send(sender=sender, ids=[instance.pk], created=created)
+
+
+@receiver(post_delete, sender=Author)
+@receiver(post_delete, sender=Book)
+def forward_post_delete(sender, instance, **kwargs):
+    rows_deleted.send(sender=sender, ids=[instance.pk])
@@ -0,0 +1,163 @@
+from __future__ import unicode_literals
+
+import json
+from unittest import skipUnless
+
+from django.core.wsgi import get_wsgi_application
+from django.test import SimpleTestCase, TransactionTestCase
+from django.utils import six
+
+from api_books.models import Author
+
+if six.PY3:
+    import asyncio
+
+    from config.asgi_handler import ASGIHandler
+
+
+def run(handler, scope, messages=None):
+    """
+    Runs handler for scope with the given request messages and returns the
+    messages it sent.
+    """
+    loop = asyncio.new_event_loop()
+    received = list(messages or [{'type': 'http.request', 'body': b''}])
+    sent = []
+
+    def done(result):
+        future = loop.create_future()
+        future.set_result(result)
+        return future
+
+    def receive():
+        return done(received.pop(0) if received else {'type': 'http.disconnect'})
+
+    def send(message):
+        sent.append(message)
+        return done(None)
+
+    try:
+        loop.run_until_complete(handler(scope, receive, send))
+    finally:
+        loop.close()
+    return sent
+
+
+def http_scope(path='/', method='GET', headers=(), query_string=b''):
+    return {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query_string,
+        'headers': list(headers), 'server': ('testserver', 80),
+    }
+
+
+class ClosingChunks(object):
+    """
+    A streaming WSGI response that records whether it was closed.
+    """
+    streaming = True
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+
+@skipUnless(six.PY3, 'The ASGI handler needs Python 3')
+class ASGIHandlerTestCase(SimpleTestCase):
+
+    def test_runs_the_wsgi_application(self):
+        """
+        Test that the request reaches the WSGI application and its response
+        is sent in one message with a Content-Length.
+        """
+        environs = []
+
+        def application(environ, start_response):
+            environs.append(dict(environ, body=environ['wsgi.input'].read()))
+            start_response('201 Created', [('Content-Type', 'text/plain')])
+            return [b'Hello, ', b'world']
+
+        sent = run(ASGIHandler(application), http_scope(
+            '/api/v1/books', 'POST', [(b'content-type', b'application/json'), (b'x-trace', b'1')],
+            b'page=2'
+        ), [
+            {'type': 'http.request', 'body': b'{"title": ', 'more_body': True},
+            {'type': 'http.request', 'body': b'"Dune"}'},
+        ])
+
+        environ = environs[0]
+        self.assertEqual(environ['REQUEST_METHOD'], 'POST')
+        self.assertEqual(environ['PATH_INFO'], '/api/v1/books')
+        self.assertEqual(environ['QUERY_STRING'], 'page=2')
+        self.assertEqual(environ['CONTENT_TYPE'], 'application/json')
+        self.assertEqual(environ['HTTP_X_TRACE'], '1')
+        self.assertEqual(environ['body'], b'{"title": "Dune"}')
+        self.assertEqual(sent, [
+            {'type': 'http.response.start', 'status': 201, 'headers': [
+                (b'content-type', b'text/plain'), (b'content-length', b'12'),
+            ]},
+            {'type': 'http.response.body', 'body': b'Hello, world'},
+        ])
+
+    def test_streams_streaming_responses(self):
+        """
+        Test that streaming responses are sent chunk by chunk and closed.
+        """
+        chunks = ClosingChunks([b'a,b\n', b'', b'c,d\n'])
+
+        def application(environ, start_response):
+            start_response('200 OK', [('Content-Type', 'text/csv')])
+            return chunks
+
+        sent = run(ASGIHandler(application), http_scope())
+
+        self.assertEqual([message.get('body') for message in sent[1:]], [b'a,b\n', b'c,d\n', b''])
+        self.assertEqual([message.get('more_body', False) for message in sent[1:]], [True, True, False])
+        self.assertTrue(chunks.closed)
+
+    def test_rejects_requests_over_max_pending(self):
+        """
+        Test that requests get a 503 response instead of queueing once
+        max_pending requests are pending.
+        """
+        handler = ASGIHandler(lambda environ, start_response: [], threads=1, max_pending=2)
+        handler.pending = 2
+
+        sent = run(handler, http_scope())
+
+        self.assertEqual(sent[0]['status'], 503)
+        self.assertIn((b'retry-after', b'1'), sent[0]['headers'])
+
+    def test_ignores_disconnected_clients(self):
+        """
+        Test that nothing runs for a client that left before sending its body.
+        """
+        calls = []
+        handler = ASGIHandler(lambda environ, start_response: calls.append(environ))
+
+        sent = run(handler, http_scope(), [{'type': 'http.disconnect'}])
+
+        self.assertEqual((sent, calls), ([], []))
+
+
+@skipUnless(six.PY3, 'The ASGI handler needs Python 3')
+class ASGIApplicationTestCase(TransactionTestCase):
+
+    def test_serves_the_api(self):
+        """
+        Test that the API answers through the handler, with Django running
+        on the handler's threads.
+        """
+        Author.objects.create(first_name='Frank', last_name='Herbert')
+        handler = ASGIHandler(get_wsgi_application())
+
+        sent = run(handler, http_scope('/api/v1/authors', headers=[(b'accept', b'application/json')]))
+
+        self.assertEqual(sent[0]['status'], 200)
+        content = json.loads(sent[1]['body'].decode('utf-8'))
+        self.assertEqual([author['last_name'] for author in content['results']], ['Herbert'])
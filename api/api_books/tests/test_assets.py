@@ -0,0 +1,33 @@
+from __future__ import unicode_literals
+
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+
+class DocsAssetsTestCase(SimpleTestCase):
+
+    def test_index_loads_bundles(self):
+        """
+        Test that the docs page loads the bundles instead of their sources.
+        """
+        response = self.client.get('/api/v1/docs/')
+
+        self.assertContains(response, 'swagger-ui/dist/docs.min.js')
+        self.assertContains(response, 'swagger-ui/dist/docs.min.css')
+        self.assertNotContains(response, 'swagger-ui/swagger-ui.js')
+        self.assertNotContains(response, 'swagger-ui/lib/')
+
+    @skipUnless(rjsmin, 'rjsmin and rcssmin are not installed')
+    def test_bundles_are_up_to_date(self):
+        """
+        Test that the committed bundles were built from the current sources.
+        """
+        call_command('build_docs_assets', check=True)
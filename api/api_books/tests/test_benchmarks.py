@@ -0,0 +1,144 @@
+from __future__ import unicode_literals
+
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils.six import StringIO
+
+from api_books.benchmarks.suite import CREATED_PREFIX, compare_results, delete_created, get_scenarios
+from api_books.benchmarks.synthetic import EPOCH, CatalogGenerator, isbn13
+from api_books.counts import recount_books
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class BenchmarkScenariosTestCase(LibraryAPIBaseTestCase):
+
+    def test_scenarios_succeed(self):
+        """
+        Test that the requests of every scenario succeed, and that the rows
+        they create are deleted afterwards without changing the book count
+        of the seeded author.
+        """
+        recount_books()
+        for name, requests in get_scenarios().items():
+            for number in range(2):
+                method, path, body, headers = requests(number)
+                response = self.client.generic(
+                    method, path, body or '', headers.get('Content-Type', 'application/octet-stream'),
+                    HTTP_ACCEPT=headers['Accept']
+                )
+                self.assertLess(response.status_code, 300, '%s: %s' % (name, response.status_code))
+
+        self.assertTrue(Book.objects.filter(title__startswith=CREATED_PREFIX).exists())
+        delete_created()
+        self.assertEqual(Book.objects.count(), 1)
+        self.assertEqual(Author.objects.count(), 1)
+        self.assertEqual(Author.objects.get().book_count, 1)
+
+
+class CompareResultsTestCase(SimpleTestCase):
+
+    baseline = {'10000': {'book-list': {'throughput': 100.0, 'p95_ms': 20.0, 'errors': 0}}}
+
+    def compare(self, **result):
+        result = dict(self.baseline['10000']['book-list'], **result)
+        return compare_results(self.baseline, {'10000': {'book-list': result}}, 0.25)
+
+    def test_within_threshold(self):
+        """
+        Test that results less than the threshold worse are no regression.
+        """
+        self.assertEqual(self.compare(throughput=80.0, p95_ms=24.0), [])
+
+    def test_regressions(self):
+        """
+        Test that lower throughput, higher latency and new errors are reported.
+        """
+        self.assertEqual(self.compare(throughput=70.0, p95_ms=30.0, errors=2), [
+            ('10000', 'book-list', 'throughput 100.0 -> 70.0 req/s'),
+            ('10000', 'book-list', 'p95 20.0 -> 30.0 ms'),
+            ('10000', 'book-list', '2 errors'),
+        ])
+
+    def test_new_scenarios(self):
+        """
+        Test that results missing from the baseline are not compared.
+        """
+        self.assertEqual(compare_results({}, {'10000': {'search': {'throughput': 1.0}}}, 0.25), [])
+
+
+class CatalogGeneratorTestCase(SimpleTestCase):
+
+    def test_isbn13(self):
+        """
+        Test that generated ISBNs are unique and have valid check digits.
+        """
+        isbns = [isbn13(number) for number in range(10000)]
+        self.assertEqual(len(set(isbns)), len(isbns))
+        for isbn in isbns[:100]:
+            total = sum(int(digit) * (3 if index % 2 else 1) for index, digit in enumerate(isbn))
+            self.assertEqual(len(isbn), 13)
+            self.assertEqual(total % 10, 0)
+
+    def test_same_seed_same_rows(self):
+        """
+        Test that the same seed gives the same rows, timestamps included,
+        and another seed others.
+        """
+        first, second, other = [CatalogGenerator(50, 500, seed) for seed in (1, 1, 2)]
+        for rows in ('author_rows', 'book_rows'):
+            rows = [list(getattr(generator, rows)()) for generator in (first, second, other)]
+            self.assertEqual(rows[0], rows[1])
+            self.assertNotEqual(rows[0], rows[2])
+
+        for created, updated in [row[-2:] for row in first.book_rows()]:
+            self.assertLessEqual(EPOCH - timedelta(days=5 * 365), created)
+            self.assertLessEqual(created, updated)
+            self.assertLessEqual(updated, EPOCH)
+
+    def test_now_moves_timestamps(self):
+        """
+        Test that rows are created and updated before the given now.
+        """
+        now = EPOCH + timedelta(days=100)
+        rows = zip(CatalogGenerator(50, 500, 1).book_rows(), CatalogGenerator(50, 500, 1, now=now).book_rows())
+        for row, moved in rows:
+            self.assertEqual(moved[:-2], row[:-2])
+            self.assertEqual(moved[-2], row[-2] + timedelta(days=100))
+
+    def test_books_per_author_are_skewed(self):
+        """
+        Test that every book has a generated author and the first ones get
+        most books.
+        """
+        books = list(CatalogGenerator(100, 5000).book_rows())
+        authors = [book[2] for book in books]
+        self.assertTrue(all(1 <= author <= 100 for author in authors))
+        self.assertGreater(authors.count(1), authors.count(100) * 10)
+
+
+class GenerateCatalogTestCase(TestCase):
+
+    def test_generates_catalog(self):
+        """
+        Test that every method replaces the catalog with the same rows.
+        """
+        Author.objects.create(first_name='James', last_name='Cook')
+        catalogs = []
+        for method in ('bulk_create', 'executemany'):
+            out = StringIO()
+            call_command('generate_catalog', authors=20, books=200, seed=3, method=method,
+                         batch_size=64, interactive=False, stdout=out)
+
+            self.assertIn('rows/s', out.getvalue())
+            self.assertEqual(Author.objects.count(), 20)
+            catalogs.append(list(Book.objects.order_by('id').values_list(
+                'id', 'title', 'author_id', 'isbn', 'published', 'created', 'updated'
+            )))
+        self.assertEqual(len(catalogs[0]), 200)
+        self.assertEqual(catalogs[0], catalogs[1])
+
+        # The sequences were moved past the generated ids.
+        self.assertEqual(Author.objects.create(first_name='Ana', last_name='Diaz').id, 21)
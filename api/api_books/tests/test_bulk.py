@@ -0,0 +1,270 @@
+from __future__ import unicode_literals
+
+from rest_framework import status
+
+from api_books.bulk import BulkModelMixin
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from api_books.views import BookViewSet
+
+
+class BulkBooksAPITestCase(LibraryAPIBaseTestCase):
+
+    def book_data(self, number, author=1):
+        return {
+            'title': 'Bulk Book %d' % number,
+            'author': author,
+            'isbn': '%013d' % number,
+            'published': '2016-11-21'
+        }
+
+    def test_bulk_creates_books(self):
+        """
+        Test that API creates every book and returns a 201 response.
+        """
+        data = [self.book_data(number) for number in range(1200)]
+        response = self.client.post('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {'created': 1200})
+        self.assertEqual(Book.objects.filter(title__startswith='Bulk').count(), 1200)
+
+    def test_bulk_create_resolves_authors_once(self):
+        """
+        Test that authors are resolved with one query and books are inserted
+        in batches.
+        """
+        author = Author.objects.create(first_name='Lisa', last_name='Cook')
+        data = [self.book_data(number, author=author.id if number % 2 else 1) for number in range(20)]
+
+        # Author lookup, ISBN check, savepoint, insert, book counts, id
+        # lookup, search index update and savepoint release.
+        with self.assertNumQueries(8):
+            response = self.client.post('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Book.objects.filter(author=author).count(), 10)
+
+    def test_bulk_create_returns_per_item_errors(self):
+        """
+        Test that API returns a 400 response with errors aligned to the input
+        and does not create any book.
+        """
+        data = [
+            self.book_data(1),
+            {'title': 'No Author', 'isbn': '1', 'published': '2016-11-21'},
+            self.book_data(3, author=99),
+            {'author': 1, 'published': '2013/04/16'},
+        ]
+        response = self.client.post('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1], {'author': 'Field required'})
+        self.assertEqual(response.data[2], {'author': 'Not Found'})
+        self.assertEqual(set(response.data[3]), {'title', 'isbn', 'published'})
+        self.assertEqual(Book.objects.count(), 1)
+
+    def test_bulk_create_rejects_duplicate_isbns(self):
+        """
+        Test that ISBNs must be unique within the request and in the database.
+        """
+        data = [self.book_data(7), self.book_data(7), self.book_data(8)]
+        data[2]['isbn'] = self.book.isbn
+        response = self.client.post('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1], {'isbn': ['book with this isbn already exists.']})
+        self.assertEqual(response.data[2], {'isbn': ['book with this isbn already exists.']})
+        self.assertEqual(Book.objects.count(), 1)
+
+    def test_bulk_create_rejects_isbns_taken_since_validation(self):
+        """
+        Test that an ISBN another request inserts after the items were
+        validated gives the same 400 response as one taken before.
+        """
+        validate_bulk_unique = BulkModelMixin.validate_bulk_unique
+
+        def validate_then_take(view, values, errors, pks=None):
+            validate_bulk_unique(view, values, errors, pks)
+            Book.objects.get_or_create(isbn='%013d' % 8, defaults={
+                'title': 'Concurrent Book', 'author': self.author, 'published': '2016-11-21'
+            })
+
+        self.addCleanup(delattr, BookViewSet, 'validate_bulk_unique')
+        BookViewSet.validate_bulk_unique = validate_then_take
+
+        data = [self.book_data(7), self.book_data(8)]
+        response = self.client.post('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [{}, {'isbn': ['book with this isbn already exists.']}])
+        self.assertFalse(Book.objects.filter(isbn='%013d' % 7).exists())
+
+    def test_bulk_rejects_non_list_body(self):
+        """
+        Test that API returns a 400 response when the body is not an array.
+        """
+        response = self.client.post('/api/v1/books/bulk', self.book_data(1), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'body': 'Incorrect format'})
+
+    def test_bulk_partially_updates_books(self):
+        """
+        Test that API updates only the supplied fields of every book.
+        """
+        author = Author.objects.create(first_name='Lisa', last_name='Cook')
+        other = Book.objects.create(
+            title='Other Book', author=self.author, isbn='1111111111111', published='2010-01-01'
+        )
+        data = [
+            {'id': self.book.id, 'title': 'Renamed Book'},
+            {'id': other.id, 'author': author.id, 'published': '2012-02-02'},
+        ]
+        response = self.client.patch('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'updated': 2})
+
+        book = Book.objects.get(id=self.book.id)
+        self.assertEqual(book.title, 'Renamed Book')
+        self.assertEqual(book.isbn, '1234567890123')
+        self.assertGreater(book.updated, self.book.updated)
+
+        other = Book.objects.get(id=other.id)
+        self.assertEqual(other.title, 'Other Book')
+        self.assertEqual(other.author, author)
+        self.assertEqual(str(other.published), '2012-02-02')
+
+    def test_bulk_partial_update_returns_per_item_errors(self):
+        """
+        Test that API returns a 400 response and does not update any book.
+        """
+        data = [
+            {'id': self.book.id, 'title': 'Renamed Book'},
+            {'title': 'No Id'},
+            {'id': 99, 'title': 'Missing'},
+            {'id': self.book.id, 'published': 'yesterday'},
+        ]
+        response = self.client.patch('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1], {'id': 'Field required'})
+        self.assertEqual(response.data[2], {'book': 'Not Found'})
+        self.assertIn('published', response.data[3])
+        self.assertEqual(Book.objects.get(id=self.book.id).title, 'Test Book')
+
+    def test_bulk_partial_update_checks_isbn_uniqueness(self):
+        """
+        Test that a book can keep its own ISBN but not take another book's.
+        """
+        other = Book.objects.create(
+            title='Other Book', author=self.author, isbn='1111111111111', published='2010-01-01'
+        )
+        data = [
+            {'id': self.book.id, 'isbn': self.book.isbn},
+            {'id': other.id, 'isbn': self.book.isbn},
+        ]
+        response = self.client.patch('/api/v1/books/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('isbn', response.data[1])
+
+    def test_bulk_deletes_books(self):
+        """
+        Test that API deletes every listed book.
+        """
+        other = Book.objects.create(
+            title='Other Book', author=self.author, isbn='1111111111111', published='2010-01-01'
+        )
+        response = self.client.delete('/api/v1/books/bulk', [self.book.id, other.id], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 2})
+        self.assertFalse(Book.objects.exists())
+
+    def test_bulk_delete_queries_do_not_grow_with_books(self):
+        """
+        Test that the books are read, deleted, removed from the search index
+        and counted off their authors with one query each, in a savepoint,
+        however many there are.
+        """
+        Book.objects.bulk_create([
+            Book(title='Bulk Book %d' % number, author=self.author, isbn='%013d' % number,
+                 published='2016-11-21')
+            for number in range(200)
+        ])
+        ids = list(Book.objects.values_list('id', flat=True))
+
+        with self.assertNumQueries(6):
+            response = self.client.delete('/api/v1/books/bulk', ids, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 201})
+        self.assertFalse(Book.objects.exists())
+
+    def test_bulk_delete_returns_per_item_errors(self):
+        """
+        Test that API returns a 400 response and does not delete any book.
+        """
+        response = self.client.delete('/api/v1/books/bulk', [self.book.id, 99, 'hi'], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [{}, {'book': 'Not Found'}, {'id': 'Incorrect format'}])
+        self.assertTrue(Book.objects.exists())
+
+
+class BulkAuthorsAPITestCase(LibraryAPIBaseTestCase):
+
+    def test_bulk_creates_authors(self):
+        """
+        Test that API creates every author and returns a 201 response.
+        """
+        data = [{'first_name': 'Author', 'last_name': '%d' % number} for number in range(50)]
+        response = self.client.post('/api/v1/authors/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Author.objects.filter(first_name='Author').count(), 50)
+
+    def test_bulk_partially_updates_authors(self):
+        """
+        Test that API updates the supplied author fields.
+        """
+        data = [{'id': self.author.id, 'last_name': 'Cameron'}]
+        response = self.client.patch('/api/v1/authors/bulk', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(str(Author.objects.get(id=self.author.id)), 'James Cameron')
+
+    def test_bulk_deletes_authors_and_their_books(self):
+        """
+        Test that API deletes the authors and cascades to their books.
+        """
+        response = self.client.delete('/api/v1/authors/bulk', [self.author.id], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Author.objects.exists())
+        self.assertFalse(Book.objects.exists())
+
+    def test_bulk_delete_of_authors_deletes_books_in_batches(self):
+        """
+        Test that the books of every author are deleted a batch at a time,
+        with a few queries per batch rather than per book.
+        """
+        other = Author.objects.create(first_name='Agatha', last_name='Christie')
+        Book.objects.bulk_create([
+            Book(title='Book %d' % number, author=other, isbn='%013d' % number, published='2016-11-13')
+            for number in range(300)
+        ])
+
+        with self.assertNumQueries(11):
+            response = self.client.delete('/api/v1/authors/bulk', [self.author.id, other.id], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 2})
+        self.assertFalse(Author.objects.exists())
+        self.assertFalse(Book.objects.exists())
@@ -0,0 +1,198 @@
+from __future__ import unicode_literals
+
+from django.db import transaction
+from django.test import SimpleTestCase
+
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from api_books.cache import LRUCache, detail_key, get_cache, list_key
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class LRUCacheTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.cache = LRUCache('test', {'TIMEOUT': 60, 'OPTIONS': {'MAX_ENTRIES': 2}})
+        self.cache.clear()
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test that the entry read least recently is dropped first.
+        """
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+
+    def test_expires_entries(self):
+        """
+        Test that entries are not returned after their timeout.
+        """
+        self.cache.set('a', 1, 0)
+        self.cache.set('b', 2, None)
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertFalse(self.cache.has_key('a'))
+        self.assertEqual(self.cache.get('b'), 2)
+
+    def test_add_and_incr(self):
+        """
+        Test that add only sets missing keys and incr needs an existing one.
+        """
+        self.assertTrue(self.cache.add('a', 1))
+        self.assertFalse(self.cache.add('a', 5))
+        self.assertEqual(self.cache.incr('a'), 2)
+        self.assertRaises(ValueError, self.cache.incr, 'missing')
+
+    def test_returns_copies(self):
+        """
+        Test that mutating a returned value does not change the cached one.
+        """
+        self.cache.set('a', {'title': 'Test Book'})
+        self.cache.get('a')['title'] = 'Changed'
+
+        self.assertEqual(self.cache.get('a'), {'title': 'Test Book'})
+
+
+class ResponseCacheAPITestCase(LibraryAPIBaseTestCase):
+
+    def test_caches_book_retrieve_and_list(self):
+        """
+        Test that repeated GETs are answered without querying the database.
+        """
+        first = self.client.get('/api/v1/books/1')
+        self.client.get('/api/v1/books?page_size=5')
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/v1/books/1')
+            self.client.get('/api/v1/books?page_size=5')
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
+
+    def test_does_not_cache_not_found(self):
+        """
+        Test that a book created after a 404 is returned.
+        """
+        self.assertEqual(self.client.get('/api/v1/books/99').status_code, status.HTTP_404_NOT_FOUND)
+        Book.objects.create(id=99, title='New', author=self.author,
+                            isbn='1000000000099', published='2016-11-21')
+
+        self.assertEqual(self.client.get('/api/v1/books/99').status_code, status.HTTP_200_OK)
+
+    def test_book_update_evicts_book(self):
+        """
+        Test that updating a book evicts its detail and the book lists.
+        """
+        self.client.get('/api/v1/books/1')
+        self.client.get('/api/v1/books')
+        self.client.put('/api/v1/books/1', {
+            'title': 'Updated Book',
+            'author': self.author.id,
+            'isbn': self.book.isbn,
+            'published': '2016-11-13'
+        }, format='json')
+
+        self.assertEqual(self.client.get('/api/v1/books/1').data['title'], 'Updated Book')
+        self.assertEqual(self.client.get('/api/v1/books').data['results'][0]['title'], 'Updated Book')
+
+    def test_author_update_evicts_their_books(self):
+        """
+        Test that renaming an author evicts the books that embed them.
+        """
+        self.client.get('/api/v1/books/1')
+        self.client.get('/api/v1/authors/%d' % self.author.id)
+        self.client.put('/api/v1/authors/%d' % self.author.id,
+                        {'first_name': 'Jane', 'last_name': 'Cook'}, format='json')
+
+        self.assertEqual(self.client.get('/api/v1/books/1').data['author']['first_name'], 'Jane')
+        self.assertEqual(self.client.get('/api/v1/authors/%d' % self.author.id).data['first_name'], 'Jane')
+
+    def test_create_evicts_lists(self):
+        """
+        Test that created books and authors appear in cached lists.
+        """
+        self.client.get('/api/v1/books')
+        self.client.get('/api/v1/authors')
+        self.client.post('/api/v1/books/createBookAndAuthor', {
+            'title': 'Book Test',
+            'author': {'first_name': 'Lisa', 'last_name': 'Cook'},
+            'isbn': '9876543210321',
+            'published': '2016-11-21'
+        }, format='json')
+
+        self.assertEqual(len(self.client.get('/api/v1/books').data['results']), 2)
+        self.assertEqual(len(self.client.get('/api/v1/authors').data['results']), 2)
+
+    def test_destroy_evicts_book(self):
+        """
+        Test that a deleted book is no longer returned.
+        """
+        book = Book.objects.create(title='Old', author=self.author,
+                                   isbn='1000000000001', published='2016-11-21')
+        self.client.get('/api/v1/books/%d' % book.id)
+        self.client.delete('/api/v1/books/%d' % book.id)
+
+        self.assertEqual(self.client.get('/api/v1/books/%d' % book.id).status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+    def test_author_destroy_evicts_their_books(self):
+        """
+        Test that the books of a deleted author are no longer returned,
+        evicted as they are deleted.
+        """
+        self.client.get('/api/v1/books/1')
+        self.client.get('/api/v1/authors/%d' % self.author.id)
+        self.client.delete('/api/v1/authors/%d' % self.author.id)
+
+        self.assertEqual(self.client.get('/api/v1/books/1').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get('/api/v1/authors/%d' % self.author.id).status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_update_of_authors_evicts_their_books(self):
+        """
+        Test that bulk updated authors evict their books too.
+        """
+        author = Author.objects.create(first_name='Lisa', last_name='Cook')
+        book = Book.objects.create(title='Old', author=author,
+                                   isbn='1000000000001', published='2016-11-21')
+        self.client.get('/api/v1/books/%d' % book.id)
+        self.client.patch('/api/v1/authors/bulk', [{'id': author.id, 'first_name': 'Anna'}], format='json')
+
+        self.assertEqual(self.client.get('/api/v1/books/%d' % book.id).data['author']['first_name'], 'Anna')
+
+
+class CommitEvictionTestCase(APITransactionTestCase):
+
+    def setUp(self):
+        get_cache().clear()
+        self.author = Author.objects.create(first_name='James', last_name='Cook')
+        self.book = Book.objects.create(title='Test Book', author=self.author, isbn='1234567890123',
+                                        published='2016-11-13')
+
+    def test_evicts_again_once_the_write_commits(self):
+        """
+        Test that a book cached by a read that ran while an update was in
+        progress, and so saw the book as it was, is evicted once the update
+        commits.
+        """
+        cache = get_cache()
+        path = '/api/v1/books/%d' % self.book.id
+        self.client.get(path)
+        self.client.get('/api/v1/books')
+        stale_detail = cache.get(detail_key(Book, self.book.id))
+        stale_list = cache.get(list_key(cache, Book, 'http://testserver/api/v1/books'))
+
+        with transaction.atomic():
+            self.client.patch(path, {'title': 'Renamed'}, format='json')
+            # As a read that ran before the commit would.
+            cache.set(detail_key(Book, self.book.id), stale_detail)
+            cache.set(list_key(cache, Book, 'http://testserver/api/v1/books'), stale_list)
+            self.assertEqual(self.client.get(path).data['title'], 'Test Book')
+
+        self.assertEqual(self.client.get(path).data['title'], 'Renamed')
+        self.assertEqual(self.client.get('/api/v1/books').data['results'][0]['title'], 'Renamed')
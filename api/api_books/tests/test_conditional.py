@@ -0,0 +1,221 @@
+from __future__ import unicode_literals
+
+from calendar import timegm
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+
+from rest_framework import status
+
+from api_books.cache import get_cache
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from api_books.views import AuthorViewSet, BookViewSet
+
+
+class ConditionalAPITestCase(LibraryAPIBaseTestCase):
+
+    def book_data(self, title):
+        return {
+            'title': title,
+            'author': self.author.id,
+            'isbn': self.book.isbn,
+            'published': '2016-11-13'
+        }
+
+    def test_sets_validators(self):
+        """
+        Test that retrieve and list responses carry ETag and Last-Modified.
+        """
+        for url in ('/api/v1/books/1', '/api/v1/books', '/api/v1/authors/1', '/api/v1/authors'):
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response['ETag'].startswith('"'), url)
+            self.assertIn('GMT', response['Last-Modified'])
+
+    def test_if_none_match_returns_not_modified(self):
+        """
+        Test that a matching ETag returns an empty 304 response without
+        querying the database again.
+        """
+        for url in ('/api/v1/books/1', '/api/v1/books?page_size=5'):
+            etag = self.client.get(url)['ETag']
+
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response.content, b'')
+            self.assertEqual(response['ETag'], etag)
+
+    def test_if_modified_since_returns_not_modified(self):
+        """
+        Test that a book not changed since the given date returns 304.
+        """
+        later = http_date(timegm(self.book.updated.utctimetuple()) + 1)
+        response = self.client.get('/api/v1/books/1', HTTP_IF_MODIFIED_SINCE=later)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get('/api/v1/books/1', HTTP_IF_MODIFIED_SINCE='Sat, 01 Jan 2000 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_etag_changes_with_writes(self):
+        """
+        Test that updating a book, renaming its author or adding a book
+        changes the ETags that cover them.
+        """
+        detail = self.client.get('/api/v1/books/1')['ETag']
+        listing = self.client.get('/api/v1/books')['ETag']
+
+        author = Author.objects.get(id=self.author.id)
+        author.first_name = 'Jane'
+        author.save()
+        self.assertNotEqual(self.client.get('/api/v1/books/1')['ETag'], detail)
+
+        Book.objects.create(title='New', author=self.author, isbn='1000000000001', published='2016-11-21')
+        self.assertNotEqual(self.client.get('/api/v1/books')['ETag'], listing)
+
+    def test_etags_differ_per_page(self):
+        """
+        Test that pages of the same list have different ETags.
+        """
+        Book.objects.create(title='New', author=self.author, isbn='1000000000001', published='2016-11-21')
+        first = self.client.get('/api/v1/books?page_size=1')
+        following = self.client.get(first.data['next'])
+
+        self.assertNotEqual(first['ETag'], following['ETag'])
+
+    def test_list_validators_read_the_page(self):
+        """
+        Test that the validators of a page are read from its rows with a
+        LIMIT rather than aggregated over the list, and change with a row of
+        the page or a page appearing after it.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            etag = self.client.get('/api/v1/books?page_size=1')['ETag']
+
+        for query in queries.captured_queries:
+            self.assertIn('LIMIT', query['sql'])
+            for aggregate in ('COUNT(', 'MAX(', 'SUM('):
+                self.assertNotIn(aggregate, query['sql'])
+
+        Book.objects.create(title='New', author=self.author, isbn='1000000000001', published='2016-11-21')
+        following = self.client.get('/api/v1/books?page_size=1')['ETag']
+        self.assertNotEqual(following, etag)
+
+        Book.objects.filter(id=self.book.id).update(updated=timezone.now() + timedelta(seconds=1))
+        # Queryset updates send no rows_saved to evict the validators.
+        get_cache().clear()
+        self.assertNotEqual(self.client.get('/api/v1/books?page_size=1')['ETag'], following)
+
+    def test_update_with_matching_if_match(self):
+        """
+        Test that an update with the current ETag succeeds and returns the
+        new ETag.
+        """
+        etag = self.client.get('/api/v1/books/1')['ETag']
+
+        response = self.client.put('/api/v1/books/1', self.book_data('Updated Book'),
+                                   format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get('/api/v1/books/1')['ETag'], response['ETag'])
+
+    def test_update_with_stale_if_match_returns_precondition_failed(self):
+        """
+        Test that an update based on an outdated read is rejected.
+        """
+        etag = self.client.get('/api/v1/books/1')['ETag']
+        self.client.put('/api/v1/books/1', self.book_data('First Update'), format='json')
+
+        response = self.client.put('/api/v1/books/1', self.book_data('Second Update'),
+                                   format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data, {'book': 'Precondition Failed'})
+        self.assertEqual(Book.objects.get(id=1).title, 'First Update')
+
+    def test_author_update_with_stale_if_match_returns_precondition_failed(self):
+        """
+        Test that If-Match also guards author updates.
+        """
+        url = '/api/v1/authors/%d' % self.author.id
+        response = self.client.put(url, {'first_name': 'Jane', 'last_name': 'Cook'},
+                                   format='json', HTTP_IF_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data, {'author': 'Precondition Failed'})
+
+    def test_if_match_is_checked_against_the_database(self):
+        """
+        Test that If-Match is compared with the row as it is, not with the
+        validators cached before a write the cache missed.
+        """
+        etag = self.client.get('/api/v1/books/1')['ETag']
+        Book.objects.filter(id=1).update(title='Written Elsewhere', updated=timezone.now() + timedelta(seconds=1))
+
+        response = self.client.put('/api/v1/books/1', self.book_data('Updated Book'),
+                                   format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(Book.objects.get(id=1).title, 'Written Elsewhere')
+
+    def race(self, viewset, model, pk, **values):
+        """
+        Makes the next If-Match check of viewset be followed by a write of
+        values to the row, as if another request wrote it in between.
+        """
+        get_resource_values = viewset.get_resource_values
+
+        def check_then_write(view, request, *args, **kwargs):
+            result = get_resource_values(view, request, *args, **kwargs)
+            model.objects.filter(pk=pk).update(updated=timezone.now() + timedelta(seconds=1), **values)
+            return result
+
+        viewset.get_resource_values = check_then_write
+        self.addCleanup(setattr, viewset, 'get_resource_values', get_resource_values)
+
+    def test_write_racing_if_match_returns_precondition_failed(self):
+        """
+        Test that the If-Match check is part of the write, so an update made
+        after the check is not overwritten.
+        """
+        etag = self.client.get('/api/v1/books/1')['ETag']
+        self.race(BookViewSet, Book, 1, title='Concurrent Update')
+
+        response = self.client.put('/api/v1/books/1', self.book_data('Updated Book'),
+                                   format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data, {'book': 'Precondition Failed'})
+        self.assertEqual(Book.objects.get(id=1).title, 'Concurrent Update')
+
+    def test_partial_updates_racing_if_match_return_precondition_failed(self):
+        """
+        Test that partial updates of books and authors are guarded too.
+        """
+        other = Author.objects.create(first_name='Lisa', last_name='Cook')
+        for data in ({'title': 'Updated Book'}, {'author': other.id}):
+            etag = self.client.get('/api/v1/books/1')['ETag']
+            self.race(BookViewSet, Book, 1, title='Concurrent Update')
+
+            response = self.client.patch('/api/v1/books/1', data, format='json', HTTP_IF_MATCH=etag)
+
+            self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+            self.assertEqual(Book.objects.get(id=1).author_id, self.author.id)
+            self.doCleanups()
+
+        url = '/api/v1/authors/%d' % self.author.id
+        etag = self.client.get(url)['ETag']
+        self.race(AuthorViewSet, Author, self.author.id, first_name='Concurrent')
+
+        response = self.client.patch(url, {'last_name': 'Smith'}, format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data, {'author': 'Precondition Failed'})
+        self.assertEqual(Author.objects.get(id=self.author.id).last_name, self.author.last_name)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api_books.cache import get_cache
+from api_books.converters import compile_converter
+from api_books.models import Author, Book
+from api_books.parsers import FastJSONParser
+from api_books.renderers import FastJSONRenderer
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from api_books.views import AuthorViewSet, BookViewSet
+
+
+class ValuesListTestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(ValuesListTestCase, self).setUp()
+        author = Author.objects.create(first_name='Gabriel', last_name='García Márquez')
+        Book.objects.create(title='Cien años de soledad ', author=author,
+                            isbn='9780307474728', published='1967-05-30')
+
+    def get_with_serializers(self, viewset, path):
+        """
+        Returns the response of path from the serializers, without the
+        values() rows.
+        """
+        get_row_converter = viewset.get_row_converter
+        viewset.get_row_converter = lambda self: None
+        try:
+            return self.client.get(path)
+        finally:
+            viewset.get_row_converter = get_row_converter
+
+    def assertSameContent(self, viewset, path):
+        response = self.client.get(path)
+        get_cache().clear()
+        expected = self.get_with_serializers(viewset, path)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected.content)
+
+    def test_book_lists_are_the_same(self):
+        """
+        Test that book lists are rendered the same from values() rows as
+        from the serializer, with every field selection.
+        """
+        for query in ('', '?page_size=1', '?ordering=-title', '?fields=title,isbn',
+                      '?fields=title,author', '?expand=', '?fields=author&expand=author'):
+            self.assertSameContent(BookViewSet, '/api/v1/books' + query)
+
+    def test_author_lists_are_the_same(self):
+        """
+        Test that author lists are rendered the same from values() rows as
+        from the serializer.
+        """
+        for query in ('', '?page_size=1', '?ordering=-last_name'):
+            self.assertSameContent(AuthorViewSet, '/api/v1/authors' + query)
+
+    def test_next_page(self):
+        """
+        Test that the cursor read from values() rows leads to the next page.
+        """
+        first = self.client.get('/api/v1/books?page_size=1&fields=isbn')
+        second = self.client.get(first.data['next'])
+
+        self.assertEqual([book['isbn'] for book in second.data['results']], ['9780307474728'])
+
+
+class CompileConverterTestCase(SimpleTestCase):
+
+    def test_serializer_methods_are_not_compiled(self):
+        """
+        Test that serializers with fields that do not read a model field get
+        no converter.
+        """
+        class TitledAuthorSerializer(serializers.ModelSerializer):
+            title = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Author
+                fields = ('id', 'title')
+
+            def get_title(self, author):
+                return 'Dr.'
+
+        self.assertIsNone(compile_converter(TitledAuthorSerializer()))
+
+
+class FastJSONTestCase(SimpleTestCase):
+
+    def test_renders_the_same_as_json_renderer(self):
+        """
+        Test that the output is the same as JSONRenderer's, including for
+        types orjson would render differently.
+        """
+        for data in (
+            OrderedDict([('title', 'Cien años '), ('id', 1), ('author', None)]),
+            [{'updated': timezone.now(), 'naive': datetime(2016, 11, 13, 10, 0, 0, 123456)}],
+            {'price': Decimal('9.99')},
+            [],
+        ):
+            self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            FastJSONRenderer().render({'id': 1}, 'application/json; indent=4'),
+            JSONRenderer().render({'id': 1}, 'application/json; indent=4')
+        )
+
+    def test_parses_the_same_as_json_parser(self):
+        """
+        Test that documents are parsed as JSONParser does, and that the same
+        documents are rejected.
+        """
+        for content in ('{"title": "Cien años", "ids": [1, 2]}', '{"value": NaN}', '[18446744073709551616]',
+                        '[0.30000000000000004, 1e400]'):
+            content = content.encode('utf-8')
+            self.assertEqual(
+                repr(FastJSONParser().parse(BytesIO(content))),
+                repr(JSONParser().parse(BytesIO(content)))
+            )
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"title": '))
@@ -0,0 +1,135 @@
+from __future__ import unicode_literals
+
+from rest_framework import status
+
+from api_books.counts import add_book_counts, recount_books
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class BookCountTestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(BookCountTestCase, self).setUp()
+        self.other = Author.objects.create(first_name='Lisa', last_name='Cook')
+        # The books of the fixtures were created without the API.
+        recount_books()
+
+    def assertBookCounts(self, *counts):
+        self.assertEqual(
+            tuple(Author.objects.filter(id__in=[self.author.id, self.other.id]).order_by('id')
+                  .values_list('book_count', flat=True)),
+            counts
+        )
+
+    def book_data(self, number, author):
+        return {'title': 'Book %d' % number, 'author': author, 'isbn': '%013d' % number, 'published': '2016-11-21'}
+
+    def test_recounts_books(self):
+        """
+        Test that recount_books() counts the books of every author, or of the
+        given ones.
+        """
+        Author.objects.update(book_count=5)
+
+        recount_books([self.other.id])
+        self.assertBookCounts(5, 0)
+        recount_books()
+        self.assertBookCounts(1, 0)
+
+    def test_adds_book_counts(self):
+        """
+        Test that add_book_counts() moves the counts of several authors at
+        once and ignores the ones that do not change.
+        """
+        add_book_counts({self.author.id: 2, self.other.id: -1})
+        self.assertBookCounts(3, -1)
+        add_book_counts({self.author.id: 0})
+        self.assertBookCounts(3, -1)
+
+    def test_writes_keep_counts(self):
+        """
+        Test that creating, moving and deleting books through the API keeps
+        the counts of their authors.
+        """
+        response = self.client.post('/api/v1/books', self.book_data(1, self.other.id), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertBookCounts(1, 1)
+        book_id = response.data['id']
+
+        response = self.client.put('/api/v1/books/%d' % book_id, self.book_data(1, self.author.id), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBookCounts(2, 0)
+
+        response = self.client.patch('/api/v1/books/%d' % book_id, {'author': self.other.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBookCounts(1, 1)
+
+        response = self.client.patch('/api/v1/books/%d' % book_id, {'title': 'Renamed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBookCounts(1, 1)
+
+        response = self.client.delete('/api/v1/books/%d' % book_id)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertBookCounts(1, 0)
+
+    def test_bulk_writes_keep_counts(self):
+        """
+        Test that bulk creates, updates and deletes move the counts of every
+        author involved.
+        """
+        data = [self.book_data(number, self.other.id if number % 2 else self.author.id) for number in range(6)]
+        response = self.client.post('/api/v1/books/bulk', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertBookCounts(4, 3)
+
+        ids = list(Book.objects.filter(author=self.other).values_list('id', flat=True))
+        response = self.client.patch('/api/v1/books/bulk', [{'id': ids[0], 'author': self.author.id}],
+                                     format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBookCounts(5, 2)
+
+        response = self.client.delete('/api/v1/books/bulk', ids, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBookCounts(4, 0)
+
+    def test_create_book_and_author_counts_the_book(self):
+        """
+        Test that the author created with a book starts with one book.
+        """
+        data = self.book_data(1, {'first_name': 'John', 'last_name': 'Murray'})
+        response = self.client.post('/api/v1/books/createBookAndAuthor', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Author.objects.get(last_name='Murray').book_count, 1)
+
+    def test_author_responses_show_counts(self):
+        """
+        Test that authors are listed and retrieved with their book count, and
+        that a new book changes their ETag.
+        """
+        response = self.client.get('/api/v1/authors')
+        self.assertEqual([author['book_count'] for author in response.data['results']], [1, 0])
+        list_etag = response['ETag']
+
+        response = self.client.get('/api/v1/authors/%d' % self.other.id)
+        self.assertEqual(response.data['book_count'], 0)
+        detail_etag = response['ETag']
+
+        self.client.post('/api/v1/books', self.book_data(1, self.other.id), format='json')
+
+        response = self.client.get('/api/v1/authors', HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([author['book_count'] for author in response.data['results']], [1, 1])
+        response = self.client.get('/api/v1/authors/%d' % self.other.id, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['book_count'], 1)
+
+    def test_books_nest_authors_without_counts(self):
+        """
+        Test that the author nested in books has no book count, which other
+        books would change.
+        """
+        response = self.client.get('/api/v1/books/%d' % self.book.id)
+
+        self.assertNotIn('book_count', response.data['author'])
@@ -0,0 +1,293 @@
+from __future__ import unicode_literals
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.utils import ConnectionHandler, OperationalError
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from config.db import on_commit
+from config.db.pool import ConnectionPool, PooledConnection, PoolTimeout, close_pools, get_pool
+
+
+class StandInConnection(object):
+    """
+    Stands in for a DB-API connection.
+    """
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def connect():
+    return PooledConnection(StandInConnection())
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+
+    def test_reuses_released_connections(self):
+        """
+        Test that released connections are reused instead of opening new ones.
+        """
+        pool = ConnectionPool(max_size=2)
+
+        first = pool.acquire(connect)
+        pool.release(first)
+        second = pool.acquire(connect)
+
+        self.assertIs(second, first)
+        stats = pool.stats()
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['checkouts'], 2)
+        self.assertEqual(stats['in_use'], 1)
+
+    def test_waits_for_a_connection_when_all_are_in_use(self):
+        """
+        Test that a thread waits for a connection to be released when the
+        pool is at its size, and that the wait is measured.
+        """
+        pool = ConnectionPool(max_size=1, timeout=5)
+        held = pool.acquire(connect)
+        acquired = []
+
+        thread = threading.Thread(target=lambda: acquired.append(pool.acquire(connect)))
+        thread.start()
+        thread.join(0.05)
+        self.assertEqual(acquired, [])
+
+        pool.release(held)
+        thread.join()
+
+        self.assertIs(acquired[0], held)
+        stats = pool.stats()
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['max_wait'], 0)
+
+    def test_times_out(self):
+        """
+        Test that acquire() gives up after the timeout.
+        """
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        pool.acquire(connect)
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire(connect)
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_replaces_failed_and_expired_connections(self):
+        """
+        Test that connections failing the check or older than max_age are
+        closed and replaced.
+        """
+        pool = ConnectionPool(max_size=1)
+        broken = pool.acquire(connect)
+        pool.release(broken)
+
+        replacement = pool.acquire(connect, check=lambda connection: False)
+
+        self.assertIsNot(replacement, broken)
+        self.assertTrue(broken.connection.closed)
+
+        pool.release(replacement)
+        pool.max_age = 0
+        self.assertIsNot(pool.acquire(connect), replacement)
+        self.assertTrue(replacement.connection.closed)
+        self.assertEqual(pool.stats()['failed_checks'], 1)
+        self.assertEqual(pool.stats()['closed'], 2)
+
+    def test_discards_and_frees_the_place(self):
+        """
+        Test that discarding a connection closes it and lets another open.
+        """
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        pooled = pool.acquire(connect)
+
+        pool.discard(pooled)
+
+        self.assertTrue(pooled.connection.closed)
+        self.assertIsNot(pool.acquire(connect), pooled)
+
+    def test_forked_process_starts_over(self):
+        """
+        Test that a process forked with an open pool does not reuse, or
+        close, the parent's connections.
+        """
+        pool = ConnectionPool(max_size=1)
+        inherited = pool.acquire(connect)
+        pool.release(inherited)
+        pool.pid = -1
+
+        self.assertIsNot(pool.acquire(connect), inherited)
+        self.assertFalse(inherited.connection.closed)
+        self.assertEqual(pool.stats()['created'], 1)
+
+
+class ManagedConnectionTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        close_pools()
+        shutil.rmtree(self.directory)
+
+    def get_connections(self, **settings):
+        settings.setdefault('ENGINE', 'config.db.backends.sqlite3')
+        settings.setdefault('NAME', os.path.join(self.directory, 'db.sqlite3'))
+        return ConnectionHandler({'default': settings})
+
+    def in_thread(self, connections, function):
+        """
+        Runs function with the connection of a new thread and closes it, as
+        at the end of a request, and returns its result or raises its error.
+        """
+        results = []
+
+        def run():
+            connection = connections['default']
+            try:
+                results.append(function(connection))
+            except Exception as e:
+                results.append(e)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        if isinstance(results[0], Exception):
+            raise results[0]
+        return results[0]
+
+    def test_threads_share_pooled_connections(self):
+        """
+        Test that connections closed by a thread are reused by the next one.
+        """
+        connections = self.get_connections(POOL={'MAX_SIZE': 2})
+
+        first = self.in_thread(connections, lambda connection: connection.cursor() and connection.connection)
+        second = self.in_thread(connections, lambda connection: connection.cursor() and connection.connection)
+
+        self.assertIs(second, first)
+        stats = get_pool('default', {}).stats()
+        self.assertEqual((stats['created'], stats['checkouts'], stats['idle']), (1, 2, 1))
+
+    def test_pool_timeout_is_an_operational_error(self):
+        """
+        Test that running out of pooled connections raises OperationalError.
+        """
+        connections = self.get_connections(POOL={'MAX_SIZE': 1, 'TIMEOUT': 0.01})
+        connections['default'].cursor()
+
+        with self.assertRaises(OperationalError):
+            self.in_thread(connections, lambda connection: connection.cursor())
+        connections['default'].close()
+
+    def test_does_not_pool_connections_in_a_transaction(self):
+        """
+        Test that a connection closed within a transaction is discarded.
+        """
+        connections = self.get_connections(POOL={'MAX_SIZE': 1})
+        connection = connections['default']
+        connection.set_autocommit(False)
+
+        connection.close()
+
+        stats = get_pool('default', {}).stats()
+        self.assertEqual((stats['idle'], stats['closed']), (0, 1))
+
+    def test_health_check_replaces_broken_persistent_connections(self):
+        """
+        Test that a persistent connection that broke between requests is
+        replaced before it is used in the next one.
+        """
+        connections = self.get_connections(CONN_MAX_AGE=None, CONN_HEALTH_CHECKS=True)
+        connection = connections['default']
+        connection.cursor()
+        broken = connection.connection
+        broken.close()
+
+        # As a new request starts.
+        connection.close_if_unusable_or_obsolete()
+        cursor = connection.cursor()
+        cursor.execute('SELECT 1')
+
+        self.assertIsNot(connection.connection, broken)
+        connection.close()
+
+
+class OnCommitTestCase(TransactionTestCase):
+
+    def test_runs_after_commit(self):
+        """
+        Test that functions run once the outermost transaction commits, and
+        at once outside of one.
+        """
+        calls = []
+        with transaction.atomic():
+            on_commit(lambda: calls.append('outer'))
+            with transaction.atomic():
+                on_commit(lambda: calls.append('inner'))
+            self.assertEqual(calls, [])
+        on_commit(lambda: calls.append('autocommit'))
+
+        self.assertEqual(calls, ['outer', 'inner', 'autocommit'])
+
+    def test_discards_rolled_back_functions(self):
+        """
+        Test that functions of a rolled back transaction or savepoint never
+        run.
+        """
+        calls = []
+        with transaction.atomic():
+            on_commit(lambda: calls.append('kept'))
+            try:
+                with transaction.atomic():
+                    on_commit(lambda: calls.append('savepoint'))
+                    raise ValueError
+            except ValueError:
+                pass
+        try:
+            with transaction.atomic():
+                on_commit(lambda: calls.append('transaction'))
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertEqual(calls, ['kept'])
+
+
+class PoolStatsViewTestCase(TestCase):
+
+    def tearDown(self):
+        close_pools()
+
+    def test_requires_staff(self):
+        """
+        Test that pool stats are only shown to staff.
+        """
+        response = self.client.get('/admin/db-pool/')
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_returns_pool_stats(self):
+        """
+        Test that staff get the stats of the process's pools.
+        """
+        get_pool('replica', {'MAX_SIZE': 3})
+        User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.login(username='admin', password='secret')
+
+        response = self.client.get('/admin/db-pool/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['pools']['replica']['max_size'], 3)
@@ -0,0 +1,128 @@
+from __future__ import unicode_literals
+
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from api_books.cache import get_cache
+from api_books.counts import recount_books
+from api_books.deletion import delete_author, run_deletion
+from api_books.models import Author, Book, DeletionJob
+from api_books.signals import rows_deleted
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from api_books.views import AuthorViewSet
+
+
+class AuthorDeletionTestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(AuthorDeletionTestCase, self).setUp()
+        self.prolific = Author.objects.create(first_name='Agatha', last_name='Christie')
+        Book.objects.bulk_create([
+            Book(title='Book %d' % number, author=self.prolific, isbn='%013d' % number, published='2016-11-13')
+            for number in range(7)
+        ])
+
+    def test_deletes_in_batches(self):
+        """
+        Test that an author's books are deleted a batch at a time and that
+        progress is reported after each batch.
+        """
+        progress = []
+        deleted = delete_author(self.prolific.id, batch_size=3, progress=progress.append)
+
+        self.assertEqual(deleted, 7)
+        self.assertEqual(progress, [3, 6, 7])
+        self.assertFalse(Author.objects.filter(id=self.prolific.id).exists())
+        self.assertEqual(list(Book.objects.values_list('author_id', flat=True)), [self.author.id])
+
+    def test_missing_author(self):
+        """
+        Test that deleting an author that does not exist returns None.
+        """
+        self.assertIsNone(delete_author(0))
+
+    @override_settings(BACKGROUND_JOBS_EAGER=True)
+    def test_async_delete(self):
+        """
+        Test that an async delete returns a 202 response with a job, which
+        its Location shows as done with the books it deleted.
+        """
+        response = self.client.delete('/api/v1/authors/%d?async=true' % self.prolific.id)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(response['Location'].endswith('/api/v1/jobs/%d' % response.data['id']))
+
+        response = self.client.get(response['Location'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], DeletionJob.DONE)
+        self.assertEqual(response.data['books_deleted'], 7)
+        self.assertFalse(Author.objects.filter(id=self.prolific.id).exists())
+
+    def test_async_delete_of_missing_author(self):
+        """
+        Test that an async delete of an author that does not exist returns
+        a 404 response without creating a job.
+        """
+        response = self.client.delete('/api/v1/authors/0?async=true')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(DeletionJob.objects.exists())
+
+    def test_resumes_interrupted_job(self):
+        """
+        Test that running an interrupted job again finishes it, counting the
+        books it had deleted before.
+        """
+        job = DeletionJob.objects.create(author_id=self.prolific.id, status=DeletionJob.RUNNING,
+                                         books_deleted=2)
+
+        run_deletion(job.id, batch_size=5)
+
+        job = DeletionJob.objects.get(id=job.id)
+        self.assertEqual(job.status, DeletionJob.DONE)
+        self.assertEqual(job.books_deleted, 9)
+
+    def test_missing_job(self):
+        """
+        Test that a job that does not exist returns a 404 response.
+        """
+        response = self.client.get('/api/v1/jobs/0')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class AuthorDeletionCommitTestCase(APITransactionTestCase):
+
+    def setUp(self):
+        get_cache().clear()
+        self.author = Author.objects.create(first_name='Agatha', last_name='Christie')
+        Book.objects.bulk_create([
+            Book(title='Book %d' % number, author=self.author, isbn='%013d' % number, published='2016-11-13')
+            for number in range(5)
+        ])
+        recount_books()
+        self.addCleanup(setattr, AuthorViewSet, 'delete_batch_size', AuthorViewSet.delete_batch_size)
+        AuthorViewSet.delete_batch_size = 2
+
+    def test_destroy_commits_every_batch(self):
+        """
+        Test that the batches an author delete finished stay deleted when a
+        later one fails, as they are not all in one transaction.
+        """
+        batches = []
+
+        def fail_second_batch(sender, ids, **kwargs):
+            batches.append(ids)
+            if len(batches) == 2:
+                raise RuntimeError('Second batch')
+
+        rows_deleted.connect(fail_second_batch, sender=Book)
+        self.addCleanup(rows_deleted.disconnect, fail_second_batch, sender=Book)
+
+        with self.assertRaises(RuntimeError):
+            self.client.delete('/api/v1/authors/%d' % self.author.id)
+
+        self.assertEqual(Book.objects.count(), 3)
+        self.assertEqual(Author.objects.get(id=self.author.id).book_count, 3)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import json
+from datetime import timedelta
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from rest_framework import status
+
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from api_books.views import BookViewSet
+
+
+class ExportAPITestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(ExportAPITestCase, self).setUp()
+
+        self.other_author = Author.objects.create(first_name='Ana', last_name='Núñez')
+        for number in range(4):
+            Book.objects.create(
+                title='Libro %d' % number,
+                author=self.other_author,
+                isbn='000000000000%d' % number,
+                published='2010-01-0%d' % (number + 1)
+            )
+
+    def content(self, response):
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_export_streams_ndjson(self):
+        """
+        Test that every book is exported as one JSON document per line, in
+        the same format as the book list.
+        """
+        response = self.client.get('/api/v1/books/export')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('application/x-ndjson'))
+
+        lines = self.content(response).splitlines()
+        listed = self.client.get('/api/v1/books').data['results']
+        self.assertEqual(len(lines), 5)
+        self.assertEqual([json.loads(line) for line in lines], json.loads(json.dumps(listed)))
+
+    def test_export_streams_csv(self):
+        """
+        Test that every book is exported as a flattened CSV row.
+        """
+        response = self.client.get('/api/v1/books/export?type=csv')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+
+        rows = [line.split(',') for line in self.content(response).splitlines()]
+        self.assertEqual(rows[0][:4], ['id', 'title', 'isbn', 'published'])
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[-1][1:4], ['Libro 3', '0000000000003', '2010-01-04'])
+        self.assertEqual(rows[-1][-2:], ['Ana', 'Núñez'])
+
+    def test_export_reads_in_chunks(self):
+        """
+        Test that the export fetches rows in fixed size chunks.
+        """
+        chunk_size = BookViewSet.export_chunk_size
+        BookViewSet.export_chunk_size = 2
+        self.addCleanup(setattr, BookViewSet, 'export_chunk_size', chunk_size)
+
+        response = self.client.get('/api/v1/books/export')
+
+        # Five books take three chunks plus the final empty one.
+        with self.assertNumQueries(4):
+            lines = self.content(response).splitlines()
+        self.assertEqual(len(lines), 5)
+
+    def test_export_since_watermark(self):
+        """
+        Test that updated__gt only exports books changed after the watermark,
+        including books whose author changed.
+        """
+        watermark = timezone.now()
+        Book.objects.filter(author=self.other_author).update(updated=watermark - timedelta(days=1))
+        Book.objects.filter(id=self.book.id).update(updated=watermark - timedelta(days=1))
+        Author.objects.filter(id=self.author.id).update(updated=watermark - timedelta(days=1))
+
+        changed = Book.objects.filter(author=self.other_author).first()
+        changed.save()
+
+        response = self.client.get(
+            '/api/v1/books/export', {'updated__gt': watermark.isoformat()}
+        )
+        lines = self.content(response).splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [changed.id])
+
+        self.author.save()
+        response = self.client.get(
+            '/api/v1/books/export', {'updated__gt': watermark.isoformat()}
+        )
+        lines = self.content(response).splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [self.book.id, changed.id])
+
+    def test_export_rejects_invalid_watermark(self):
+        """
+        Test that API returns a 400 response for an invalid updated__gt.
+        """
+        response = self.client.get('/api/v1/books/export?updated__gt=yesterday')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'updated__gt': 'Incorrect format'})
+
+    def test_export_rejects_unknown_type(self):
+        """
+        Test that API returns a 400 response for an unknown export type.
+        """
+        response = self.client.get('/api/v1/books/export?type=xml')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,92 @@
+from __future__ import unicode_literals
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+
+from api_books.models import Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class SparseFieldsAPITestCase(LibraryAPIBaseTestCase):
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Leaves out the queries of the validators, which read the updated
+        # columns of the book and of its author.
+        validators = '"api_books_book"."updated", "api_books_author"."updated"'
+        book_queries = [query['sql'] for query in queries.captured_queries if validators not in query['sql']]
+        return response.data, book_queries
+
+    def test_returns_requested_fields(self):
+        """
+        Test that only the requested fields are returned and selected.
+        """
+        data, queries = self.get('/api/v1/books?fields=id,title,isbn')
+
+        self.assertEqual(list(data['results'][0]), ['id', 'title', 'isbn'])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('JOIN', queries[0])
+        self.assertNotIn('published', queries[0])
+
+    def test_selects_ordering_columns(self):
+        """
+        Test that the ordering columns are loaded with the requested fields
+        so the cursor needs no extra queries.
+        """
+        Book.objects.create(title='Alpha', author=self.author, isbn='1000000000001', published='2016-11-21')
+
+        data, queries = self.get('/api/v1/books?fields=title&ordering=published&page_size=1')
+        following, following_queries = self.get(data['next'])
+
+        self.assertEqual([book['title'] for book in data['results'] + following['results']],
+                         ['Test Book', 'Alpha'])
+        self.assertEqual((len(queries), len(following_queries)), (1, 1))
+
+    def test_author_is_an_id_unless_expanded(self):
+        """
+        Test that a requested author is its id unless it is expanded.
+        """
+        data, queries = self.get('/api/v1/books/1?fields=id,author')
+        self.assertEqual(data, {'id': 1, 'author': self.author.id})
+        self.assertNotIn('JOIN', queries[-1])
+
+        data, queries = self.get('/api/v1/books/1?fields=id,author&expand=author')
+        self.assertEqual(data['author']['last_name'], 'Cook')
+        self.assertIn('JOIN', queries[-1])
+
+    def test_expand_defaults_to_author(self):
+        """
+        Test that all fields are returned with the author nested by default,
+        and with the author id when expansion is turned off.
+        """
+        data, queries = self.get('/api/v1/books/1')
+        self.assertEqual(data['author']['first_name'], 'James')
+
+        data, queries = self.get('/api/v1/books/1?expand=')
+        self.assertEqual(data['author'], self.author.id)
+        self.assertEqual(len(data), 7)
+
+    def test_caches_each_fieldset(self):
+        """
+        Test that different fieldsets of a book are cached separately.
+        """
+        self.get('/api/v1/books/1?fields=title')
+        data, queries = self.get('/api/v1/books/1?fields=isbn')
+
+        self.assertEqual(data, {'isbn': self.book.isbn})
+
+    def test_unknown_fields_return_bad_request(self):
+        """
+        Test that API returns a 400 response for unknown fields or expansions.
+        """
+        response = self.client.get('/api/v1/books?fields=id,price')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data)
+
+        response = self.client.get('/api/v1/books/1?expand=publisher')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('expand', response.data)
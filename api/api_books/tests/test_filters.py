@@ -0,0 +1,172 @@
+from __future__ import unicode_literals
+
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api_books.filters import IndexedFieldsFilterBackend
+from api_books.models import Author, Book
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from api_books.views import AuthorViewSet, BookViewSet
+
+
+def query_plan(queryset):
+    """
+    Returns the SQLite query plan of queryset as a single string.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return ' '.join(row[-1] for row in cursor.fetchall())
+
+
+class FilterAPITestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(FilterAPITestCase, self).setUp()
+
+        self.other_author = Author.objects.create(first_name='Lisa', last_name='Cook')
+        self.books = [
+            Book.objects.create(title='Alpha', author=self.other_author,
+                                isbn='1000000000001', published='1999-05-01'),
+            Book.objects.create(title='Alphabet', author=self.other_author,
+                                isbn='1000000000002', published='2005-05-01'),
+            Book.objects.create(title='Beta', author=self.author,
+                                isbn='1000000000003', published='2010-05-01'),
+        ]
+
+    def titles(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [book['title'] for book in response.data['results']]
+
+    def filtered(self, viewset, url):
+        """
+        Returns the queryset the filter backend builds for url.
+        """
+        request = Request(APIRequestFactory().get(url))
+        view = viewset(request=request)
+        return IndexedFieldsFilterBackend().filter_queryset(request, view.get_queryset(), view)
+
+    def test_filters_books_by_author(self):
+        """
+        Test that API only returns the books of the given author.
+        """
+        titles = self.titles('/api/v1/books?author=%d' % self.other_author.id)
+
+        self.assertEqual(titles, ['Alpha', 'Alphabet'])
+
+    def test_filters_books_by_isbn(self):
+        """
+        Test that API returns the book with the given ISBN.
+        """
+        self.assertEqual(self.titles('/api/v1/books?isbn=1000000000003'), ['Beta'])
+
+    def test_filters_books_by_title_prefix(self):
+        """
+        Test that API returns the books whose title starts with the prefix.
+        """
+        self.assertEqual(self.titles('/api/v1/books?title__startswith=Alph'), ['Alpha', 'Alphabet'])
+        self.assertEqual(self.titles('/api/v1/books?title__startswith=alph'), [])
+
+    def test_filters_books_by_prefix_ending_in_last_code_point(self):
+        """
+        Test that a prefix whose last code point has no successor, where no
+        range can stand for it, still filters with a plain startswith.
+        """
+        Book.objects.create(title='Omega \U0010ffff', author=self.author, isbn='1000000000004',
+                            published='2010-05-01')
+
+        queryset = self.filtered(BookViewSet, '/api/v1/books?title__startswith=Omega \U0010ffff')
+
+        self.assertEqual([book.title for book in queryset], ['Omega \U0010ffff'])
+        self.assertIn('LIKE', '%s' % queryset.query)
+
+    def test_filters_books_by_published_range(self):
+        """
+        Test that API returns the books published within the range.
+        """
+        titles = self.titles('/api/v1/books?published__gte=2000-01-01&published__lte=2010-12-31')
+
+        self.assertEqual(titles, ['Alphabet', 'Beta'])
+
+    def test_filters_books_updated_since(self):
+        """
+        Test that API returns the books updated after the given datetime.
+        """
+        watermark = timezone.now() - timedelta(hours=1)
+        Book.objects.exclude(id=self.books[1].id).update(updated=watermark - timedelta(days=1))
+
+        titles = self.titles('/api/v1/books?updated__gt=%s' % watermark.strftime('%Y-%m-%dT%H:%M:%S'))
+
+        self.assertEqual(titles, ['Alphabet'])
+
+    def test_invalid_filter_returns_bad_request(self):
+        """
+        Test that API returns a 400 response naming the invalid parameters.
+        """
+        response = self.client.get('/api/v1/books?author=hi&published__gte=2013/04/16')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {'author', 'published__gte'})
+
+    def test_orders_books_by_whitelisted_fields(self):
+        """
+        Test that API orders books by an allowed field and pages through them.
+        """
+        self.assertEqual(self.titles('/api/v1/books?ordering=-title'), ['Test Book', 'Beta', 'Alphabet', 'Alpha'])
+
+        response = self.client.get('/api/v1/books?ordering=published&page_size=2')
+        following = self.client.get(response.data['next'])
+        self.assertEqual(
+            [book['title'] for book in response.data['results'] + following.data['results']],
+            ['Alpha', 'Alphabet', 'Beta', 'Test Book']
+        )
+
+    def test_ignores_ordering_by_other_fields(self):
+        """
+        Test that ordering by a field outside the whitelist falls back to
+        the default (created, id) ordering.
+        """
+        self.assertEqual(self.titles('/api/v1/books?ordering=author__last_name'),
+                         ['Test Book', 'Alpha', 'Alphabet', 'Beta'])
+
+    def test_filters_authors_by_name(self):
+        """
+        Test that API returns the authors with the given name.
+        """
+        response = self.client.get('/api/v1/authors?last_name=Cook&first_name=Lisa')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([author['id'] for author in response.data['results']], [self.other_author.id])
+
+    def test_book_filters_use_indexes(self):
+        """
+        Test that each book filter is answered from an index.
+        """
+        urls = {
+            '/?author=1': 'author_id=?',
+            '/?isbn=1000000000003': 'isbn=?',
+            '/?title__startswith=Alph': 'title>? AND title<?',
+            '/?published__gte=2000-01-01&published__lte=2010-12-31': 'published>? AND published<?',
+            '/?updated__gt=2016-01-01T00:00:00': 'updated>?',
+        }
+        for url, expected in urls.items():
+            plan = query_plan(self.filtered(BookViewSet, url))
+            self.assertIn('USING INDEX', plan, url)
+            self.assertIn(expected, plan, url)
+
+    def test_author_filters_use_indexes(self):
+        """
+        Test that author name and sync filters are answered from an index.
+        """
+        plan = query_plan(self.filtered(AuthorViewSet, '/?last_name=Cook&first_name=Lisa'))
+        self.assertIn('last_name=? AND first_name=?', plan)
+
+        plan = query_plan(self.filtered(AuthorViewSet, '/?updated__gt=2016-01-01T00:00:00'))
+        self.assertIn('USING INDEX', plan)
@@ -0,0 +1,48 @@
+from __future__ import unicode_literals
+
+from django.test import SimpleTestCase
+
+from config.gunicorn_conf import read_rss_kb, server_profile
+
+
+MB = 1024 * 1024
+
+
+class ServerProfileTestCase(SimpleTestCase):
+
+    def test_sync_workers_when_memory_allows(self):
+        """
+        Test that there are two sync workers per CPU plus one when they fit
+        in memory.
+        """
+        self.assertEqual(server_profile(2, 4096 * MB, 128 * MB, {}), (5, 'sync', 1))
+
+    def test_threaded_workers_when_memory_is_short(self):
+        """
+        Test that fewer threaded workers make up the concurrency when the
+        processes do not fit in memory.
+        """
+        self.assertEqual(server_profile(8, 512 * MB, 128 * MB, {}), (3, 'gthread', 6))
+
+    def test_unknown_memory(self):
+        """
+        Test that the workers only depend on the CPUs when the memory is
+        unknown.
+        """
+        self.assertEqual(server_profile(1, None, 128 * MB, {}), (3, 'sync', 1))
+
+    def test_environment_overrides(self):
+        """
+        Test that the workers, threads and worker class can be set.
+        """
+        self.assertEqual(server_profile(8, 512 * MB, 128 * MB, {'WEB_CONCURRENCY': '2'}), (2, 'gthread', 8))
+        self.assertEqual(server_profile(8, 512 * MB, 128 * MB, {'DB_POOL_MAX_SIZE': '4'}), (3, 'gthread', 4))
+        self.assertEqual(server_profile(2, 4096 * MB, 128 * MB, {
+            'WEB_CONCURRENCY': '2', 'GUNICORN_THREADS': '1', 'GUNICORN_WORKER_CLASS': 'gevent',
+        }), (2, 'gevent', 1))
+
+    def test_read_rss_kb(self):
+        """
+        Test that the memory of the process is read.
+        """
+        self.assertGreater(read_rss_kb(), 0)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import six
+from django.utils.six import StringIO
+
+from api_books.models import Author, Book
+
+
+class ImportCatalogTestCase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.author = Author.objects.create(first_name='James', last_name='Cook')
+        Book.objects.create(title='Test Book', author=self.author, isbn='1234567890123', published='2016-11-13')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with io.open(path, 'w', encoding='utf-8') as f:
+            # json.dumps() returns bytes on Python 2.
+            f.write(six.text_type(content))
+        return path
+
+    def records(self, count, first=0):
+        return [
+            {
+                'title': 'Libro %d' % number,
+                'isbn': '%013d' % number,
+                'published': '2010-01-01',
+                'author': {'first_name': 'Ana' if number % 2 else 'James', 'last_name': 'Núñez' if number % 2 else 'Cook'},
+            }
+            for number in range(first, first + count)
+        ]
+
+    def import_catalog(self, path, **options):
+        out, err = StringIO(), StringIO()
+        call_command('import_catalog', path, stdout=out, stderr=err, **options)
+        return out.getvalue(), err.getvalue()
+
+    def test_imports_csv(self):
+        """
+        Test that a CSV in the export format is imported and its authors are
+        matched by name.
+        """
+        path = self.write('catalog.csv', '\n'.join([
+            'id,title,isbn,published,created,updated,author_id,author_first_name,author_last_name',
+            '7,Libro 1,0000000000001,2010-01-01,,,9,Ana,Núñez',
+            '8,Libro 2,0000000000002,2011-02-03,,,3,James,Cook',
+        ]) + '\n')
+
+        out, err = self.import_catalog(path)
+
+        self.assertIn('Imported 2 books', out)
+        self.assertEqual(Author.objects.count(), 2)
+        self.assertEqual(Book.objects.get(isbn='0000000000002').author, self.author)
+        self.assertEqual(Book.objects.get(isbn='0000000000001').author.last_name, 'Núñez')
+
+    def test_imports_json(self):
+        """
+        Test that JSON arrays and files with a document per line are
+        imported in batches.
+        """
+        records = self.records(10)
+        self.import_catalog(self.write('catalog.json', json.dumps(records[:5], indent=2)), batch_size=2)
+        self.import_catalog(self.write('catalog.ndjson', '\n'.join(json.dumps(record) for record in records[5:])),
+                            batch_size=2)
+
+        self.assertEqual(Book.objects.count(), 11)
+        self.assertEqual(Author.objects.count(), 2)
+
+    def test_skips_invalid_records(self):
+        """
+        Test that invalid records and taken or repeated ISBNs are skipped and
+        reported with their numbers.
+        """
+        records = self.records(3)
+        records[0]['isbn'] = '1234567890123'
+        records[1]['published'] = 'yesterday'
+        records.append(dict(records[2], title='Repeated'))
+        records.append({'title': 'No author', 'isbn': '9'})
+
+        out, err = self.import_catalog(self.write('catalog.ndjson', '\n'.join(json.dumps(r) for r in records)))
+
+        self.assertEqual(err.splitlines(), [
+            'Record 1: isbn 1234567890123 already exists',
+            'Record 2: published is not a YYYY-MM-DD date',
+            'Record 4: isbn 0000000000002 is repeated',
+            'Record 5: first_name is required',
+        ])
+        self.assertEqual(Book.objects.count(), 2)
+
+        with self.assertRaises(CommandError):
+            self.import_catalog(self.write('more.ndjson', '\n'.join(json.dumps(r) for r in records)),
+                                max_errors=2)
+
+    def test_resumes(self):
+        """
+        Test that --resume skips the records an earlier run imported.
+        """
+        path = self.write('catalog.ndjson', '\n'.join(json.dumps(record) for record in self.records(6)))
+        self.write('catalog.ndjson.import', json.dumps({'size': os.path.getsize(path), 'records': 4, 'books': 4,
+                                                        'authors': 1, 'skipped': 0}))
+
+        out, err = self.import_catalog(path, resume=True)
+
+        self.assertIn('Resuming after 4 records.', out)
+        self.assertEqual(sorted(Book.objects.values_list('title', flat=True)), ['Libro 4', 'Libro 5', 'Test Book'])
+        with io.open(path + '.import', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['records'], 6)
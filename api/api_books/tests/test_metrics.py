@@ -0,0 +1,215 @@
+from __future__ import unicode_literals
+
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from api_books.cache import get_cache
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+from config.metrics.queries import QueryStats, normalize
+from config.metrics.store import MetricsStore
+from config.metrics.timing import RequestTiming
+
+
+SERVER_TIMING_RE = re.compile(
+    r'^db;desc="(\d+) quer(?:y|ies)";dur=([\d.]+), serialize;dur=([\d.]+), '
+    r'render;dur=([\d.]+), total;dur=([\d.]+)$'
+)
+
+
+class MetricsTestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(MetricsTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def test_server_timing_header(self):
+        """
+        Test that responses tell the queries and the time of each phase.
+        """
+        response = self.client.get('/api/v1/books/%d' % self.book.id, HTTP_ACCEPT='application/json')
+
+        match = SERVER_TIMING_RE.match(response['Server-Timing'])
+        self.assertIsNotNone(match)
+        queries, db, serialize, render, total = match.groups()
+        self.assertGreater(int(queries), 0)
+        self.assertLessEqual(float(db) + float(serialize) + float(render), float(total))
+
+        with override_settings(SERVER_TIMING=False):
+            response = self.client.get('/api/v1/books/%d' % self.book.id, HTTP_ACCEPT='application/json')
+        self.assertNotIn('Server-Timing', response)
+
+    def test_metrics_count_requests_by_route(self):
+        """
+        Test that /metrics serves the histograms of each route to the bearer
+        of the token.
+        """
+        with override_settings(METRICS_DIR=self.directory, METRICS_TOKEN='secret'):
+            self.client.get('/api/v1/books', HTTP_ACCEPT='application/json')
+            self.client.get('/api/v1/books', HTTP_ACCEPT='application/json')
+            forbidden = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer guess')
+            response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+
+        self.assertEqual(forbidden.status_code, 403)
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode('utf-8')
+        labels = 'route="book-list",method="GET",status="200"'
+        self.assertIn('http_request_duration_seconds_count{%s} 2\n' % labels, content)
+        self.assertIn('http_request_duration_seconds_bucket{%s,le="+Inf"} 2\n' % labels, content)
+        self.assertIn('http_request_db_queries_total{%s}' % labels, content)
+        self.assertIn('http_request_duration_seconds_count{route="metrics",method="GET",status="403"} 1\n',
+                      content)
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        super(ListHandler, self).__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class QueryCaptureTestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(QueryCaptureTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.handler = ListHandler()
+        logger = logging.getLogger('config.metrics')
+        self.addCleanup(setattr, logger, 'handlers', logger.handlers)
+        logger.handlers = [self.handler]
+
+    def test_requests_over_the_thresholds_are_logged(self):
+        """
+        Test that requests running more queries than allowed are logged with
+        their statements, and others are not.
+        """
+        with override_settings(QUERY_CAPTURE_MAX_QUERIES=1, QUERY_CAPTURE_SAMPLE_RATE=1.0):
+            self.client.get('/api/v1/authors/%d' % self.author.id, HTTP_ACCEPT='application/json')
+            self.client.get('/api/v1/authors/%d' % self.author.id, HTTP_ACCEPT='application/json')
+
+        self.assertEqual(len(self.handler.messages), 1)
+        self.assertIn('GET /api/v1/authors/%d (author-detail) ran 2 queries' % self.author.id,
+                      self.handler.messages[0])
+        self.assertIn('; most run: 1x', self.handler.messages[0])
+
+    def test_slow_queries_are_ranked_for_staff(self):
+        """
+        Test that the statements of sampled requests are ranked by
+        fingerprint at /admin/slow-queries/, for staff users only.
+        """
+        with override_settings(METRICS_DIR=self.directory, QUERY_CAPTURE_SAMPLE_RATE=1.0):
+            for _ in range(2):
+                get_cache().clear()
+                self.client.get('/api/v1/books/%d' % self.book.id, HTTP_ACCEPT='application/json')
+            anonymous = self.client.get('/admin/slow-queries/')
+            User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+            self.client.login(username='admin', password='secret')
+            response = self.client.get('/admin/slow-queries/?order=calls&n=1')
+
+        self.assertEqual(anonymous.status_code, 302)
+        statements = json.loads(response.content.decode('utf-8'))['statements']
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(statements[0]['calls'], 2)
+        self.assertEqual(statements[0]['max_per_request'], 1)
+        self.assertEqual(statements[0]['routes'], ['book-detail'])
+        self.assertIn('"api_books_book"."id" = ?', statements[0]['sql'])
+        self.assertEqual(self.client.get('/admin/slow-queries/?order=slowest').status_code, 400)
+
+
+class QueryStatsTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def test_normalize(self):
+        """
+        Test that literals and lists of parameters are replaced.
+        """
+        self.assertEqual(
+            normalize("SELECT  \"id\" FROM t1 WHERE name = 'O''Brien' AND id IN (%s, %s, %s) LIMIT 21"),
+            "SELECT \"id\" FROM t1 WHERE name = ? AND id IN (...) LIMIT ?"
+        )
+        self.assertEqual(
+            normalize('INSERT INTO "t" ("a", "b") VALUES (%s, %s), (%s, %s), (%s, %s)'),
+            'INSERT INTO "t" ("a", "b") VALUES (...)'
+        )
+
+    def test_processes_and_windows(self):
+        """
+        Test that the statements of every process are added up, and that
+        they leave the ranking after two windows.
+        """
+        other = QueryStats(self.directory, pid=os.getpid() + 1, window=60)
+        other.add([('SELECT 1', 0.25), ('SELECT 2', 0.5)], 'book-list')
+        other.flush()
+        stats = QueryStats(self.directory, window=60)
+        stats.add([('SELECT 3', 0.125), ('SELECT * FROM t', 1.0)], 'book-detail')
+
+        top = stats.top(10, 'per_request')
+        self.assertEqual([(statement['sql'], statement['calls'], statement['max_ms'],
+                           statement['max_per_request'], statement['routes']) for statement in top],
+                         [('SELECT ?', 3, 500.0, 2, ['book-detail', 'book-list']),
+                          ('SELECT * FROM t', 1, 1000.0, 1, ['book-detail'])])
+        self.assertEqual(stats.top(1)[0]['sql'], 'SELECT * FROM t')
+
+        # A window later, the file of the other process only has the
+        # previous one; two windows later, nothing.
+        other.rotated_at -= 90
+        other.dirty = True
+        other.flush()
+        self.assertEqual(stats.top(1, 'calls')[0]['calls'], 3)
+        stats.rotated_at -= 150
+        other.rotated_at -= 60
+        other.dirty = True
+        other.flush()
+        self.assertEqual(stats.top(10), [])
+
+
+class MetricsStoreTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def observe(self, store, seconds):
+        timing = RequestTiming()
+        timing.total = seconds
+        store.observe(('book-list', 'GET', '200'), timing)
+
+    def test_processes_are_added_up(self):
+        """
+        Test that the samples of every process are collected, and that those
+        of the processes which exited are kept.
+        """
+        process = subprocess.Popen([sys.executable, '-c', ''])
+        process.wait()
+        worker = MetricsStore(self.directory, pid=process.pid)
+        self.observe(worker, 0.001)
+        self.observe(worker, 0.2)
+        worker.flush()
+        store = MetricsStore(self.directory)
+        self.observe(store, 20)
+
+        for _ in range(2):
+            samples = store.collect()
+            count, seconds = samples[('book-list', 'GET', '200')][:2]
+            buckets = samples[('book-list', 'GET', '200')][6:]
+            self.assertEqual(count, 3)
+            self.assertAlmostEqual(seconds, 20.201)
+            self.assertEqual(buckets, [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1])
+        self.assertNotIn('%d.json' % process.pid, os.listdir(self.directory))
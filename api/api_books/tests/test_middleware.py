@@ -0,0 +1,47 @@
+from __future__ import unicode_literals
+
+from django.contrib.auth.models import User
+
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class MiddlewareProfilesTestCase(LibraryAPIBaseTestCase):
+
+    def test_json_requests_get_the_api_profile(self):
+        """
+        Test that JSON requests to the API skip the browser middleware but
+        still get CORS headers.
+        """
+        response = self.client.get('/api/v1/books', HTTP_ACCEPT='application/json',
+                                   HTTP_ORIGIN='http://localhost:8000')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.middleware_profile, 'api')
+        self.assertFalse(hasattr(response.wsgi_request, 'session'))
+        self.assertNotIn('X-Frame-Options', response)
+        self.assertIn('Access-Control-Allow-Origin', response)
+
+    def test_html_requests_get_the_default_profile(self):
+        """
+        Test that the browsable API, the docs and the admin get the whole
+        middleware stack.
+        """
+        for path, accept in (('/api/v1/books', 'text/html'), ('/api/v1/books?format=api', '*/*'),
+                             ('/api/v1/docs/', '*/*'), ('/admin/', '*/*')):
+            response = self.client.get(path, HTTP_ACCEPT=accept)
+
+            self.assertEqual(response.wsgi_request.middleware_profile, 'default')
+            self.assertEqual(response['X-Frame-Options'], 'SAMEORIGIN')
+
+    def test_sessions_are_not_loaded_for_json_requests(self):
+        """
+        Test that JSON requests from browsers with a session do not load it.
+        """
+        User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.login(username='admin', password='secret')
+        self.client.get('/api/v1/authors/%d' % self.author.id, HTTP_ACCEPT='application/json')
+
+        # Cached, so only the session and its user would be queried.
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/authors/%d' % self.author.id, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 200)
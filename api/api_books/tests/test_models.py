@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+from django.db import IntegrityError
 from django.test import TestCase
 from api_books.models import Book, Author
 
@@ -55,3 +56,15 @@ class BookAPIModelTestCase(LibraryAPIModelBaseTestCase):
         Test string function of book.
         """
         self.assertEqual(str(self.book), 'Test Book')
+
+    def test_isbn_is_unique(self):
+        """
+        Test that two books can't share an ISBN.
+        """
+        with self.assertRaises(IntegrityError):
+            Book.objects.create(
+                title='Another Book',
+                author=self.author,
+                isbn='1234567890123',
+                published='2016-11-13'
+            )
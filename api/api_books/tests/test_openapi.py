@@ -0,0 +1,148 @@
+from __future__ import unicode_literals
+
+import gzip
+import io
+import json
+import re
+from collections import OrderedDict
+
+from django.core.urlresolvers import resolve
+
+from rest_framework import status
+
+from api_books.prerender import brotli
+from api_books.serializers import BookSerializer
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class OpenAPITestCase(LibraryAPIBaseTestCase):
+
+    def get_spec(self):
+        response = self.client.get('/api/v1/docs/swagger.json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content.decode('utf-8'), object_pairs_hook=OrderedDict)
+
+    def test_documents_every_route(self):
+        """
+        Test that the spec documents the routes and methods of the API and
+        that every documented path resolves to a view handling its methods.
+        """
+        spec = self.get_spec()
+
+        self.assertEqual(spec['basePath'], '/api/v1')
+        self.assertEqual(sorted(spec['paths']), [
+            '/authors', '/authors/bulk', '/authors/{author_id}/books', '/authors/{id}',
+            '/books', '/books/bulk', '/books/createBookAndAuthor', '/books/export', '/books/{id}',
+            '/jobs/{id}', '/search',
+        ])
+        self.assertEqual(sorted(spec['paths']['/books/{id}']), ['delete', 'get', 'patch', 'put'])
+        self.assertEqual(sorted(spec['paths']['/books/bulk']), ['delete', 'patch', 'post'])
+
+        for path, operations in spec['paths'].items():
+            view = resolve(spec['basePath'] + re.sub(r'\{\w+\}', '1', path)).func
+            for method in operations:
+                if hasattr(view, 'actions'):
+                    self.assertIn(method, view.actions, path)
+                else:
+                    self.assertIn(method, view.cls.http_method_names, path)
+
+    def test_documents_parameters(self):
+        """
+        Test that filters, sparse fieldsets and conditional headers are
+        documented from the viewsets.
+        """
+        spec = self.get_spec()
+        parameters = {parameter['name']: parameter
+                      for parameter in spec['paths']['/books']['get']['parameters']}
+
+        self.assertEqual(parameters['published__gte']['format'], 'date')
+        self.assertEqual(parameters['author']['type'], 'integer')
+        self.assertEqual(parameters['fields']['items']['enum'], list(BookSerializer.Meta.fields))
+        self.assertEqual(parameters['If-None-Match']['in'], 'header')
+        self.assertIn('412', spec['paths']['/books/{id}']['put']['responses'])
+        self.assertIn('404', spec['paths']['/books']['post']['responses'])
+        self.assertEqual(spec['paths']['/search']['get']['parameters'][0]['name'], 'q')
+
+        nested = spec['paths']['/authors/{author_id}/books']['get']
+        self.assertEqual(nested['operationId'], 'listBooksOfAuthor')
+        self.assertEqual(nested['parameters'][0]['name'], 'author_id')
+        self.assertEqual(nested['parameters'][0]['in'], 'path')
+        self.assertIn('404', nested['responses'])
+
+    def test_definitions_follow_serializers(self):
+        """
+        Test that models are defined from their serializers as they are read
+        and written.
+        """
+        definitions = self.get_spec()['definitions']
+
+        self.assertEqual(sorted(definitions['Book']['properties']), sorted(BookSerializer.Meta.fields))
+        self.assertEqual(definitions['Book']['properties']['author'], {'$ref': '#/definitions/Author'})
+        self.assertTrue(definitions['Book']['properties']['updated']['readOnly'])
+        self.assertEqual(definitions['NewBook']['properties']['author']['type'], 'integer')
+        self.assertNotIn('created', definitions['NewBook']['properties'])
+        self.assertEqual(definitions['NewAuthor']['required'], ['first_name', 'last_name'])
+        self.assertEqual(definitions['NewBookAndAuthor']['properties']['author'],
+                         {'$ref': '#/definitions/NewAuthor'})
+
+    def test_serves_compressed_spec_with_etag(self):
+        """
+        Test that the spec is served gzipped to clients accepting it, with an
+        ETag of its own that gets a 304 response, and without querying the
+        database.
+        """
+        plain = self.client.get('/api/v1/docs/swagger.json')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/docs/swagger.json', HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], plain['ETag'][:-1] + '-gz"')
+        with gzip.GzipFile(fileobj=io.BytesIO(response.content)) as gzip_file:
+            self.assertEqual(gzip_file.read(), plain.content)
+        self.assertLess(len(response.content), len(plain.content))
+
+        response = self.client.get('/api/v1/docs/swagger.json', HTTP_ACCEPT_ENCODING='gzip',
+                                   HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+        # The plain ETag does not validate the gzipped representation.
+        response = self.client.get('/api/v1/docs/swagger.json', HTTP_ACCEPT_ENCODING='gzip',
+                                   HTTP_IF_NONE_MATCH=plain['ETag'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_encoding_follows_quality_values(self):
+        """
+        Test that codings the client refuses with q=0 are not served, and
+        that the one with the highest quality is.
+        """
+        # Without the brotli package, gzip is the best coding there is.
+        br = 'br' if brotli else 'gzip'
+        for accept_encoding, encoding in (
+            ('br;q=0, gzip', 'gzip'),
+            ('gzip;q=0.5, br;q=0.8', br),
+            ('br;q=0.2, gzip;q=0.9', 'gzip'),
+            ('gzip;q=0, br;q=0', None),
+            ('*', br),
+            ('*;q=0, identity', None),
+        ):
+            response = self.client.get('/api/v1/docs/swagger.json', HTTP_ACCEPT_ENCODING=accept_encoding)
+
+            self.assertEqual(response.get('Content-Encoding'), encoding, accept_encoding)
+
+    def test_index_is_rendered_once(self):
+        """
+        Test that the docs page is rendered once and then served as is.
+        """
+        with self.assertTemplateUsed('api_books/index.html'):
+            first = self.client.get('/api/v1/docs/')
+        with self.assertTemplateNotUsed('api_books/index.html'):
+            second = self.client.get('/api/v1/docs/')
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.content, first.content)
+        self.assertContains(second, '/api/v1/docs/swagger.json')
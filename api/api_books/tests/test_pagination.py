@@ -0,0 +1,144 @@
+from __future__ import unicode_literals
+
+from base64 import b64encode
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import six, timezone
+
+from rest_framework import status
+
+from api_books.models import Author, Book
+from api_books.pagination import KeysetCursorPagination
+from api_books.tests.test_filters import query_plan
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class KeysetPaginationAPITestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(KeysetPaginationAPITestCase, self).setUp()
+
+        for number in range(4):
+            Book.objects.create(
+                title='Book %d' % number,
+                author=self.author,
+                isbn='000000000000%d' % number,
+                published='2016-11-13'
+            )
+
+    def collect(self, url):
+        """
+        Follow the next links from url and return the ids of every page.
+        """
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([book['id'] for book in response.data['results']])
+            url = response.data['next']
+        return pages
+
+    def test_list_is_wrapped_in_cursor_envelope(self):
+        """
+        Test that the list response has next, previous and results keys.
+        """
+        response = self.client.get('/api/v1/books?page_size=2')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {'next', 'previous', 'results'})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNone(response.data['previous'])
+        self.assertIsNotNone(response.data['next'])
+
+    def test_pages_cover_every_book_once(self):
+        """
+        Test that following next links returns every book in (created, id) order.
+        """
+        pages = self.collect('/api/v1/books?page_size=2')
+
+        expected = list(Book.objects.order_by('created', 'id').values_list('id', flat=True))
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_pages_are_stable_when_created_ties(self):
+        """
+        Test that books sharing the same created timestamp are neither
+        skipped nor repeated.
+        """
+        Book.objects.update(created=timezone.now())
+
+        pages = self.collect('/api/v1/books?page_size=2')
+
+        expected = list(Book.objects.order_by('id').values_list('id', flat=True))
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_previous_link_returns_previous_page(self):
+        """
+        Test that the previous cursor returns the page before the current one.
+        """
+        first = self.client.get('/api/v1/books?page_size=2')
+        second = self.client.get(first.data['next'])
+        previous = self.client.get(second.data['previous'])
+
+        self.assertEqual(
+            [book['id'] for book in previous.data['results']],
+            [book['id'] for book in first.data['results']]
+        )
+
+    def test_list_does_not_count_rows(self):
+        """
+        Test that paging never issues a COUNT(*) query: a page and its
+        validators take one range scan each.
+        """
+        Author.objects.create(first_name='Lisa', last_name='Cook')
+        books = self.client.get('/api/v1/books?page_size=2')
+        authors = self.client.get('/api/v1/authors?page_size=1')
+
+        with CaptureQueriesContext(connection) as queries:
+            books = self.client.get(books.data['next'])
+            authors = self.client.get(authors.data['next'])
+
+        self.assertEqual(books.status_code, status.HTTP_200_OK)
+        self.assertEqual(authors.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries.captured_queries), 4)
+        for query in queries.captured_queries:
+            self.assertNotIn('COUNT(', query['sql'].upper())
+
+    def test_pages_seek_on_created_id_index(self):
+        """
+        Test that the page after a cursor is read from the (created, id)
+        index, in order, rather than sorted.
+        """
+        pagination = KeysetCursorPagination()
+        for model in (Author, Book):
+            boundary = model.objects.order_by('created', 'id').first()
+            queryset = pagination.filter_keyset(
+                model.objects.order_by('created', 'id'), [six.text_type(boundary.created), boundary.id], False
+            )[:3]
+
+            plan = query_plan(queryset)
+            self.assertIn('USING INDEX %s_created_' % model._meta.db_table, plan)
+            self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_pages_of_mixed_directions_cover_every_author_once(self):
+        """
+        Test that orderings mixing ascending and descending fields, which no
+        single row-value comparison covers, still page through every row.
+        """
+        for number in range(4):
+            Author.objects.create(first_name='Lisa', last_name='Cook %d' % (number % 2))
+
+        pages = self.collect('/api/v1/authors?page_size=2&ordering=last_name,-created')
+
+        expected = list(Author.objects.order_by('last_name', '-created', '-id').values_list('id', flat=True))
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_invalid_cursor_returns_not_found(self):
+        """
+        Test that a tampered cursor returns a 404 response.
+        """
+        cursor = b64encode(b'p=%5B%22yesterday%22%2C+1%5D').decode('ascii')
+        response = self.client.get('/api/v1/books?cursor=' + cursor)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
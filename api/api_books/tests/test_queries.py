@@ -0,0 +1,202 @@
+from __future__ import unicode_literals
+
+from rest_framework import status
+
+from api_books.models import Author, Book
+from api_books.views import AuthorViewSet
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class QueryCountAPITestCase(LibraryAPIBaseTestCase):
+    """
+    Guard the number of SQL queries per endpoint so N+1 lookups can't return.
+    """
+
+    def setUp(self):
+        super(QueryCountAPITestCase, self).setUp()
+
+        for number in range(10):
+            author = Author.objects.create(
+                first_name='Author',
+                last_name='%d' % number
+            )
+            Book.objects.create(
+                title='Book %d' % number,
+                author=author,
+                isbn='000000000000%d' % number,
+                published='2016-11-13'
+            )
+
+    def test_book_list_query_count(self):
+        """
+        Test that listing books joins authors instead of loading them per row.
+        The ETag is read from the keys and timestamps of the page's rows.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/v1/books')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 11)
+
+    def test_book_retrieve_query_count(self):
+        """
+        Test that retrieving a book loads its author in the same query, after
+        a single query for its ETag.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/v1/books/1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_book_create_query_count(self):
+        """
+        Test that creating a book looks up the author once, checks the ISBN
+        is unique, inserts once, indexes it for search once and adds it to
+        its author's count, in a savepoint.
+        """
+        data = {
+            'title': 'Book Test',
+            'author': 1,
+            'isbn': '9876543210321',
+            'published': '2016-11-21'
+        }
+        with self.assertNumQueries(7):
+            response = self.client.post('/api/v1/books', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_book_update_query_count(self):
+        """
+        Test that updating a book locks it to read its current author, writes
+        it with one conditional UPDATE, without looking up its new author or
+        its ISBN first, moves it between the authors' counts with another,
+        reindexes it for search, reads it back with its author and reads its
+        new ETag once. The savepoint and its release only run because tests
+        are wrapped in a transaction.
+        """
+        data = {
+            'title': 'First Book',
+            'author': 2,
+            'isbn': '5463210792463',
+            'published': '2000-11-24'
+        }
+        with self.assertNumQueries(8):
+            response = self.client.put('/api/v1/books/1', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['author']['id'], 2)
+
+    def test_book_partial_update_query_count(self):
+        """
+        Test that partially updating a book loads it with its author, writes
+        the changed columns in a savepoint, reindexes it and reads its new
+        ETag.
+        """
+        with self.assertNumQueries(6):
+            response = self.client.patch('/api/v1/books/1', {'title': 'First Book'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'First Book')
+
+    def test_book_partial_update_without_changes_query_count(self):
+        """
+        Test that a partial update changing nothing writes nothing.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.patch('/api/v1/books/1', {'title': 'Test Book'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_book_destroy_query_count(self):
+        """
+        Test that deleting a book only reads its author's id, runs one
+        DELETE, counts it off its author and removes it from the search
+        index, in a savepoint.
+        """
+        with self.assertNumQueries(6):
+            response = self.client.delete('/api/v1/books/1')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_create_book_and_author_query_count(self):
+        """
+        Test that createBookAndAuthor checks the ISBN is unique, then inserts
+        the author and the book and indexes the book in one savepoint.
+        """
+        data = {
+            'title': 'Book Test',
+            'author': {
+                'first_name': 'Lisa',
+                'last_name': 'Cook'
+            },
+            'isbn': '9876543210321',
+            'published': '2016-11-21'
+        }
+        with self.assertNumQueries(6):
+            response = self.client.post('/api/v1/books/createBookAndAuthor', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_author_list_query_count(self):
+        """
+        Test that listing authors runs a single query besides its ETag.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/v1/authors')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_author_retrieve_query_count(self):
+        """
+        Test that retrieving an author runs a single query besides its ETag.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/v1/authors/1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_author_update_query_count(self):
+        """
+        Test that updating an author writes it with one UPDATE, reindexes
+        and evicts their books, and reads it back and its new ETag once.
+        """
+        data = {
+            'first_name': 'Peter',
+            'last_name': 'Cameron'
+        }
+        with self.assertNumQueries(7):
+            response = self.client.put('/api/v1/authors/1', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_author_destroy_query_count(self):
+        """
+        Test that deleting an author reads the ids of their books, deletes
+        them with one DELETE, lowers the author's book count, removes the
+        books from the search index and deletes the author with one DELETE,
+        without a savepoint around them all.
+        """
+        with self.assertNumQueries(5):
+            response = self.client.delete('/api/v1/authors/1')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Book.objects.filter(author_id=1).exists())
+
+    def test_author_destroy_query_count_per_batch(self):
+        """
+        Test that every batch of an author's books takes the same four
+        queries, so deleting grows with the batches and not the books.
+        """
+        Book.objects.bulk_create([
+            Book(title='Batch %d' % number, author_id=1, isbn='100000000000%d' % number, published='2016-11-13')
+            for number in range(4)
+        ])
+        self.addCleanup(setattr, AuthorViewSet, 'delete_batch_size', AuthorViewSet.delete_batch_size)
+        AuthorViewSet.delete_batch_size = 2
+
+        # Five books make three batches.
+        with self.assertNumQueries(3 * 4 + 1):
+            response = self.client.delete('/api/v1/authors/1')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Book.objects.filter(author_id=1).exists())
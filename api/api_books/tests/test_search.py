@@ -0,0 +1,148 @@
+from __future__ import unicode_literals
+
+from django.core.management import call_command
+from django.db import connection
+from django.utils.six import StringIO
+
+from rest_framework import status
+
+from api_books.models import Author, Book
+from api_books.search import SQLiteSearchBackend, get_backend
+from api_books.tests.test_views import LibraryAPIBaseTestCase
+
+
+class SearchAPITestCase(LibraryAPIBaseTestCase):
+
+    def setUp(self):
+        super(SearchAPITestCase, self).setUp()
+
+        self.other_author = Author.objects.create(first_name='Ursula', last_name='Le Guin')
+        self.wizard = Book.objects.create(title='A Wizard of Earthsea', author=self.other_author,
+                                          isbn='1000000000001', published='1968-11-01')
+        self.tombs = Book.objects.create(title='The Tombs of Atuan', author=self.other_author,
+                                         isbn='1000000000002', published='1971-12-01')
+
+    def titles(self, query):
+        response = self.client.get('/api/v1/search', {'q': query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [book['title'] for book in response.data['results']]
+
+    def test_uses_full_text_index(self):
+        """
+        Test that the migration created the FTS5 search table.
+        """
+        self.assertIsInstance(get_backend(), SQLiteSearchBackend)
+
+    def test_searches_author_names(self):
+        """
+        Test that API returns the books of authors matching the query.
+        """
+        self.assertEqual(set(self.titles('ursula guin')), {'A Wizard of Earthsea', 'The Tombs of Atuan'})
+
+    def test_searches_title_prefixes(self):
+        """
+        Test that every word of the query is matched as a prefix.
+        """
+        self.assertEqual(self.titles('wiz earth'), ['A Wizard of Earthsea'])
+        self.assertEqual(self.titles('wizard cook'), [])
+
+    def test_ranks_title_matches_first(self):
+        """
+        Test that books matching in the title rank above books matching
+        only by author name.
+        """
+        Book.objects.create(title='Cook', author=self.other_author,
+                            isbn='1000000000003', published='1980-01-01')
+
+        self.assertEqual(self.titles('cook'), ['Cook', 'Test Book'])
+
+    def test_reindexes_updated_books(self):
+        """
+        Test that a renamed book is found by its new title only.
+        """
+        self.client.put('/api/v1/books/%d' % self.tombs.id, {
+            'title': 'The Farthest Shore',
+            'author': self.other_author.id,
+            'isbn': '1000000000002',
+            'published': '1972-09-01'
+        }, format='json')
+
+        self.assertEqual(self.titles('tombs'), [])
+        self.assertEqual(self.titles('farthest'), ['The Farthest Shore'])
+
+    def test_reindexes_books_of_renamed_authors(self):
+        """
+        Test that renaming an author reindexes all their books.
+        """
+        self.client.put('/api/v1/authors/%d' % self.other_author.id,
+                        {'first_name': 'Ursula K.', 'last_name': 'Leguin'}, format='json')
+
+        self.assertEqual(len(self.titles('leguin')), 2)
+        self.assertEqual(self.titles('le guin'), [])
+
+    def test_removes_deleted_books(self):
+        """
+        Test that deleted books are no longer found.
+        """
+        self.client.delete('/api/v1/books/%d' % self.wizard.id)
+
+        self.assertEqual(self.titles('wizard'), [])
+
+    def test_indexes_bulk_created_and_updated_books(self):
+        """
+        Test that books written through the bulk endpoint are indexed.
+        """
+        self.client.post('/api/v1/books/bulk', [{
+            'title': 'Tehanu',
+            'author': self.other_author.id,
+            'isbn': '1000000000004',
+            'published': '1990-02-01'
+        }], format='json')
+        self.assertEqual(self.titles('tehanu'), ['Tehanu'])
+
+        self.client.patch('/api/v1/books/bulk', [{'id': self.wizard.id, 'title': 'The Other Wind'}],
+                          format='json')
+        self.assertEqual(self.titles('other wind'), ['The Other Wind'])
+
+    def test_rebuild_search_index_command(self):
+        """
+        Test that the command reindexes rows written without the ORM.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE api_books_book SET title = %s WHERE id = %s', ['Tales', self.wizard.id])
+
+        out = StringIO()
+        call_command('rebuild_search_index', stdout=out)
+
+        self.assertEqual(self.titles('tales'), ['Tales'])
+        self.assertIn('Rebuilt the search index', out.getvalue())
+
+        out = StringIO()
+        call_command('rebuild_search_index', verbosity=0, stdout=out)
+        self.assertEqual(out.getvalue(), '')
+
+    def test_ignores_search_syntax(self):
+        """
+        Test that FTS5 operators in the query are treated as plain words.
+        """
+        self.assertEqual(self.titles('"wizard* (earth^-'), ['A Wizard of Earthsea'])
+
+    def test_search_without_query_returns_bad_request(self):
+        """
+        Test that API returns a 400 response when q is missing or blank.
+        """
+        for params in ({}, {'q': '  '}):
+            response = self.client.get('/api/v1/search', params)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data, {'q': 'Field required'})
+
+    def test_search_with_invalid_limit_returns_bad_request(self):
+        """
+        Test that API returns a 400 response for a limit outside 1 to 100.
+        """
+        for limit in ('hi', '0', '101'):
+            response = self.client.get('/api/v1/search', {'q': 'wizard', 'limit': limit})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('limit', response.data)
@@ -2,7 +2,9 @@ from rest_framework.test import APITestCase
 from rest_framework.test import APIRequestFactory
 from rest_framework import status
 
+from api_books.cache import get_cache
 from api_books.models import Author, Book
+from api_books.prerender import clear_prerendered
 from api_books.views import index
 
 import json
@@ -12,6 +14,10 @@ class LibraryAPIBaseTestCase(APITestCase):
 
     def setUp(self):
         self.factory = APIRequestFactory()
+        # Rolled back rows send no signals, so drop the responses cached
+        # by earlier tests.
+        get_cache().clear()
+        clear_prerendered()
 
         super(LibraryAPIBaseTestCase, self).setUp()
 
@@ -54,8 +60,8 @@ class AuthorsAPITestCase(LibraryAPIBaseTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertEqual(response.data[0]['first_name'], 'James')
-        self.assertEqual(response.data[0]['last_name'], 'Cook')
+        self.assertEqual(response.data['results'][0]['first_name'], 'James')
+        self.assertEqual(response.data['results'][0]['last_name'], 'Cook')
 
     def test_AuthorViewSet_creates_an_author(self):
         """
@@ -171,6 +177,15 @@ class AuthorsAPITestCase(LibraryAPIBaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data,{'author':'Not Found'})
 
+    def test_AuthorViewSet_partially_updates_an_author(self):
+        """
+        Test that API updates only the fields supplied of an author.
+        """
+        response = self.client.patch('/api/v1/authors/1', {'last_name': 'Cameron'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['first_name'], response.data['last_name']), ('James', 'Cameron'))
+
 
 class BooksAPITestCase(LibraryAPIBaseTestCase):
 
@@ -182,11 +197,11 @@ class BooksAPITestCase(LibraryAPIBaseTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertEqual(response.data[0]['title'], 'Test Book')
-        self.assertEqual(response.data[0]['author']['first_name'], 'James')
-        self.assertEqual(response.data[0]['author']['last_name'], 'Cook')
-        self.assertEqual(response.data[0]['isbn'], '1234567890123')
-        self.assertEqual(response.data[0]['published'], '2016-11-13')
+        self.assertEqual(response.data['results'][0]['title'], 'Test Book')
+        self.assertEqual(response.data['results'][0]['author']['first_name'], 'James')
+        self.assertEqual(response.data['results'][0]['author']['last_name'], 'Cook')
+        self.assertEqual(response.data['results'][0]['isbn'], '1234567890123')
+        self.assertEqual(response.data['results'][0]['published'], '2016-11-13')
 
     def test_BookViewSet_creates_a_book_with_existing_author(self):
         """
@@ -250,6 +265,21 @@ class BooksAPITestCase(LibraryAPIBaseTestCase):
             ]
         })
 
+    def test_BookViewSet_does_not_create_a_book_with_duplicate_isbn(self):
+        """
+        Test that API returns 400 response when the ISBN is already taken.
+        """
+        data = {
+            'title': 'Book Test',
+            'author': 1,
+            'isbn': '1234567890123',
+            'published': '2016-11-21'
+        }
+        response = self.client.post('/api/v1/books', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'isbn': ['book with this isbn already exists.']})
+
     def test_BookViewSet_does_not_create_a_book_without_existing_author(self):
         """
         Test that API returns 404 response.
@@ -370,6 +400,20 @@ class BooksAPITestCase(LibraryAPIBaseTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_BookViewSet_updates_a_book_keeping_its_isbn(self):
+        """
+        Test that API can update a book without changing its ISBN.
+        """
+        data = {
+            'title': 'First Book',
+            'author': 1,
+            'isbn': '1234567890123',
+            'published': '2000-11-24'
+        }
+        response = self.client.put('/api/v1/books/1', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_BookViewSet_does_not_update_a_book_without_author_field(self):
             """
             Test that API returns 400 response and required field.
@@ -464,3 +508,110 @@ class BooksAPITestCase(LibraryAPIBaseTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data, {'book': 'Not Found'})
+
+    def test_BookViewSet_does_not_update_a_book_with_duplicate_isbn(self):
+        """
+        Test that API returns a 400 response when the ISBN belongs to another
+        book.
+        """
+        Book.objects.create(title='Other Book', author=self.author, isbn='5463210792463', published='2000-01-01')
+        data = {
+            'title': 'First Book',
+            'author': 1,
+            'isbn': '5463210792463',
+            'published': '2000-11-24'
+        }
+        response = self.client.put('/api/v1/books/1', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'isbn': ['book with this isbn already exists.']})
+        self.assertEqual(Book.objects.get(id=1).title, 'Test Book')
+
+    def test_BookViewSet_partially_updates_a_book(self):
+        """
+        Test that API updates only the fields supplied and returns a 200
+        response.
+        """
+        author = Author.objects.create(first_name='Lisa', last_name='Cook')
+        response = self.client.patch('/api/v1/books/1', {'author': author.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['author']['first_name'], 'Lisa')
+        self.assertEqual(response.data['title'], 'Test Book')
+        book = Book.objects.get(id=1)
+        self.assertEqual((book.author_id, book.isbn), (author.id, '1234567890123'))
+
+    def test_BookViewSet_does_not_partially_update_a_book_with_incorrect_data(self):
+        """
+        Test that API returns 400 and 404 responses for invalid fields and
+        missing books or authors.
+        """
+        response = self.client.patch('/api/v1/books/1', {'published': '2013/04/16'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.patch('/api/v1/books/1', {'author': 4}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {'author': 'Not Found'})
+
+        response = self.client.patch('/api/v1/books/20', {'title': 'First Book'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {'book': 'Not Found'})
+
+    def test_BookViewSet_does_not_leave_an_author_if_book_data_is_not_correct(self):
+        """
+        Test that createBookAndAuthor creates no author when the book is
+        invalid.
+        """
+        data = {
+            'title': 'Book Test',
+            'author': {
+                'first_name': 'John',
+                'last_name': 'Murray'
+            },
+            'isbn': '1234567890123',
+            'published': '2016-11-21'
+        }
+        response = self.client.post('/api/v1/books/createBookAndAuthor', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Author.objects.filter(last_name='Murray').exists())
+
+
+class AuthorBooksAPITestCase(LibraryAPIBaseTestCase):
+
+    def test_lists_the_books_of_an_author(self):
+        """
+        Test that an author's books are listed in pages, with the fields and
+        filters of the books list, and no other author's books.
+        """
+        other = Author.objects.create(first_name='Lisa', last_name='Cook')
+        for number in range(3):
+            Book.objects.create(title='Book %d' % number, author=other, isbn='%013d' % number,
+                                published='2016-11-2%d' % number)
+
+        response = self.client.get('/api/v1/authors/%d/books?page_size=2' % other.id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([book['title'] for book in response.data['results']], ['Book 0', 'Book 1'])
+        self.assertEqual(response.data['results'][0]['author']['first_name'], 'Lisa')
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([book['title'] for book in response.data['results']], ['Book 2'])
+
+        response = self.client.get('/api/v1/authors/%d/books?fields=title&published__gte=2016-11-21' % other.id)
+        self.assertEqual(response.data['results'], [{'title': 'Book 1'}, {'title': 'Book 2'}])
+
+    def test_lists_no_books_of_a_missing_author(self):
+        """
+        Test that an author without books has an empty list, and one that
+        does not exist a 404 response.
+        """
+        author = Author.objects.create(first_name='Lisa', last_name='Cook')
+
+        response = self.client.get('/api/v1/authors/%d/books' % author.id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+        response = self.client.get('/api/v1/authors/99/books')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {'author': 'Not Found'})
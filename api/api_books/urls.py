@@ -12,6 +12,10 @@ router.register(r'books', views.BookViewSet)
 
 urlpatterns = [
     url(r'^', include(router.urls)),
+    url(r'^authors/(?P<author_id>[0-9]+)/books$', views.BookViewSet.as_view({'get': 'list'}), name='author-books'),
+    url(r'^search$', views.search, name='search'),
+    url(r'^jobs/(?P<pk>[0-9]+)$', views.deletion_job, name='deletion-job'),
+    url(r'^docs/swagger.json$', views.openapi_spec, name='openapi'),
     url(r'^docs/', views.index, name='index'),
     url(r'^api-auth/', include('rest_framework.urls', namespace='rest_framework'))
 ]
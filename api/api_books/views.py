@@ -1,22 +1,84 @@
 from __future__ import unicode_literals
 
-from django.shortcuts import render
+import json
+from collections import Counter, OrderedDict
 
-from rest_framework import viewsets
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.core.urlresolvers import reverse
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.http import require_safe
+
+from rest_framework import serializers, viewsets
+from rest_framework.filters import OrderingFilter
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.decorators import list_route
+from rest_framework.decorators import api_view, list_route
+from rest_framework.exceptions import ValidationError
+
+from api_books.bulk import BulkModelMixin, in_bulk, raw_delete, unique_error
+from api_books.cache import cached_response
+from api_books.conditional import ConditionalMixin, conditional, precondition_failed
+from api_books.converters import ValuesListMixin
+from api_books.counts import add_book_counts
+from api_books.deletion import delete_author, start_deletion
+from api_books.export import csv_rows, iterate_in_chunks, ndjson_rows
+from api_books.filters import IndexedFieldsFilterBackend
+from api_books.models import Author, Book, DeletionJob
+from api_books.openapi import get_spec, openapi, query_parameter, ref
+from api_books.prerender import prerendered
+from api_books.search import search_books
+from api_books.serializers import AuthorSerializer, BookSerializer, DeletionJobSerializer
+from api_books.signals import rows_deleted, rows_saved
+
+
+def save_changes(obj, values, queryset=None):
+    """
+    Sets values on obj and saves the fields that changed, with its auto_now
+    fields, in one UPDATE. Nothing is written when nothing changed.
 
-from api_books.models import Author, Book
-from api_books.serializers import AuthorSerializer, BookSerializer
+    The UPDATE goes through queryset, the model's rows by default, and
+    returns False when it matches no row, e.g. one a precondition excludes.
+    """
+    changed = [name for name, value in values.items() if getattr(obj, name) != value]
+    if not changed:
+        return True
+    for name in changed:
+        setattr(obj, name, values[name])
+    now = timezone.now()
+    for field in obj._meta.concrete_fields:
+        if getattr(field, 'auto_now', False):
+            setattr(obj, field.attname, now)
+            changed.append(field.name)
+
+    model = type(obj)
+    queryset = model.objects.all() if queryset is None else queryset
+    with transaction.atomic():
+        if not queryset.filter(pk=obj.pk).update(**dict((name, getattr(obj, name)) for name in changed)):
+            return False
+        rows_saved.send(sender=model, ids=[obj.pk], created=False)
+    return True
 
 
-class AuthorViewSet(viewsets.ModelViewSet):
+class AuthorViewSet(ConditionalMixin, BulkModelMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     A viewset for viewing, creating, editing, retrieving and deleting authors.
     """
     queryset = Author.objects.all()
     serializer_class = AuthorSerializer
+    filter_backends = (IndexedFieldsFilterBackend, OrderingFilter)
+    filter_params = {
+        'last_name': ('last_name', serializers.CharField()),
+        'first_name': ('first_name', serializers.CharField()),
+        'updated__gt': ('updated__gt', serializers.DateTimeField()),
+    }
+    ordering_fields = ('last_name', 'first_name', 'created', 'updated')
+    ordering = ('created', 'id')
+    validator_counts = ('book_count',)
+    delete_batch_size = 500
 
     def get_object(self, pk):
         """
@@ -28,6 +90,13 @@ class AuthorViewSet(viewsets.ModelViewSet):
         except Author.DoesNotExist:
             return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
 
+    @conditional
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        return super(AuthorViewSet, self).list(request, *args, **kwargs)
+
+    @conditional
+    @cached_response
     def retrieve(self, request, pk=None):
         """
         This method retrieves an author.
@@ -42,65 +111,244 @@ class AuthorViewSet(viewsets.ModelViewSet):
             # Return the error message
             return author
 
+    @conditional
     def update(self, request, pk=None):
         """
         This method updates an author.
+
+        The row is written with a single UPDATE, and only read back to
+        return it.
         """
         try:
-            author = self.get_object(pk)
-
-            # We check if author is an author object or a message error
-            if isinstance(author, Author):
-                author_serializer = AuthorSerializer(data=request.data)
-                # Checks if author request data is valid
-                if author_serializer.is_valid():
-                    # We can update the author
-                    author.first_name = request.data['first_name']
-                    author.last_name = request.data['last_name']
-                    author.save()
-
-                    author_serializer = AuthorSerializer(author)
-                    return Response(author_serializer.data, status=status.HTTP_200_OK)
-                else:
-                    return Response(author_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            else:
-                # Return the error message
-                return author
-        except Exception:
+            pk = int(pk)
+        except ValueError:
             return Response({'body': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
 
-    def destroy(self, request, pk=None):
+        author_serializer = AuthorSerializer(data=request.data)
+        # Checks if author request data is valid
+        if not author_serializer.is_valid():
+            return Response(author_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            updated = self.apply_precondition(Author.objects.filter(id=pk)).update(
+                updated=timezone.now(), **author_serializer.validated_data
+            )
+            if not updated and self.precondition is not None:
+                return precondition_failed(Author)
+            if not updated:
+                return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+            rows_saved.send(sender=Author, ids=[pk], created=False)
+            author = Author.objects.get(id=pk)
+
+        author_serializer = AuthorSerializer(author)
+        return Response(author_serializer.data, status=status.HTTP_200_OK)
+
+    @conditional
+    def partial_update(self, request, pk=None):
         """
-        This method deletes an author
+        This method updates some fields of an author, writing only the ones
+        that changed.
         """
-        author = self.get_object(pk)
+        try:
+            author = self.get_object(int(pk))
+        except ValueError:
+            return Response({'body': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
 
         # We check if author is an author object or a message error
-        if isinstance(author, Author):
-            author.delete()
-            return Response({'author': 'Succesfully deleted!'}, status=status.HTTP_204_NO_CONTENT)
-        else:
-            # Return the error message
+        if not isinstance(author, Author):
             return author
 
+        author_serializer = AuthorSerializer(author, data=request.data, partial=True)
+        if not author_serializer.is_valid():
+            return Response(author_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        if not save_changes(author, author_serializer.validated_data, self.apply_precondition(Author.objects.all())):
+            return precondition_failed(Author)
+        author_serializer = AuthorSerializer(author)
+        return Response(author_serializer.data, status=status.HTTP_200_OK)
+
+    @openapi(
+        parameters=[
+            query_parameter('async', 'Deletes the author and their books in the background', 'boolean',
+                            default=False),
+        ],
+        responses={'202': {
+            'description': 'Returns the id and status of the deletion job.',
+            'schema': ref('DeletionJob'),
+        }},
+        definitions={'DeletionJob': DeletionJobSerializer}
+    )
+    def destroy(self, request, pk=None):
+        """
+        This method deletes an author and their books, `delete_batch_size`
+        books at a time so memory does not grow with their bibliography.
+
+        Pass `async=true` to get a 202 response with a job right away and
+        follow the deletion at `/jobs/{id}`.
+        """
+        try:
+            pk = int(pk)
+        except ValueError:
+            return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.query_params.get('async') in ('1', 'true'):
+            if not Author.objects.filter(id=pk).exists():
+                return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+            job = start_deletion(pk, self.delete_batch_size)
+            response = Response(DeletionJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+            response['Location'] = request.build_absolute_uri(reverse('deletion-job', args=[job.id]))
+            return response
+
+        # Each batch commits on its own, so the author's bibliography is not
+        # deleted in one transaction that holds its locks until the end.
+        if delete_author(pk, self.delete_batch_size) is None:
+            return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({'author': 'Succesfully deleted!'}, status=status.HTTP_204_NO_CONTENT)
+
+    def perform_bulk_destroy(self, objs):
+        """
+        Deletes every author like destroy() does, `delete_batch_size` books
+        at a time, committing every batch.
+        """
+        for pk in objs:
+            delete_author(pk, self.delete_batch_size)
+
 
-class BookViewSet(viewsets.ModelViewSet):
+class BookViewSet(ConditionalMixin, BulkModelMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     A viewset for viewing, creating, editing, retrieving and deleting books.
     """
-    queryset = Book.objects.all()
+    queryset = Book.objects.select_related('author')
     serializer_class = BookSerializer
+    filter_backends = (IndexedFieldsFilterBackend, OrderingFilter)
+    filter_params = {
+        'author': ('author_id', serializers.IntegerField()),
+        'isbn': ('isbn', serializers.CharField()),
+        'title__startswith': ('title__startswith', serializers.CharField()),
+        'published__gte': ('published__gte', serializers.DateField()),
+        'published__lte': ('published__lte', serializers.DateField()),
+        'updated__gt': ('updated__gt', serializers.DateTimeField()),
+    }
+    ordering_fields = ('title', 'isbn', 'published', 'created', 'updated')
+    ordering = ('created', 'id')
+    validator_fields = ('updated', 'author__updated')
+    export_chunk_size = 1000
 
-    def get_object(self, pk):
+    def get_object(self, pk, queryset=None):
         """
         Override the get_object() method to return a detail error message.
+
+        The author is joined in the same query because BookSerializer nests it.
         """
+        if queryset is None:
+            queryset = Book.objects.select_related('author')
         try:
-            book = Book.objects.get(id=pk)
+            book = queryset.get(id=pk)
             return book
         except Book.DoesNotExist:
             return Response({'book': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
 
+    def get_field_selection(self):
+        """
+        Returns the fields requested with `?fields=`, or None for all of them,
+        and whether the author is nested, as `?expand=author` requests. The
+        author is nested by default only when all fields are requested.
+        """
+        params = self.request.query_params
+
+        fields = None
+        if params.get('fields'):
+            fields = [name.strip() for name in params['fields'].split(',') if name.strip()]
+            unknown = [name for name in fields if name not in BookSerializer.Meta.fields]
+            if unknown:
+                raise ValidationError({'fields': 'Unknown fields: %s' % ', '.join(unknown)})
+
+        if 'expand' not in params:
+            return fields, fields is None
+        expand = [name.strip() for name in params['expand'].split(',') if name.strip()]
+        if set(expand) - {'author'}:
+            raise ValidationError({'expand': 'Must be author'})
+        return fields, 'author' in expand
+
+    def get_queryset(self):
+        """
+        Joins authors only when they are nested in the response, and only
+        returns the author's books on `/authors/{id}/books`.
+        """
+        fields, expand = self.get_field_selection()
+        if expand and (fields is None or 'author' in fields):
+            queryset = Book.objects.select_related('author')
+        else:
+            queryset = Book.objects.all()
+        # Views built outside a request, e.g. in tests, have no kwargs.
+        author_id = getattr(self, 'kwargs', {}).get('author_id')
+        if author_id is not None:
+            queryset = queryset.filter(author_id=author_id)
+        return queryset
+
+    def filter_queryset(self, queryset):
+        queryset = super(BookViewSet, self).filter_queryset(queryset)
+        return self.select_columns(queryset)
+
+    def select_columns(self, queryset):
+        """
+        Only loads the columns of the requested fields, and of the ordering
+        since the cursor is read from the last book of a page.
+        """
+        fields, expand = self.get_field_selection()
+        if fields is None:
+            return queryset
+        ordering = [name.lstrip('-') for name in queryset.query.order_by]
+        return queryset.only('id', *set(fields + ordering))
+
+    def get_converter_key(self):
+        fields, expand = self.get_field_selection()
+        return (tuple(fields) if fields is not None else None, expand)
+
+    def get_serializer(self, *args, **kwargs):
+        fields, expand = self.get_field_selection()
+        kwargs.setdefault('fields', fields)
+        kwargs.setdefault('expand', expand)
+        return super(BookViewSet, self).get_serializer(*args, **kwargs)
+
+    def resolve_bulk_related(self, items, partial=False):
+        """
+        Resolves the author of every item with a single query.
+        """
+        related = [{} for item in items]
+        errors = [{} for item in items]
+
+        author_ids = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or 'author' not in item:
+                if not partial:
+                    errors[index]['author'] = 'Field required'
+                continue
+            try:
+                author_ids[index] = int(item['author'])
+            except (TypeError, ValueError):
+                errors[index]['author'] = 'Incorrect format'
+
+        authors = in_bulk(Author.objects.all(), author_ids.values())
+        for index, author_id in author_ids.items():
+            if author_id in authors:
+                related[index]['author'] = authors[author_id]
+            else:
+                errors[index]['author'] = 'Not Found'
+
+        return related, errors
+
+    def bulk_written(self, old, new):
+        """
+        Moves the book counts of the authors whose books were created,
+        deleted or given to another author.
+        """
+        changes = Counter(book.author_id for book in new)
+        changes.subtract(book.author_id for book in old)
+        add_book_counts(changes)
+
+    @openapi(responses={'404': {'description': 'Not Found'}})
     def create(self, request):
         """
         This method creates a book.
@@ -124,84 +372,182 @@ class BookViewSet(viewsets.ModelViewSet):
         # Checks if book request data is valid.
         if book_serializer.is_valid():
             # We can create the book and assign it the author instance
-            book = Book.objects.create(
-                title = request.data['title'],
-                author = author,
-                isbn = request.data['isbn'],
-                published = request.data['published']
-            )
+            with transaction.atomic():
+                book = Book.objects.create(
+                    title = request.data['title'],
+                    author = author,
+                    isbn = request.data['isbn'],
+                    published = request.data['published']
+                )
+                add_book_counts({author.id: 1})
             book_serializer = BookSerializer(book)
             return Response(book_serializer.data, status=status.HTTP_201_CREATED)
         else:
             return Response(book_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @conditional
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        """
+        This method lists books, or the books of an author on
+        `/authors/{id}/books`.
+        """
+        response = super(BookViewSet, self).list(request, *args, **kwargs)
+        # Only an empty page may be the one of an author that does not exist.
+        if 'author_id' in kwargs and not response.data['results']:
+            if not Author.objects.filter(id=kwargs['author_id']).exists():
+                return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+        return response
+
+    @conditional
+    @cached_response
     def retrieve(self, request, pk=None):
         """
         This method retrieves a book.
         """
-        book = self.get_object(pk)
+        book = self.get_object(pk, self.select_columns(self.get_queryset()))
 
         # We check if book is a book object or a message error
         if isinstance(book, Book):
-            book_serializer = BookSerializer(book)
+            book_serializer = self.get_serializer(book)
             return Response(book_serializer.data, status=status.HTTP_200_OK)
         else:
             # Return the error message
             return book
 
+    @conditional
     def update(self, request, pk=None):
         """
         This method updates a book.
+
+        The row is written with a single UPDATE, which only matches if the
+        author exists, and the ISBN is left to its unique constraint. Its
+        current author is read first, locking the row, to move the book
+        counts when it changes. The book is then read back with its author
+        to return it.
         """
         try:
-            # If there is no author ID in request data or there's no author
-            # with supplied ID, exceptions are thrown.
+            # If there is no author ID in request data, exceptions are thrown.
             author_id = int(request.data['author'])
-            author = Author.objects.get(id=author_id)
-            book = self.get_object(pk)
-
-            # We check if book is a book object or a message error
-            if isinstance(book, Book):
-                book_serializer = BookSerializer(data=request.data)
-                # Checks if book request data is valid.
-                if book_serializer.is_valid():
-                    # We can update the book and assign it the author instance if it is
-                    # changed
-                    book.title = request.data['title']
-                    book.author = author
-                    book.isbn = request.data['isbn']
-                    book.published = request.data['published']
-                    book.save()
-
-                    book_serializer = BookSerializer(book)
-                    return Response(book_serializer.data, status=status.HTTP_200_OK)
-                else:
-                    return Response(book_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            else:
-                # Return the error message
-                return book
+            pk = int(pk)
         except KeyError:
             return Response({'author': 'Field required'}, status=status.HTTP_400_BAD_REQUEST)
-        except Author.DoesNotExist:
-            return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception:
+        except (TypeError, ValueError):
             return Response({'body': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
 
-    def destroy(self, request, pk=None):
+        book_serializer = self.get_bulk_serializer(data=request.data)
+        # Checks if book request data is valid.
+        if not book_serializer.is_valid():
+            return Response(book_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        author_exists = 'EXISTS (SELECT 1 FROM %s WHERE %s = %%s)' % (
+            connection.ops.quote_name(Author._meta.db_table), connection.ops.quote_name(Author._meta.pk.column)
+        )
+        try:
+            with transaction.atomic():
+                old_author_id = Book.objects.select_for_update().filter(id=pk).values_list(
+                    'author_id', flat=True
+                ).first()
+                updated = 0
+                if old_author_id is not None:
+                    books = self.apply_precondition(Book.objects.filter(id=pk))
+                    updated = books.extra(where=[author_exists], params=[author_id]).update(
+                        author_id=author_id, updated=timezone.now(), **book_serializer.validated_data
+                    )
+                if updated:
+                    add_book_counts({old_author_id: -1, author_id: 1} if old_author_id != author_id else {})
+                    rows_saved.send(sender=Book, ids=[pk], created=False)
+        except IntegrityError:
+            return Response({'isbn': [unique_error(Book, 'isbn')]}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not updated:
+            # Tells which one is missing only when the update failed.
+            if not Author.objects.filter(id=author_id).exists():
+                return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+            if self.precondition is not None:
+                return precondition_failed(Book)
+            return Response({'book': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+
+        book_serializer = BookSerializer(self.get_object(pk))
+        return Response(book_serializer.data, status=status.HTTP_200_OK)
+
+    @conditional
+    def partial_update(self, request, pk=None):
         """
-        This method deletes a book
+        This method updates some fields of a book, writing only the ones that
+        changed.
         """
-        book = self.get_object(pk)
+        try:
+            book = self.get_object(int(pk))
+            author_id = int(request.data['author']) if 'author' in request.data else None
+        except (TypeError, ValueError):
+            return Response({'body': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # We check if author is an author object or a message error
-        if isinstance(book, Book):
-            book.delete()
-            return Response({'book': 'Succesfully deleted!'}, status=status.HTTP_204_NO_CONTENT)
-        else:
-            # Return the error message
+        # We check if book is a book object or a message error
+        if not isinstance(book, Book):
             return book
 
+        book_serializer = self.get_bulk_serializer(book, data=request.data, partial=True)
+        if not book_serializer.is_valid():
+            return Response(book_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        values = dict(book_serializer.validated_data)
+        if author_id is not None and author_id != book.author_id:
+            try:
+                values['author'] = Author.objects.get(id=author_id)
+            except Author.DoesNotExist:
+                return Response({'author': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+
+        books = self.apply_precondition(Book.objects.all())
+        try:
+            if 'author' not in values:
+                saved = save_changes(book, values, books)
+            else:
+                with transaction.atomic():
+                    # Read again and locked, so concurrent moves count once.
+                    old_author_id = books.select_for_update().filter(id=book.id).values_list(
+                        'author_id', flat=True
+                    ).first()
+                    if old_author_id is None and self.precondition is not None:
+                        return precondition_failed(Book)
+                    if old_author_id is None:
+                        return Response({'book': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+                    saved = save_changes(book, values, books)
+                    if saved:
+                        add_book_counts({old_author_id: -1, author_id: 1} if old_author_id != author_id else {})
+        except IntegrityError:
+            return Response({'isbn': [unique_error(Book, 'isbn')]}, status=status.HTTP_400_BAD_REQUEST)
+        if not saved:
+            return precondition_failed(Book)
+
+        book_serializer = BookSerializer(book)
+        return Response(book_serializer.data, status=status.HTTP_200_OK)
+
+    def destroy(self, request, pk=None):
+        """
+        This method deletes a book with a single DELETE, after reading and
+        locking its author's id to count the book off.
+        """
+        try:
+            pk = int(pk)
+        except ValueError:
+            return Response({'book': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+
+        with transaction.atomic():
+            author_id = Book.objects.select_for_update().filter(id=pk).values_list('author_id', flat=True).first()
+            if author_id is None:
+                return Response({'book': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+            raw_delete(Book.objects.filter(id=pk))
+            add_book_counts({author_id: -1})
+            rows_deleted.send(sender=Book, ids=[pk])
+
+        return Response({'book': 'Succesfully deleted!'}, status=status.HTTP_204_NO_CONTENT)
 
+    @openapi(
+        summary='Creates a book with a new author',
+        nested_body=('author',),
+        responses={'201': {'description': 'Returns the book created.', 'schema': ref('Book')}}
+    )
     @list_route(methods=['post'], url_path='createBookAndAuthor')
     def create_book_and_author(self, request):
         """
@@ -210,37 +556,168 @@ class BookViewSet(viewsets.ModelViewSet):
         """
         try:
             author_serializer = AuthorSerializer(data=request.data['author'])
-            # Checks if author request data is valid
-            if author_serializer.is_valid():
-                # We can create the author
-                author = Author.objects.create(
-                    first_name=request.data['author']['first_name'],
-                    last_name=request.data['author']['last_name']
-                )
-
-                book_serializer = BookSerializer(data=request.data)
-                # Checks if book request data is valid
-                if book_serializer.is_valid():
-                    # We can create the book and assign it the author instance
-                    book = Book.objects.create(
-                        title=request.data['title'],
-                        author=author,
-                        isbn=request.data['isbn'],
-                        published=request.data['published']
-                    )
-                    # Now serialize the book object and return it
-                    book_serializer = BookSerializer(book)
-                    return Response(book_serializer.data, status=status.HTTP_201_CREATED)
-                else:
-                    return Response(book_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            else:
-                return Response(author_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception:
+        except (KeyError, TypeError):
             return Response({'body': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
 
+        # Both are validated before writing, so that an invalid book never
+        # leaves its author behind.
+        if not author_serializer.is_valid():
+            return Response(author_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        book_serializer = BookSerializer(data=request.data)
+        if not book_serializer.is_valid():
+            return Response(book_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                author = Author.objects.create(book_count=1, **author_serializer.validated_data)
+                book = Book.objects.create(author=author, **book_serializer.validated_data)
+        except IntegrityError:
+            # Another request took the ISBN since it was validated.
+            return Response({'isbn': [unique_error(Book, 'isbn')]}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Now serialize the book object and return it
+        book_serializer = BookSerializer(book)
+        return Response(book_serializer.data, status=status.HTTP_201_CREATED)
+
+    @openapi(
+        operationId='exportBooks',
+        summary='Exports the whole catalog',
+        produces=['application/x-ndjson', 'text/csv'],
+        parameters=[
+            query_parameter('type', 'Export format', enum=['ndjson', 'csv'], default='ndjson'),
+            query_parameter('updated__gt', 'Only export books changed after this ISO 8601 datetime',
+                            format='date-time'),
+        ],
+        responses={'200': {'description': 'A stream of books.'}}
+    )
+    @list_route(methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Streams every book with its author as NDJSON (default) or CSV.
+
+        Pass `type=csv` to get CSV and `updated__gt` with an ISO 8601 datetime
+        to only export books that changed, or whose author changed, since then.
+        """
+        export_type = request.query_params.get('type', 'ndjson')
+        if export_type == 'ndjson':
+            render_rows, content_type = ndjson_rows, 'application/x-ndjson; charset=utf-8'
+        elif export_type == 'csv':
+            render_rows, content_type = csv_rows, 'text/csv; charset=utf-8'
+        else:
+            return Response({'type': 'Must be ndjson or csv'}, status=status.HTTP_400_BAD_REQUEST)
+
+        books = Book.objects.select_related('author')
+
+        watermark = request.query_params.get('updated__gt')
+        if watermark is not None:
+            try:
+                watermark = parse_datetime(watermark)
+            except ValueError:
+                watermark = None
+            if watermark is None:
+                return Response({'updated__gt': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(watermark):
+                watermark = timezone.make_aware(watermark, timezone.utc)
+            books = books.filter(Q(updated__gt=watermark) | Q(author__updated__gt=watermark))
+
+        response = StreamingHttpResponse(
+            render_rows(iterate_in_chunks(books, self.export_chunk_size)),
+            content_type=content_type
+        )
+        response['Content-Disposition'] = 'attachment; filename="books.%s"' % export_type
+        return response
+
+
+@openapi(
+    operationId='searchBooks',
+    summary='Searches books',
+    tags=['Books'],
+    parameters=[
+        query_parameter('q', 'Words to search for', required=True),
+        query_parameter('limit', 'Maximum number of results', 'integer',
+                        minimum=1, maximum=100, default=20),
+    ],
+    responses={
+        '200': {
+            'description': 'Returns the matching books.',
+            'schema': {'type': 'object', 'properties': {
+                'results': {'type': 'array', 'items': ref('Book')},
+            }},
+        },
+        '400': {'description': 'Bad Request'},
+    }
+)
+@api_view(['GET'])
+def search(request):
+    """
+    Searches books by title and author name and returns the best matches
+    first. Every word of `q` is matched as a prefix.
+    """
+    text = request.query_params.get('q', '').strip()
+    if not text:
+        return Response({'q': 'Field required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        limit = int(request.query_params.get('limit', 20))
+    except ValueError:
+        return Response({'limit': 'Incorrect format'}, status=status.HTTP_400_BAD_REQUEST)
+    if not 0 < limit <= 100:
+        return Response({'limit': 'Must be between 1 and 100'}, status=status.HTTP_400_BAD_REQUEST)
+
+    books = search_books(text, limit)
+    book_serializer = BookSerializer(books, many=True)
+    return Response({'results': book_serializer.data}, status=status.HTTP_200_OK)
+
+
+@openapi(
+    operationId='showDeletionJobById',
+    summary='Info for a specific deletion job',
+    tags=['Authors'],
+    parameters=[OrderedDict([
+        ('name', 'id'), ('in', 'path'), ('required', True),
+        ('description', 'The id of the deletion job'), ('type', 'integer'), ('format', 'int64'),
+    ])],
+    responses={
+        '200': {'description': 'Returns the deletion job.', 'schema': ref('DeletionJob')},
+        '404': {'description': 'Not Found'},
+    },
+    definitions={'DeletionJob': DeletionJobSerializer}
+)
+@api_view(['GET'])
+def deletion_job(request, pk):
+    """
+    Returns the status of the background deletion of an author and how many
+    of their books it has deleted.
+    """
+    try:
+        job = DeletionJob.objects.get(id=pk)
+    except DeletionJob.DoesNotExist:
+        return Response({'job': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(DeletionJobSerializer(job).data, status=status.HTTP_200_OK)
+
+
+@prerendered('application/json')
+def render_openapi_spec():
+    # Sorted keys keep the bytes, and so the ETag, the same in every process.
+    return json.dumps(get_spec(), separators=(',', ':'), sort_keys=True)
+
+
+@prerendered('text/html; charset=utf-8')
+def render_index():
+    return render_to_string("api_books/index.html")
+
+
+@require_safe
+def openapi_spec(request):
+    """
+    Returns the OpenAPI spec of the API, generated from its routes.
+    """
+    return render_openapi_spec().response(request)
+
 
+@require_safe
 def index(request):
     """
     Returns the Library API html.
     """
-    return render(request, "api_books/index.html")
+    return render_index().response(request)
@@ -0,0 +1,28 @@
+"""
+ASGI config for api project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with uvicorn workers under gunicorn, e.g.:
+
+    gunicorn --pythonpath api -k uvicorn.workers.UvicornWorker config.asgi:application
+
+Each request runs the WSGI application of config.wsgi_heroku on one of
+ASGI_THREADS threads (DB_POOL_MAX_SIZE or 4 by default). Once ASGI_MAX_PENDING
+requests are queued (16 per thread by default), new ones get a 503 response.
+"""
+
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+from config.asgi_handler import ASGIHandler
+from config.wsgi_heroku import application as wsgi_application
+
+threads = int(os.environ.get('ASGI_THREADS', os.environ.get('DB_POOL_MAX_SIZE', 4)))
+max_pending = os.environ.get('ASGI_MAX_PENDING')
+
+application = ASGIHandler(
+    wsgi_application,
+    threads=threads,
+    max_pending=int(max_pending) if max_pending else None
+)
@@ -0,0 +1,158 @@
+"""
+Serves a WSGI application to an ASGI server, running it on a bounded
+thread pool. Needs Python 3.5 or later.
+"""
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+
+class ASGIHandler(object):
+    """
+    An ASGI application running a WSGI application, such as Django 1.8's,
+    which has no async views or ORM.
+
+    The event loop reads request bodies and writes responses, so slow
+    clients do not hold a thread. Each request then runs on one of `threads`
+    threads, which bounds the database connections too. Once `max_pending`
+    requests are queued or running, new ones get a 503 response right away
+    instead of waiting in an unbounded queue.
+    """
+
+    def __init__(self, wsgi_application, threads=4, max_pending=None):
+        self.wsgi_application = wsgi_application
+        self.threads = threads
+        self.max_pending = max_pending if max_pending is not None else threads * 16
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+        self.pending = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self.handle(scope, receive, send)
+        else:
+            raise ValueError('Unsupported ASGI scope type %r' % scope['type'])
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle(self, scope, receive, send):
+        body = await self.read_body(receive)
+        if body is None:
+            return
+
+        if self.pending >= self.max_pending:
+            await send({
+                'type': 'http.response.start', 'status': 503,
+                'headers': [(b'content-type', b'text/plain'), (b'retry-after', b'1')],
+            })
+            await send({'type': 'http.response.body', 'body': b'Service Unavailable'})
+            return
+
+        loop = asyncio.get_event_loop()
+        self.pending += 1
+        try:
+            environ = self.get_environ(scope, body)
+            status, headers, chunks = await loop.run_in_executor(self.executor, self.run, environ)
+            if isinstance(chunks, list):
+                body = b''.join(chunks)
+                if not any(name == b'content-length' for name, value in headers):
+                    headers.append((b'content-length', str(len(body)).encode('latin-1')))
+                await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+                await send({'type': 'http.response.body', 'body': body})
+                return
+
+            await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+
+            # Streaming responses are read chunk by chunk, maybe each on a
+            # different thread, and closed at the end like WSGI servers do.
+            iterator = iter(chunks)
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(self.executor, next, iterator, None)
+                    if chunk is None:
+                        break
+                    if chunk:
+                        await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            finally:
+                close = getattr(chunks, 'close', None)
+                if close is not None:
+                    await loop.run_in_executor(self.executor, close)
+            await send({'type': 'http.response.body', 'body': b''})
+        finally:
+            self.pending -= 1
+
+    async def read_body(self, receive):
+        """
+        Returns the request body, or None if the client disconnected.
+        """
+        body = BytesIO()
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+            body.write(message.get('body', b''))
+            if not message.get('more_body', False):
+                return body.getvalue()
+
+    def get_environ(self, scope, body):
+        server_name, server_port = scope.get('server') or ('localhost', 80)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', ''),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server_name,
+            'SERVER_PORT': str(server_port),
+            'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+            'REMOTE_ADDR': (scope.get('client') or ('', 0))[0],
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False,
+        }
+        for name, value in scope.get('headers', []):
+            name = name.decode('latin-1').upper().replace('-', '_')
+            if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                name = 'HTTP_' + name
+            value = value.decode('latin-1')
+            environ[name] = environ[name] + ',' + value if name in environ else value
+        return environ
+
+    def run(self, environ):
+        """
+        Runs the WSGI application and returns the status, the headers and
+        either the list of body chunks or, for streaming responses, the
+        application's iterable.
+        """
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in headers
+            ]
+
+        result = self.wsgi_application(environ, start_response)
+        if getattr(result, 'streaming', False):
+            return response['status'], response['headers'], result
+        try:
+            chunks = list(result)
+        finally:
+            close = getattr(result, 'close', None)
+            if close is not None:
+                close()
+        return response['status'], response['headers'], chunks
@@ -0,0 +1,23 @@
+"""
+Connection management for the database backends in config.db.backends:
+health checks of persistent connections, an optional per-process
+connection pool and functions run once transactions commit.
+"""
+from __future__ import unicode_literals
+
+from django.db import transaction
+
+from config.db.mixins import ManagedConnectionMixin
+
+
+def on_commit(func, using=None):
+    """
+    Runs func once the transaction in progress on the connection commits,
+    or at once outside of one, like Django 1.9's transaction.on_commit().
+    Backends other than those of config.db.backends run it at once.
+    """
+    connection = transaction.get_connection(using)
+    if isinstance(connection, ManagedConnectionMixin):
+        connection.on_commit(func)
+    else:
+        func()
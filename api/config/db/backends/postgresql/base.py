@@ -0,0 +1,20 @@
+from __future__ import unicode_literals
+
+from django.db.backends.postgresql_psycopg2 import base
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from config.db.mixins import ManagedConnectionMixin
+
+
+class DatabaseWrapper(ManagedConnectionMixin, base.DatabaseWrapper):
+    """
+    PostgreSQL with connection health checks and pooling.
+    """
+    pooled_attributes = ('isolation_level',)
+
+    def is_reusable(self):
+        # A transaction left open on the connection would leak to the next thread.
+        return (
+            super(DatabaseWrapper, self).is_reusable() and
+            self.connection.get_transaction_status() == TRANSACTION_STATUS_IDLE
+        )
@@ -0,0 +1,29 @@
+from __future__ import unicode_literals
+
+from django.db.backends.sqlite3 import base
+
+from config.db.mixins import ManagedConnectionMixin
+
+
+class DatabaseWrapper(ManagedConnectionMixin, base.DatabaseWrapper):
+    """
+    SQLite with connection health checks and pooling, mostly to exercise them
+    in development and tests, and transactions that wait for each other.
+    In-memory databases are never pooled.
+    """
+
+    def can_pool(self):
+        return not self.is_in_memory_db(self.settings_dict['NAME'])
+
+    def is_usable(self):
+        # Django's SQLite backend assumes that connections always work.
+        return self.check_connection(self.connection)
+
+    def _start_transaction_under_autocommit(self):
+        """
+        Begins transactions with the write lock. With Django's deferred
+        BEGIN, a transaction that reads before writing, as the views do to
+        move book counts, fails at once with "database is locked" when
+        another one is writing, instead of waiting for it.
+        """
+        self.cursor().execute('BEGIN IMMEDIATE')
@@ -0,0 +1,162 @@
+from __future__ import unicode_literals
+
+from django.db.transaction import TransactionManagementError
+
+from config.db.pool import PoolTimeout, PooledConnection, get_pool
+
+
+class ManagedConnectionMixin(object):
+    """
+    Adds two settings to a database backend's DatabaseWrapper:
+
+    - CONN_HEALTH_CHECKS: with persistent connections (CONN_MAX_AGE > 0),
+      check that the connection still works before its first use in each
+      request and reconnect if it does not, instead of failing the request.
+      Backported from Django 4.1.
+    - POOL: a dict with MAX_SIZE, TIMEOUT and MAX_AGE. Connections closed
+      by Django, e.g. at the end of each request with CONN_MAX_AGE = 0, go
+      back to a pool shared by the threads of the process instead of being
+      closed, and at most MAX_SIZE are open at once. Pooled connections are
+      health checked when they are taken out if CONN_HEALTH_CHECKS is on.
+
+    It also adds on_commit(), which runs a function once the transaction in
+    progress commits, or at once outside of one. Backported from Django 1.9.
+    """
+
+    # Attributes that get_new_connection() sets on the wrapper, restored
+    # when a pooled connection is reused.
+    pooled_attributes = ()
+
+    health_check_done = False
+    pooled_connection = None
+    run_commit_hooks_on_set_autocommit_on = False
+
+    def __init__(self, *args, **kwargs):
+        super(ManagedConnectionMixin, self).__init__(*args, **kwargs)
+        # (savepoint ids, function) of every function waiting for a commit.
+        self.run_on_commit = []
+
+    def get_pool(self):
+        options = self.settings_dict.get('POOL')
+        if options is None or not self.can_pool():
+            return None
+        return get_pool(self.alias, options)
+
+    def can_pool(self):
+        return True
+
+    def connect(self):
+        super(ManagedConnectionMixin, self).connect()
+        # A new connection, or a pooled one that was checked, works.
+        self.health_check_done = True
+
+    def get_new_connection(self, conn_params):
+        pool = self.get_pool()
+        if pool is None:
+            return super(ManagedConnectionMixin, self).get_new_connection(conn_params)
+
+        def connect():
+            connection = super(ManagedConnectionMixin, self).get_new_connection(conn_params)
+            attributes = {name: getattr(self, name) for name in self.pooled_attributes}
+            return PooledConnection(connection, attributes)
+
+        check = self.check_connection if self.settings_dict.get('CONN_HEALTH_CHECKS') else None
+        try:
+            self.pooled_connection = pool.acquire(connect, check)
+        except PoolTimeout as e:
+            raise self.Database.OperationalError(str(e))
+        for name, value in self.pooled_connection.attributes.items():
+            setattr(self, name, value)
+        return self.pooled_connection.connection
+
+    def _close(self):
+        pooled, self.pooled_connection = self.pooled_connection, None
+        if pooled is None:
+            return super(ManagedConnectionMixin, self)._close()
+
+        pool = self.get_pool()
+        if self.is_reusable():
+            pool.release(pooled)
+        else:
+            pool.discard(pooled)
+
+    def is_reusable(self):
+        """
+        Tells if the connection can be handed to another thread as it is.
+        """
+        return (
+            not self.in_atomic_block and
+            not self.errors_occurred and
+            self.autocommit == self.settings_dict['AUTOCOMMIT']
+        )
+
+    def check_connection(self, connection):
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute('SELECT 1')
+            finally:
+                cursor.close()
+        except self.Database.Error:
+            return False
+        return True
+
+    def close_if_unusable_or_obsolete(self):
+        # Django calls this as each request starts and finishes.
+        self.health_check_done = False
+        super(ManagedConnectionMixin, self).close_if_unusable_or_obsolete()
+
+    def ensure_connection(self):
+        if (self.connection is not None and not self.health_check_done and
+                self.settings_dict.get('CONN_HEALTH_CHECKS') and not self.in_atomic_block):
+            self.health_check_done = True
+            if not self.is_usable():
+                # Like after a failed query, so that close() does not pool it.
+                self.errors_occurred = True
+                self.close()
+        super(ManagedConnectionMixin, self).ensure_connection()
+
+    def on_commit(self, func):
+        if self.in_atomic_block:
+            # Remembers the savepoints to discard func if one is rolled back.
+            self.run_on_commit.append((set(self.savepoint_ids), func))
+        elif not self.get_autocommit():
+            raise TransactionManagementError(
+                'on_commit() cannot be used in manual transaction management')
+        else:
+            func()
+
+    def run_and_clear_commit_hooks(self):
+        self.validate_no_atomic_block()
+        run_on_commit, self.run_on_commit = self.run_on_commit, []
+        for sids, func in run_on_commit:
+            func()
+
+    def commit(self):
+        super(ManagedConnectionMixin, self).commit()
+        if self.features.autocommits_when_autocommit_is_off:
+            # atomic() turns autocommit back on without set_autocommit().
+            self.run_and_clear_commit_hooks()
+        else:
+            # Functions that query must wait for autocommit, or they would
+            # start a transaction that set_autocommit() then refuses to end.
+            self.run_commit_hooks_on_set_autocommit_on = True
+
+    def rollback(self):
+        super(ManagedConnectionMixin, self).rollback()
+        self.run_on_commit = []
+
+    def savepoint_rollback(self, sid):
+        super(ManagedConnectionMixin, self).savepoint_rollback(sid)
+        self.run_on_commit = [(sids, func) for sids, func in self.run_on_commit if sid not in sids]
+
+    def set_autocommit(self, autocommit):
+        super(ManagedConnectionMixin, self).set_autocommit(autocommit)
+        if autocommit and self.run_commit_hooks_on_set_autocommit_on:
+            self.run_commit_hooks_on_set_autocommit_on = False
+            self.run_and_clear_commit_hooks()
+
+    def close(self):
+        # The transaction, if any, ends without committing.
+        self.run_on_commit = []
+        super(ManagedConnectionMixin, self).close()
@@ -0,0 +1,206 @@
+from __future__ import unicode_literals
+
+import os
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class PooledConnection(object):
+    """
+    A connection of a ConnectionPool, with the attributes of the database
+    wrapper that opened it.
+    """
+
+    def __init__(self, connection, attributes=None):
+        self.connection = connection
+        self.attributes = attributes or {}
+        self.created_at = time.time()
+
+
+class ConnectionPool(object):
+    """
+    Hands out at most `max_size` connections at a time to the threads of a
+    process. Threads asking for one while all are in use wait for up to
+    `timeout` seconds. Idle connections are reused most recently used first
+    and closed once they are `max_age` seconds old.
+
+    The pool keeps the counters returned by stats(). A pool inherited by a
+    forked process starts over empty, leaving the parent's connections alone.
+    """
+
+    def __init__(self, max_size=4, timeout=10, max_age=None):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_age = max_age
+        self.condition = threading.Condition(threading.Lock())
+        self.reset()
+
+    def reset(self):
+        self.pid = os.getpid()
+        self.idle = deque()
+        self.in_use = 0
+        self.created = 0
+        self.closed = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+        self.failed_checks = 0
+
+    def acquire(self, connect, check=None):
+        """
+        Returns an idle PooledConnection that passes check, if given, or a new
+        one opened with connect(). Raises PoolTimeout if none is released in
+        time.
+        """
+        start = time.time()
+        waited = False
+        with self.condition:
+            if self.pid != os.getpid():
+                self.reset()
+
+            while True:
+                pooled = self.pop_idle()
+                if pooled is not None or self.in_use < self.max_size:
+                    self.in_use += 1
+                    break
+                remaining = start + self.timeout - time.time()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout('No connection was released within %s seconds' % self.timeout)
+                waited = True
+                self.condition.wait(remaining)
+
+            self.checkouts += 1
+            if waited:
+                wait_time = time.time() - start
+                self.waits += 1
+                self.wait_time += wait_time
+                self.max_wait = max(self.max_wait, wait_time)
+
+        try:
+            if pooled is not None and check is not None and not check(pooled.connection):
+                self.close(pooled)
+                with self.condition:
+                    self.failed_checks += 1
+                    self.closed += 1
+                pooled = None
+            if pooled is None:
+                pooled = connect()
+                with self.condition:
+                    self.created += 1
+        except Exception:
+            with self.condition:
+                self.in_use -= 1
+                self.condition.notify()
+            raise
+        return pooled
+
+    def release(self, pooled):
+        """
+        Puts back a connection that is in a clean state for the next thread.
+        """
+        with self.condition:
+            if self.pid != os.getpid():
+                return
+            self.in_use -= 1
+            self.idle.append(pooled)
+            self.condition.notify()
+
+    def discard(self, pooled):
+        """
+        Closes a connection that cannot be reused and frees its place.
+        """
+        with self.condition:
+            if self.pid != os.getpid():
+                return
+            self.in_use -= 1
+            self.closed += 1
+            self.condition.notify()
+        self.close(pooled)
+
+    def pop_idle(self):
+        """
+        Returns the most recently used idle connection under max_age, closing
+        the older ones. Must hold the lock.
+        """
+        while self.idle:
+            pooled = self.idle.pop()
+            if self.max_age is None or time.time() - pooled.created_at < self.max_age:
+                return pooled
+            self.close(pooled)
+            self.closed += 1
+        return None
+
+    def close(self, pooled):
+        try:
+            pooled.connection.close()
+        except Exception:
+            pass
+
+    def close_idle(self):
+        with self.condition:
+            while self.idle:
+                self.close(self.idle.pop())
+                self.closed += 1
+
+    def stats(self):
+        with self.condition:
+            return {
+                'max_size': self.max_size,
+                'in_use': self.in_use,
+                'idle': len(self.idle),
+                'created': self.created,
+                'closed': self.closed,
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'wait_time': round(self.wait_time, 6),
+                'max_wait': round(self.max_wait, 6),
+                'timeouts': self.timeouts,
+                'failed_checks': self.failed_checks,
+            }
+
+
+# Pools of the process, keyed by database alias.
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, options):
+    """
+    Returns the pool of the database alias, created from its POOL setting.
+    """
+    pool = _pools.get(alias)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(alias)
+            if pool is None:
+                pool = _pools[alias] = ConnectionPool(
+                    max_size=options.get('MAX_SIZE', 4),
+                    timeout=options.get('TIMEOUT', 10),
+                    max_age=options.get('MAX_AGE'),
+                )
+    return pool
+
+
+def pool_stats():
+    """
+    Returns the stats of every pool of the process, keyed by alias.
+    """
+    return {alias: pool.stats() for alias, pool in list(_pools.items())}
+
+
+def close_pools():
+    """
+    Closes the idle connections of every pool and forgets the pools.
+    """
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_idle()
+        _pools.clear()
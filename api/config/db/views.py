@@ -0,0 +1,15 @@
+from __future__ import unicode_literals
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from config.db.pool import pool_stats
+
+
+@staff_member_required
+def pool_stats_view(request):
+    """
+    Returns the stats of the connection pools of the process that serves the
+    request: with several workers, each one has its own.
+    """
+    return JsonResponse({'pools': pool_stats()})
@@ -0,0 +1,237 @@
+"""
+gunicorn configuration for api project.
+
+Pass it to gunicorn with ``-c``, e.g. on Heroku:
+
+    gunicorn --pythonpath /app/api -c /app/api/config/gunicorn_conf.py config.wsgi_heroku
+
+The number of workers and their class are picked from the CPUs and the
+memory of the dyno or container, and each can be overridden:
+
+- WEB_CONCURRENCY: the number of worker processes.
+- GUNICORN_WORKER_CLASS: e.g. sync, gthread, gevent or
+  uvicorn.workers.UvicornWorker.
+- GUNICORN_THREADS: the threads of each gthread worker.
+- GUNICORN_WORKER_MEMORY: the memory, in MB, to allow for each worker.
+- GUNICORN_MAX_REQUESTS and GUNICORN_MAX_REQUESTS_JITTER: how many
+  requests a worker serves before it is replaced.
+- GUNICORN_PRELOAD: set to 0 to load the application in each worker.
+- GUNICORN_TIMEOUT: the seconds a request may take before its worker is
+  killed.
+- METRICS_DIR: where the workers share their request metrics; a new
+  temporary directory for each master by default.
+
+gunicorn reads this file before --pythonpath is applied, so it imports
+Django only within the server hooks.
+"""
+from __future__ import unicode_literals
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+
+# Above this many bytes, a cgroup v1 memory limit means no limit.
+UNLIMITED_MEMORY = 1 << 60
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def cpu_count():
+    """
+    Returns the CPUs the process may run on.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+def memory_limit():
+    """
+    Returns the bytes of memory available to the container or machine, or
+    None if unknown.
+    """
+    limits = []
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except (IOError, OSError):
+            continue
+        if value.isdigit() and int(value) < UNLIMITED_MEMORY:
+            limits.append(int(value))
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    limits.append(int(line.split()[1]) * 1024)
+    except (IOError, OSError):
+        pass
+    return min(limits) if limits else None
+
+
+def server_profile(cpus, memory, worker_memory=128 * 1024 * 1024, environ=os.environ):
+    """
+    Returns the number of workers, their class and their threads.
+
+    Sync workers are the simplest and, at 2 per CPU plus one, keep the CPUs
+    busy while others wait on the database. When the memory does not fit as
+    many processes, e.g. on a 512 MB dyno which reports 8 CPUs, fewer
+    gthread workers run enough threads to reach the same concurrency.
+    """
+    by_cpu = 2 * cpus + 1
+    workers = by_cpu
+    if memory is not None:
+        # The master process takes about as much as a worker.
+        workers = max(min(by_cpu, memory // worker_memory - 1), 1)
+    if environ.get('WEB_CONCURRENCY'):
+        workers = int(environ['WEB_CONCURRENCY'])
+
+    threads = 1
+    if workers < by_cpu:
+        threads = min(-(-by_cpu // workers), 8)
+    if environ.get('DB_POOL_MAX_SIZE'):
+        # Each thread may hold one of the pooled connections.
+        threads = int(environ['DB_POOL_MAX_SIZE'])
+    if environ.get('GUNICORN_THREADS'):
+        threads = int(environ['GUNICORN_THREADS'])
+
+    worker_class = environ.get('GUNICORN_WORKER_CLASS') or ('gthread' if threads > 1 else 'sync')
+    return workers, worker_class, threads
+
+
+def read_rss_kb():
+    """
+    Returns the resident memory of this process in kB.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except (IOError, OSError):
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def warm_up_urls():
+    from django.core.urlresolvers import get_resolver
+
+    # Compiles the patterns and builds the reverse lookups.
+    get_resolver(None).reverse_dict
+
+
+def warm_up_databases(keep_open):
+    from django.db import connections
+
+    for connection in connections.all():
+        connection.ensure_connection()
+        if not keep_open:
+            # Pooled connections go back to the pool for the threads.
+            connection.close()
+
+
+cpus = cpu_count()
+memory = memory_limit()
+workers, worker_class, threads = server_profile(
+    cpus, memory, env_int('GUNICORN_WORKER_MEMORY', 128) * 1024 * 1024
+)
+
+# Load Django once in the master so that the workers share its memory
+# copy-on-write and a broken deploy fails before any worker starts.
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+
+# Replace workers after a number of requests, spread so that they do not
+# all restart at once, to bound the growth of their memory.
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10)
+
+timeout = env_int('GUNICORN_TIMEOUT', 30)
+
+# The temporary METRICS_DIR of this master, if it made one.
+metrics_dir = None
+
+
+def on_starting(server):
+    global metrics_dir
+    if os.environ.get('METRICS_DIR'):
+        return
+    # Each worker writes its request metrics there, so that /metrics adds
+    # up those of all of them whichever worker serves it.
+    metrics_dir = os.environ['METRICS_DIR'] = tempfile.mkdtemp(prefix='api-metrics-')
+    if server.cfg.preload_app:
+        # The settings were loaded with the application.
+        from django.conf import settings
+        settings.METRICS_DIR = metrics_dir
+
+
+def when_ready(server):
+    server.log.info(
+        'Serving with %d %s workers of %d threads (%d CPUs, %s MB of memory, preload %s)',
+        server.cfg.workers, server.cfg.worker_class_str, server.cfg.threads, cpus,
+        memory // (1024 * 1024) if memory is not None else 'unknown',
+        'on' if server.cfg.preload_app else 'off'
+    )
+    if server.cfg.preload_app:
+        # Shared by the workers.
+        warm_up_urls()
+
+
+def pre_fork(server, worker):
+    if server.cfg.preload_app:
+        # Connections opened while loading the application must not be
+        # shared with the workers.
+        from django.db import connections
+        for connection in connections.all():
+            connection.close()
+    worker.forked_at = time.time()
+
+
+def post_fork(server, worker):
+    if server.cfg.worker_class_str == 'gevent':
+        # Lets queries yield to other greenlets instead of blocking them.
+        try:
+            from psycogreen.gevent import patch_psycopg
+        except ImportError:
+            server.log.warning('psycogreen is not installed, so queries block gevent workers')
+        else:
+            patch_psycopg()
+
+
+def post_worker_init(worker):
+    # Runs once the worker has loaded the application, with or without
+    # preload. Only sync workers serve requests on the thread that warms up.
+    try:
+        warm_up_urls()
+        warm_up_databases(keep_open=worker.cfg.worker_class_str == 'sync')
+    except Exception:
+        worker.log.exception('Worker %s could not warm up', worker.pid)
+    worker.log.info(
+        'Worker %s booted in %.0f ms, RSS %d kB',
+        worker.pid, (time.time() - worker.forked_at) * 1000, read_rss_kb()
+    )
+
+
+def worker_exit(server, worker):
+    # Also called in the master for workers that died.
+    if os.getpid() != worker.pid:
+        return
+    worker.log.info('Worker %s exiting, RSS %d kB', worker.pid, read_rss_kb())
+    try:
+        from config.metrics.queries import get_query_stats
+        from config.metrics.store import get_store
+        get_store().flush()
+        get_query_stats().flush()
+    except Exception:
+        worker.log.exception('Worker %s could not write its metrics', worker.pid)
+
+
+def on_exit(server):
+    if metrics_dir is not None:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
@@ -0,0 +1,5 @@
+"""
+Request metrics: the time each request spends in the database, serializing
+and rendering, sent as a Server-Timing header, and latency histograms per
+route, added up over the worker processes and served at /metrics.
+"""
@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import logging
+import random
+from timeit import default_timer as timer
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from config.metrics.queries import get_query_stats, group_statements
+from config.metrics.store import get_store
+from config.metrics.timing import clear_timing, instrument_connections, start_timing
+
+
+logger = logging.getLogger('config.metrics')
+
+METHODS = frozenset(['GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'])
+
+# Statements listed in the log of a request over the thresholds.
+LOGGED_STATEMENTS = 3
+
+
+def get_route(request):
+    # Route names keep the number of series bounded.
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else 'unmatched'
+
+
+class MetricsMiddleware(object):
+    """
+    Times each request, adds its Server-Timing header when SERVER_TIMING is
+    set and records it in the metrics store under its route name.
+
+    It should come first in MIDDLEWARE_CLASSES, so that the total includes
+    the rest of the middleware and rendering happens after its
+    process_template_response().
+    """
+
+    def __init__(self):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+
+    def process_request(self, request):
+        instrument_connections()
+        request.timing = start_timing()
+
+    def process_template_response(self, request, response):
+        timing = getattr(request, 'timing', None)
+        if timing is not None:
+            start = timer()
+            response.add_post_render_callback(lambda response: timing.add('render', timer() - start))
+        return response
+
+    def process_response(self, request, response):
+        timing = getattr(request, 'timing', None)
+        if timing is None:
+            return response
+        clear_timing()
+        timing.stop()
+
+        if settings.SERVER_TIMING:
+            response['Server-Timing'] = timing.header()
+        get_store().observe(self.get_key(request, response), timing)
+        return response
+
+    def get_key(self, request, response):
+        method = request.method if request.method in METHODS else 'OTHER'
+        return get_route(request), method, str(response.status_code)
+
+
+class QueryCaptureMiddleware(object):
+    """
+    Records the statements of a QUERY_CAPTURE_SAMPLE_RATE share of the
+    requests in the query stats of the process, and logs the requests which
+    run more than QUERY_CAPTURE_MAX_QUERIES queries or take longer than
+    QUERY_CAPTURE_MAX_SECONDS, with their most run statements if sampled.
+
+    It is only used with QUERY_CAPTURE_ENABLED. It shares the timing of
+    MetricsMiddleware, when that comes before it, or starts its own.
+    """
+
+    def __init__(self):
+        if not settings.QUERY_CAPTURE_ENABLED:
+            raise MiddlewareNotUsed
+
+    def process_request(self, request):
+        request.captures_timing = getattr(request, 'timing', None) is None
+        if request.captures_timing:
+            instrument_connections()
+            request.timing = start_timing()
+        if random.random() < settings.QUERY_CAPTURE_SAMPLE_RATE:
+            request.timing.statements = []
+
+    def process_response(self, request, response):
+        timing = getattr(request, 'timing', None)
+        if timing is None:
+            return response
+        if getattr(request, 'captures_timing', False):
+            clear_timing()
+
+        route = get_route(request)
+        if timing.statements:
+            get_query_stats().add(timing.statements, route)
+        seconds = timer() - timing.started
+        if timing.queries > settings.QUERY_CAPTURE_MAX_QUERIES or seconds > settings.QUERY_CAPTURE_MAX_SECONDS:
+            self.log(request, route, timing, seconds)
+        return response
+
+    def log(self, request, route, timing, seconds):
+        statements = ''
+        if timing.statements:
+            groups = sorted(group_statements(timing.statements).items(),
+                            key=lambda item: item[1][0], reverse=True)
+            statements = '; most run: ' + '; '.join(
+                '%dx %.1f ms %s' % (calls, total * 1000, sql[:200])
+                for sql, (calls, total, slowest) in groups[:LOGGED_STATEMENTS]
+            )
+        logger.warning(
+            '%s %s (%s) ran %d queries, %.1f ms in the database and %.1f ms in total%s',
+            request.method, request.get_full_path(), route, timing.queries,
+            timing.durations['db'] * 1000, seconds * 1000, statements
+        )
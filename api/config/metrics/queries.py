@@ -0,0 +1,216 @@
+from __future__ import unicode_literals
+
+import hashlib
+import itertools
+import json
+import os
+import re
+import time
+
+from django.conf import settings
+
+from config.metrics.store import ProcessStore, is_alive
+
+
+# Literals and lists of parameters, replaced so that statements differing
+# only by them share a fingerprint.
+NORMALIZE_RES = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'%s'), '?'),
+    (re.compile(r'\((?:\s*\?\s*,)*\s*\?\s*\)'), '(...)'),
+    (re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+'), '(...)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+QUERIES_FILE_RE = re.compile(r'^queries-(\d+)\.json$')
+
+# What top() can order the statements by, and the index of its field.
+ORDERS = {'seconds': 1, 'calls': 0, 'max': 2, 'per_request': 3}
+
+# Routes kept for each fingerprint.
+MAX_ROUTES = 5
+
+# Normalized statements, keyed by their SQL, which Django repeats.
+_normalized = {}
+MAX_NORMALIZED = 2048
+
+_stats = None
+
+
+def normalize(sql):
+    try:
+        return _normalized[sql]
+    except KeyError:
+        pass
+    normalized = sql
+    for pattern, replacement in NORMALIZE_RES:
+        normalized = pattern.sub(replacement, normalized)
+    normalized = normalized.strip()
+    if len(_normalized) >= MAX_NORMALIZED:
+        _normalized.clear()
+    _normalized[sql] = normalized
+    return normalized
+
+
+def fingerprint(normalized):
+    return hashlib.md5(normalized.encode('utf-8')).hexdigest()[:12]
+
+
+def group_statements(statements):
+    """
+    Returns the calls, seconds and slowest call of each normalized statement
+    of a request, from its (sql, seconds) pairs.
+    """
+    groups = {}
+    for sql, seconds in statements:
+        normalized = normalize(sql)
+        group = groups.get(normalized)
+        if group is None:
+            groups[normalized] = [1, seconds, seconds]
+        else:
+            group[0] += 1
+            group[1] += seconds
+            group[2] = max(group[2], seconds)
+    return groups
+
+
+def merge_entry(entries, key, entry):
+    # calls, seconds, slowest call, most calls in a request, SQL, routes
+    existing = entries.get(key)
+    if existing is None:
+        entries[key] = entry[:5] + [list(entry[5])]
+        return
+    existing[0] += entry[0]
+    existing[1] += entry[1]
+    existing[2] = max(existing[2], entry[2])
+    existing[3] = max(existing[3], entry[3])
+    for route in entry[5]:
+        if route not in existing[5] and len(existing[5]) < MAX_ROUTES:
+            existing[5].append(route)
+
+
+class QueryStats(ProcessStore):
+    """
+    The statements run by the sampled requests of this process, by
+    fingerprint, over the last one to two windows of `window` seconds.
+
+    At most max_fingerprints are kept in a window: when a new one comes, the
+    one with the least total time goes.
+    """
+    filename = 'queries-%d.json'
+
+    def __init__(self, directory=None, pid=None, window=600, max_fingerprints=1000):
+        super(QueryStats, self).__init__(directory, pid)
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+        self.current = {}
+        self.previous = {}
+        self.rotated_at = time.time()
+
+    def rotate(self):
+        now = time.time()
+        if now - self.rotated_at < self.window:
+            return
+        self.previous = self.current if now - self.rotated_at < 2 * self.window else {}
+        self.current = {}
+        self.rotated_at = now
+
+    def add(self, statements, route):
+        """
+        Adds the (sql, seconds) pairs of a request to route.
+        """
+        groups = [
+            (fingerprint(normalized), normalized, group)
+            for normalized, group in group_statements(statements).items()
+        ]
+        with self.lock:
+            self.rotate()
+            for key, normalized, (calls, seconds, slowest) in groups:
+                if key not in self.current and len(self.current) >= self.max_fingerprints:
+                    del self.current[min(self.current, key=lambda other: self.current[other][1])]
+                merge_entry(self.current, key, [calls, seconds, slowest, calls, normalized, [route]])
+            self.changed()
+
+    def snapshot(self):
+        return {
+            'rotated_at': self.rotated_at,
+            'generations': [
+                {key: entry[:5] + [list(entry[5])] for key, entry in generation.items()}
+                for generation in (self.current, self.previous)
+            ],
+        }
+
+    def collect(self):
+        """
+        Returns the entries of all the processes sharing the directory, by
+        fingerprint.
+        """
+        with self.lock:
+            self.rotate()
+            generations = [self.snapshot()['generations']]
+        if self.directory is not None:
+            generations.extend(self.read_generations())
+
+        entries = {}
+        for generation in itertools.chain.from_iterable(generations):
+            for key, entry in generation.items():
+                merge_entry(entries, key, entry)
+        return entries
+
+    def read_generations(self):
+        """
+        Yields the generations of the other processes which are still in
+        the window, and removes the files of exited ones which are not.
+        """
+        for name in os.listdir(self.directory):
+            match = QUERIES_FILE_RE.match(name)
+            if match is None or int(match.group(1)) == self.pid:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path) as f:
+                    snapshot = json.load(f)
+            except (IOError, OSError, ValueError):
+                continue
+            # As rotate() would, had the process served a request since.
+            age = time.time() - snapshot['rotated_at']
+            if age < self.window:
+                yield snapshot['generations']
+            elif age < 2 * self.window:
+                yield snapshot['generations'][:1]
+            elif not is_alive(int(match.group(1))):
+                os.remove(path)
+
+    def top(self, n, order='seconds'):
+        """
+        Returns the n statements with the most total time, calls, slowest
+        call or calls in a request, as dicts.
+        """
+        index = ORDERS[order]
+        entries = sorted(self.collect().items(), key=lambda item: item[1][index], reverse=True)
+        return [
+            {
+                'fingerprint': key,
+                'sql': sql,
+                'calls': calls,
+                'total_ms': round(seconds * 1000, 3),
+                'mean_ms': round(seconds * 1000 / calls, 3),
+                'max_ms': round(slowest * 1000, 3),
+                'max_per_request': per_request,
+                'routes': routes,
+            }
+            for key, (calls, seconds, slowest, per_request, sql, routes) in entries[:n]
+        ]
+
+
+def get_query_stats():
+    """
+    Returns the query stats of this process, in the METRICS_DIR directory.
+    """
+    global _stats
+    directory = settings.METRICS_DIR
+    if _stats is None or _stats.pid != os.getpid() or _stats.directory != directory:
+        _stats = QueryStats(directory, window=settings.QUERY_CAPTURE_WINDOW,
+                            max_fingerprints=settings.QUERY_CAPTURE_MAX_FINGERPRINTS)
+    return _stats
@@ -0,0 +1,211 @@
+from __future__ import unicode_literals
+
+import errno
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Seconds between the writes of the samples of a process to its file, by a
+# background thread.
+FLUSH_INTERVAL = 1.0
+
+# The totals kept for each route, method and status, followed by the counts
+# of each bucket and of the requests slower than the last one.
+FIELDS = ('count', 'seconds', 'db_seconds', 'queries', 'serialize_seconds', 'render_seconds')
+
+ARCHIVE = 'archive.json'
+
+_store = None
+
+
+def add_samples(samples, other):
+    for key, values in other.items():
+        if key in samples:
+            samples[key] = [a + b for a, b in zip(samples[key], values)]
+        else:
+            samples[key] = list(values)
+    return samples
+
+
+def read_samples(path):
+    try:
+        with open(path) as f:
+            return {tuple(key): values for key, values in json.load(f)}
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def write_json(path, data):
+    # Readers see either the previous file or the whole new one.
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f)
+    os.rename(temp_path, path)
+
+
+def write_samples(path, samples):
+    write_json(path, [[list(key), values] for key, values in samples.items()])
+
+
+def is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+class ProcessStore(object):
+    """
+    Data of this process which, with a directory shared by the worker
+    processes of a server, a background thread writes to a file of the
+    process every FLUSH_INTERVAL seconds after it changes.
+
+    Subclasses call changed() with the lock held after changing the data,
+    and return it, JSON serializable, from snapshot().
+    """
+    filename = '%d.json'
+
+    def __init__(self, directory=None, pid=None, flush_interval=FLUSH_INTERVAL):
+        self.directory = directory
+        self.pid = pid or os.getpid()
+        self.flush_interval = flush_interval
+        self.dirty = False
+        self.flusher = None
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, self.filename % self.pid)
+
+    def changed(self):
+        self.dirty = True
+        if self.flusher is None and self.directory is not None:
+            # Started in the process which serves requests, after any fork.
+            self.flusher = threading.Thread(target=self.run_flusher, name='metrics-flusher')
+            self.flusher.daemon = True
+            self.flusher.start()
+
+    def run_flusher(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except (IOError, OSError):
+                # The directory was removed as the server shuts down.
+                pass
+
+    def snapshot(self):
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        Writes the data, if it changed since the last flush, to the file of
+        the process.
+        """
+        if self.directory is None:
+            return
+        with self.flush_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                data = self.snapshot()
+                self.dirty = False
+            write_json(self.path, data)
+
+
+class MetricsStore(ProcessStore):
+    """
+    The latency histograms and phase totals of the requests served by this
+    process, keyed by (route, method, status).
+
+    collect() adds up the files of all the processes sharing the directory.
+    The files of processes which exited, e.g. workers replaced after
+    max_requests, are merged into an archive so that the counters never go
+    back.
+    """
+
+    def __init__(self, directory=None, pid=None, buckets=BUCKETS, flush_interval=FLUSH_INTERVAL):
+        super(MetricsStore, self).__init__(directory, pid, flush_interval)
+        self.buckets = buckets
+        self.samples = {}
+
+    def observe(self, key, timing):
+        """
+        Adds a stopped RequestTiming to the samples of key.
+        """
+        bucket = len(FIELDS) + bisect_left(self.buckets, timing.total)
+        with self.lock:
+            values = self.samples.get(key)
+            if values is None:
+                values = self.samples[key] = [0] * (len(FIELDS) + len(self.buckets) + 1)
+            values[0] += 1
+            values[1] += timing.total
+            values[2] += timing.durations['db']
+            values[3] += timing.queries
+            values[4] += timing.durations['serialize']
+            values[5] += timing.durations['render']
+            values[bucket] += 1
+            self.changed()
+
+    def snapshot(self):
+        return [[list(key), list(values)] for key, values in self.samples.items()]
+
+    def collect(self):
+        """
+        Returns the samples of all the processes sharing the directory.
+        """
+        if self.directory is None:
+            with self.lock:
+                return {key: list(values) for key, values in self.samples.items()}
+
+        self.flush()
+        lock_file = open(os.path.join(self.directory, 'lock'), 'a')
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            archive = read_samples(os.path.join(self.directory, ARCHIVE))
+            samples = dict(archive)
+            dead = []
+            for name in os.listdir(self.directory):
+                pid, ext = os.path.splitext(name)
+                if ext != '.json' or not pid.isdigit():
+                    continue
+                process_samples = read_samples(os.path.join(self.directory, name))
+                add_samples(samples, process_samples)
+                if fcntl is not None and int(pid) != self.pid and not is_alive(int(pid)):
+                    add_samples(archive, process_samples)
+                    dead.append(name)
+            if dead:
+                write_samples(os.path.join(self.directory, ARCHIVE), archive)
+                for name in dead:
+                    os.remove(os.path.join(self.directory, name))
+            return samples
+        finally:
+            lock_file.close()
+
+
+def get_store():
+    """
+    Returns the store of this process, in the METRICS_DIR directory.
+    """
+    global _store
+    directory = settings.METRICS_DIR
+    if _store is None or _store.pid != os.getpid() or _store.directory != directory:
+        _store = MetricsStore(directory)
+    return _store
@@ -0,0 +1,141 @@
+from __future__ import unicode_literals
+
+import threading
+from contextlib import contextmanager
+from timeit import default_timer as timer
+
+from django.db import connections
+
+
+_local = threading.local()
+
+
+class RequestTiming(object):
+    """
+    The seconds a request spends in each phase, and the queries it runs.
+
+    Phases do not overlap: queries run while serializing count toward the
+    database, not the serialization. When statements is a list, the SQL and
+    seconds of each query are appended to it.
+    """
+    phases = ('db', 'serialize', 'render')
+
+    def __init__(self):
+        self.started = timer()
+        self.total = None
+        self.durations = dict.fromkeys(self.phases, 0.0)
+        self.queries = 0
+        self.statements = None
+        self.running = set()
+
+    def add(self, phase, seconds):
+        self.durations[phase] += seconds
+
+    def stop(self):
+        self.total = timer() - self.started
+
+    def header(self):
+        """
+        Returns the value of the Server-Timing header, in milliseconds.
+        """
+        return 'db;desc="%d %s";dur=%.3f, serialize;dur=%.3f, render;dur=%.3f, total;dur=%.3f' % (
+            self.queries, 'query' if self.queries == 1 else 'queries', self.durations['db'] * 1000,
+            self.durations['serialize'] * 1000, self.durations['render'] * 1000, self.total * 1000
+        )
+
+
+def start_timing():
+    _local.timing = RequestTiming()
+    return _local.timing
+
+
+def current_timing():
+    return getattr(_local, 'timing', None)
+
+
+def clear_timing():
+    _local.timing = None
+
+
+@contextmanager
+def timed(phase):
+    """
+    Counts the time of the block toward a phase of the current request, less
+    the time of the queries it runs. Nested blocks of the same phase count
+    once.
+    """
+    timing = getattr(_local, 'timing', None)
+    if timing is None or phase in timing.running:
+        yield
+        return
+    timing.running.add(phase)
+    db, start = timing.durations['db'], timer()
+    try:
+        yield
+    finally:
+        timing.running.discard(phase)
+        timing.add(phase, timer() - start - (timing.durations['db'] - db))
+
+
+class TimedCursor(object):
+    """
+    Wraps a cursor of a connection to count its queries and their time
+    toward the current request.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __getattr__(self, attr):
+        return getattr(self.cursor, attr)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        return self.cursor.__exit__(type, value, traceback)
+
+    def execute(self, sql, params=None):
+        start = timer()
+        try:
+            return self.cursor.execute(sql, params)
+        finally:
+            record_query(sql, timer() - start)
+
+    def executemany(self, sql, param_list):
+        start = timer()
+        try:
+            return self.cursor.executemany(sql, param_list)
+        finally:
+            record_query(sql, timer() - start)
+
+
+def record_query(sql, seconds):
+    timing = getattr(_local, 'timing', None)
+    if timing is not None:
+        timing.durations['db'] += seconds
+        timing.queries += 1
+        if timing.statements is not None:
+            timing.statements.append((sql, seconds))
+
+
+def instrument(connection):
+    """
+    Makes the cursors of a connection, with or without the query log, count
+    toward the current request.
+    """
+    if getattr(connection, 'timing_instrumented', False):
+        return
+    make_cursor, make_debug_cursor = connection.make_cursor, connection.make_debug_cursor
+    connection.make_cursor = lambda cursor: TimedCursor(make_cursor(cursor))
+    connection.make_debug_cursor = lambda cursor: TimedCursor(make_debug_cursor(cursor))
+    connection.timing_instrumented = True
+
+
+def instrument_connections():
+    # Connections are per thread, so new threads get new ones.
+    for connection in connections.all():
+        instrument(connection)
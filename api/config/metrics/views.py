@@ -0,0 +1,100 @@
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import Http404, HttpResponse, HttpResponseForbidden, JsonResponse
+from django.utils.crypto import constant_time_compare
+
+from config.metrics.queries import ORDERS, get_query_stats
+from config.metrics.store import FIELDS, get_store
+
+
+# Name, type, help and field of each metric besides the latency histogram.
+COUNTERS = (
+    ('http_request_db_seconds_total', 'Seconds spent in database queries.', 'db_seconds'),
+    ('http_request_db_queries_total', 'Database queries run.', 'queries'),
+    ('http_request_serialize_seconds_total', 'Seconds spent serializing data.', 'serialize_seconds'),
+    ('http_request_render_seconds_total', 'Seconds spent rendering responses.', 'render_seconds'),
+)
+
+
+def escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else '%d' % value
+
+
+def format_metrics(samples, buckets):
+    """
+    Returns samples in the Prometheus text exposition format.
+    """
+    series = sorted(
+        ('route="%s",method="%s",status="%s"' % tuple(escape(label) for label in key), values)
+        for key, values in samples.items()
+    )
+    lines = [
+        '# HELP http_request_duration_seconds Seconds taken to handle requests.',
+        '# TYPE http_request_duration_seconds histogram',
+    ]
+    for labels, values in series:
+        cumulative = 0
+        for bound, count in zip(buckets + ('+Inf',), values[len(FIELDS):]):
+            cumulative += count
+            lines.append('http_request_duration_seconds_bucket{%s,le="%s"} %d' % (labels, bound, cumulative))
+        lines.append('http_request_duration_seconds_sum{%s} %s' % (labels, format_value(values[1])))
+        lines.append('http_request_duration_seconds_count{%s} %d' % (labels, values[0]))
+    for name, help_text, field in COUNTERS:
+        lines.append('# HELP %s %s' % (name, help_text))
+        lines.append('# TYPE %s counter' % name)
+        index = FIELDS.index(field)
+        for labels, values in series:
+            lines.append('%s{%s} %s' % (name, labels, format_value(values[index])))
+    return '\n'.join(lines) + '\n'
+
+
+def has_access(request):
+    token = settings.METRICS_TOKEN
+    if token and constant_time_compare(request.META.get('HTTP_AUTHORIZATION', ''), 'Bearer ' + token):
+        return True
+    user = getattr(request, 'user', None)
+    return user is not None and user.is_staff
+
+
+def metrics_view(request):
+    """
+    Returns the request metrics of all the workers, to Prometheus with the
+    METRICS_TOKEN as a bearer token or to staff users.
+    """
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    if not has_access(request):
+        return HttpResponseForbidden()
+
+    store = get_store()
+    return HttpResponse(format_metrics(store.collect(), store.buckets),
+                        content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@staff_member_required
+def slow_queries_view(request):
+    """
+    Returns the `n` statements (20 by default) of the sampled requests of
+    all the workers with the most total time, or by `order`: calls, max
+    (the slowest call) or per_request (the most calls in a request).
+    """
+    order = request.GET.get('order', 'seconds')
+    try:
+        n = int(request.GET.get('n', 20))
+    except ValueError:
+        return JsonResponse({'n': 'Incorrect format'}, status=400)
+    if order not in ORDERS:
+        return JsonResponse({'order': 'Incorrect format'}, status=400)
+
+    return JsonResponse({
+        'enabled': settings.QUERY_CAPTURE_ENABLED,
+        'sample_rate': settings.QUERY_CAPTURE_SAMPLE_RATE,
+        'window': settings.QUERY_CAPTURE_WINDOW,
+        'statements': get_query_stats().top(max(n, 0), order),
+    })
@@ -0,0 +1,104 @@
+from __future__ import unicode_literals
+
+import re
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.module_loading import import_string
+
+
+class MiddlewareChain(object):
+    """
+    The hooks of a list of middleware classes, in the order in which Django's
+    handler calls them.
+    """
+
+    def __init__(self, middleware_classes):
+        self.request = []
+        self.view = []
+        self.template_response = []
+        self.response = []
+        self.exception = []
+
+        for middleware_path in middleware_classes:
+            try:
+                middleware = import_string(middleware_path)()
+            except MiddlewareNotUsed:
+                continue
+            if hasattr(middleware, 'process_request'):
+                self.request.append(middleware.process_request)
+            if hasattr(middleware, 'process_view'):
+                self.view.append(middleware.process_view)
+            if hasattr(middleware, 'process_template_response'):
+                self.template_response.insert(0, middleware.process_template_response)
+            if hasattr(middleware, 'process_response'):
+                self.response.insert(0, middleware.process_response)
+            if hasattr(middleware, 'process_exception'):
+                self.exception.insert(0, middleware.process_exception)
+
+
+class MiddlewareProfiles(object):
+    """
+    Runs one of the middleware chains of MIDDLEWARE_PROFILES for each
+    request, so that stateless API requests skip the sessions, CSRF and
+    authentication middleware which only browsers use.
+
+    The chain is the profile of the first pattern of MIDDLEWARE_PROFILE_ROUTES
+    matching the path of the request, or 'default'. Requests that accept
+    HTML, as browsers viewing the browsable API do, always get 'default'.
+    The name of the profile is set as request.middleware_profile.
+    """
+
+    def __init__(self):
+        self.chains = {
+            name: MiddlewareChain(middleware_classes)
+            for name, middleware_classes in settings.MIDDLEWARE_PROFILES.items()
+        }
+        self.routes = [
+            (re.compile(pattern), name) for pattern, name in settings.MIDDLEWARE_PROFILE_ROUTES
+        ]
+
+    def get_profile(self, request):
+        for pattern, name in self.routes:
+            if pattern.match(request.path_info):
+                break
+        else:
+            return 'default'
+        if 'text/html' in request.META.get('HTTP_ACCEPT', '') or request.GET.get('format') == 'api':
+            return 'default'
+        return name
+
+    def get_chain(self, request):
+        # Also called for responses to requests that never reached
+        # process_request(), e.g. when it raised.
+        if not hasattr(request, 'middleware_profile'):
+            request.middleware_profile = self.get_profile(request)
+        return self.chains[request.middleware_profile]
+
+    def process_request(self, request):
+        for process_request in self.get_chain(request).request:
+            response = process_request(request)
+            if response is not None:
+                return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        for process_view in self.get_chain(request).view:
+            response = process_view(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+
+    def process_template_response(self, request, response):
+        for process_template_response in self.get_chain(request).template_response:
+            response = process_template_response(request, response)
+        return response
+
+    def process_response(self, request, response):
+        for process_response in self.get_chain(request).response:
+            response = process_response(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        for process_exception in self.get_chain(request).exception:
+            response = process_exception(request, exception)
+            if response is not None:
+                return response
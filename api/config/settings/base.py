@@ -48,21 +48,144 @@ DATABASES = {}
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny'
-    ]
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'api_books.pagination.KeysetCursorPagination',
+    'DEFAULT_RENDERER_CLASSES': [
+        'api_books.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api_books.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'PAGE_SIZE': 100
 }
 
+# Cache
+# https://docs.djangoproject.com/en/1.8/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Responses of the list and retrieve endpoints, evicted on every write
+    'api': {
+        'BACKEND': 'api_books.cache.LRUCache',
+        'LOCATION': 'api',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+
+API_CACHE = 'api'
+
+# Let Swagger UI and other browser clients make conditional requests
+CORS_ALLOW_HEADERS = (
+    'x-requested-with',
+    'content-type',
+    'accept',
+    'origin',
+    'authorization',
+    'x-csrftoken',
+    'user-agent',
+    'accept-encoding',
+    'if-match',
+    'if-modified-since',
+    'if-none-match',
+)
+
+CORS_EXPOSE_HEADERS = (
+    'etag',
+    'last-modified',
+    'server-timing',
+)
+
 MIDDLEWARE_CLASSES = (
-    'django.contrib.sessions.middleware.SessionMiddleware',
-    'corsheaders.middleware.CorsMiddleware',
-    'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'django.middleware.security.SecurityMiddleware',
+    'config.metrics.middleware.MetricsMiddleware',
+    'config.metrics.middleware.QueryCaptureMiddleware',
+    'config.middleware.MiddlewareProfiles',
+)
+
+# The middleware chains config.middleware.MiddlewareProfiles picks from.
+MIDDLEWARE_PROFILES = {
+    'default': (
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'corsheaders.middleware.CorsMiddleware',
+        'django.middleware.common.CommonMiddleware',
+        'django.middleware.csrf.CsrfViewMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+        'django.middleware.security.SecurityMiddleware',
+    ),
+    # Stateless JSON requests: no sessions, CSRF, users, messages or frames.
+    'api': (
+        'corsheaders.middleware.CorsMiddleware',
+        'django.middleware.security.SecurityMiddleware',
+    ),
+}
+
+# (path pattern, profile) pairs; the first match picks the profile, except
+# for requests accepting HTML, which always get the default one.
+MIDDLEWARE_PROFILE_ROUTES = (
+    (r'^/api/v1/(?!docs/)', 'api'),
 )
 
+# Request metrics (config.metrics): timing of every request, a Server-Timing
+# header on the responses and latency histograms per route at /metrics.
+METRICS_ENABLED = True
+
+SERVER_TIMING = True
+
+# Directory the processes of a server share their metrics in; unset, each
+# process serves its own.
+METRICS_DIR = os.environ.get('METRICS_DIR')
+
+# Bearer token for Prometheus to scrape /metrics with; staff users can
+# always view it.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+# Query capture (config.metrics.middleware.QueryCaptureMiddleware): requests
+# running more queries or taking longer than these are logged, and the
+# statements of a sample of the requests are ranked at /admin/slow-queries/.
+QUERY_CAPTURE_ENABLED = False
+
+QUERY_CAPTURE_SAMPLE_RATE = 1.0
+
+QUERY_CAPTURE_MAX_QUERIES = 50
+
+QUERY_CAPTURE_MAX_SECONDS = 1.0
+
+# The ranking covers the last one to two windows of this many seconds, of
+# at most QUERY_CAPTURE_MAX_FINGERPRINTS distinct statements each.
+QUERY_CAPTURE_WINDOW = 600
+
+QUERY_CAPTURE_MAX_FINGERPRINTS = 1000
+
+# Background jobs, such as deleting authors with `?async=true`, run on a
+# thread of their own; set this to run them in the request instead.
+BACKGROUND_JOBS_EAGER = False
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'config.metrics': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -6,9 +6,11 @@ DEBUG = True
 
 ALLOWED_HOSTS = ['*']
 
+# Transactions of concurrent requests wait for each other's writes, see
+# config.db.backends.sqlite3.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'config.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
     }
 }
@@ -19,3 +21,6 @@ CORS_ORIGIN_WHITELIST = (
 )
 
 WSGI_APPLICATION = 'config.wsgi.application'
+
+# Log requests with many queries and rank the statements of all of them
+QUERY_CAPTURE_ENABLED = True
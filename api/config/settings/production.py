@@ -2,7 +2,57 @@ from .base import *
 import dj_database_url
 
 
-DATABASES['default'] = dj_database_url.config()
+# Keep connections open between requests, checking them before reuse.
+DATABASES['default'] = dj_database_url.config(
+    conn_max_age=int(os.environ.get('DB_CONN_MAX_AGE', 600))
+)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# The backends of config.db implement the health checks and the pool.
+MANAGED_ENGINES = {
+    'django.db.backends.postgresql_psycopg2': 'config.db.backends.postgresql',
+    'django.db.backends.sqlite3': 'config.db.backends.sqlite3',
+}
+if DATABASES['default'].get('ENGINE') in MANAGED_ENGINES:
+    DATABASES['default']['ENGINE'] = MANAGED_ENGINES[DATABASES['default']['ENGINE']]
+
+# With threaded workers, DB_POOL_MAX_SIZE caps the connections of each
+# worker: threads take one from the pool for each request and put it back
+# at the end, waiting up to DB_POOL_TIMEOUT seconds when all are in use.
+if os.environ.get('DB_POOL_MAX_SIZE'):
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['POOL'] = {
+        'MAX_SIZE': int(os.environ['DB_POOL_MAX_SIZE']),
+        'TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+    }
+
+# Share the response cache between dynos, e.g. with
+# API_CACHE_LOCATION=127.0.0.1:11211 for memcached or
+# API_CACHE_BACKEND=django_redis.cache.RedisCache and
+# API_CACHE_LOCATION=redis://127.0.0.1:6379/1 for Redis.
+if os.environ.get('API_CACHE_LOCATION'):
+    CACHES['api'] = {
+        'BACKEND': os.environ.get('API_CACHE_BACKEND',
+                                  'django.core.cache.backends.memcached.MemcachedCache'),
+        'LOCATION': os.environ['API_CACHE_LOCATION'],
+        'TIMEOUT': 300,
+    }
+# Writes only evict the in-process cache of the worker that serves them, so
+# other workers would serve stale responses until they expire. Keep it for a
+# single worker, whose threads share it, and otherwise cache nothing.
+elif os.environ.get('WEB_CONCURRENCY') != '1':
+    CACHES['api'] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+
+# Set SERVER_TIMING=0 not to tell clients where the time of requests goes.
+SERVER_TIMING = os.environ.get('SERVER_TIMING', '1') != '0'
+
+# Set QUERY_CAPTURE=1 to log requests with many or slow queries and rank the
+# statements of QUERY_CAPTURE_SAMPLE_RATE of the requests (5% by default).
+QUERY_CAPTURE_ENABLED = os.environ.get('QUERY_CAPTURE', '0') != '0'
+QUERY_CAPTURE_SAMPLE_RATE = float(os.environ.get('QUERY_CAPTURE_SAMPLE_RATE', 0.05))
 
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
@@ -14,3 +64,7 @@ DEBUG = False
 CORS_ORIGIN_ALLOW_ALL = True
 
 WSGI_APPLICATION = 'config.wsgi_heroku.application'
+
+# collectstatic adds content hashes to the static file names and writes gzip
+# and brotli copies, which WhiteNoise serves with immutable caching.
+STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
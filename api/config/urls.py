@@ -16,7 +16,13 @@ Including another URLconf
 from django.conf.urls import include, url
 from django.contrib import admin
 
+from config.db.views import pool_stats_view
+from config.metrics.views import metrics_view, slow_queries_view
+
 urlpatterns = [
+    url(r'^admin/db-pool/$', pool_stats_view, name='db-pool-stats'),
+    url(r'^admin/slow-queries/$', slow_queries_view, name='slow-queries'),
     url(r'^admin/', include(admin.site.urls)),
-    url(r'^api/v1/', include('api_books.urls'))
+    url(r'^api/v1/', include('api_books.urls')),
+    url(r'^metrics$', metrics_view, name='metrics')
 ]
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api.config.local")
 
 application = get_wsgi_application()
+
+# Render the API docs once at startup instead of on each worker's first hit.
+from api_books.views import render_index, render_openapi_spec
+
+render_openapi_spec()
+render_index()
@@ -16,3 +16,9 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api.config.production")
 
 application = get_wsgi_application()
 application = DjangoWhiteNoise(application)
+
+# Render the API docs once at startup instead of on each worker's first hit.
+from api_books.views import render_index, render_openapi_spec
+
+render_openapi_spec()
+render_index()